@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+'''
+Compares the paths used by ``DateTimeField`` to parse strings:
+``dateutil``, the strict ISO-8601 parser, a ``strptime`` format and the shared LRU cache.
+'''
+
+import sys
+import os
+import datetime
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dateutil.parser  # noqa E402
+from tbone.data.fields import DateTimeField  # noqa E402
+
+COUNT = 10000
+NUMBER = 5
+
+start = datetime.datetime(2017, 7, 25)
+UNIQUE = [(start + datetime.timedelta(minutes=i)).isoformat() for i in range(COUNT)]
+REPEATED = [UNIQUE[i % 100] for i in range(COUNT)]
+
+
+def measure(parse, values):
+    return timeit.timeit(lambda: [parse(value) for value in values], number=NUMBER) / (NUMBER * len(values)) * 1e6
+
+
+def main():
+    paths = [
+        ('dateutil', dateutil.parser.parse),
+        ('iso-8601', DateTimeField()._import),
+        ('format', DateTimeField(format='%Y-%m-%dT%H:%M:%S')._import),
+        ('iso-8601 + cache', DateTimeField(cache=True)._import),
+    ]
+    print('Parsing {} datetime strings, microseconds per value'.format(COUNT))
+    print('{:<20} {:>10} {:>10}'.format('path', 'unique', 'repeated'))
+    for name, parse in paths:
+        print('{:<20} {:>10.2f} {:>10.2f}'.format(name, measure(parse, UNIQUE), measure(parse, REPEATED)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+'''
+Measures startup cost. Generates a synthetic module with 500 models, declared in inheritance chains,
+and a resource for every model, and measures the time it takes to import it in a fresh interpreter,
+once its bytecode is cached.
+Then prints the ``python -X importtime`` report of TBone's own packages.
+'''
+
+import sys
+import os
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODELS = 500
+DEPTH = 5  # length of every inheritance chain
+FIELDS = 8  # fields declared by every model
+REPEAT = 5
+
+FIELD_TYPES = (
+    'StringField(required=True)',
+    'IntegerField(min=0)',
+    'FloatField()',
+    'BooleanField(default=False)',
+    "StringField(choices=['a', 'b', 'c'])",
+    'DateTimeField()',
+    'ListField(StringField)',
+    'EmailField()',
+)
+
+
+def generate_module(path):
+    lines = [
+        'from tbone.data.fields import *',
+        'from tbone.data.models import Model',
+        'from tbone.resources import Resource',
+        '',
+    ]
+    for i in range(MODELS):
+        base = 'Model' if i % DEPTH == 0 else 'Model{}'.format(i - 1)
+        lines.append('class Model{}({}):'.format(i, base))
+        for j in range(FIELDS):
+            lines.append('    field_{}_{} = {}'.format(i, j, FIELD_TYPES[(i + j) % len(FIELD_TYPES)]))
+        lines.append('')
+        lines.append('    @serialize')
+        lines.append('    async def summary_{}(self):'.format(i))
+        lines.append('        return None')
+        lines.append('')
+        lines.append('class Resource{}(Resource):'.format(i))
+        lines.append('    class Meta:')
+        lines.append('        object_class = Model{}'.format(i))
+        lines.append('        hypermedia = {}'.format(i % 2 == 0))
+        lines.append('')
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+def run(code, *args, cwd=None):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [cwd, ROOT, env.get('PYTHONPATH')]))
+    return subprocess.run([sys.executable] + list(args) + ['-c', code], env=env, cwd=cwd,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+
+def measure_synthetic_module():
+    with tempfile.TemporaryDirectory() as directory:
+        generate_module(os.path.join(directory, 'synthetic_models.py'))
+        code = (
+            'import time, tbone.data, tbone.resources\n'
+            'start = time.perf_counter()\n'
+            'import synthetic_models\n'
+            'print(time.perf_counter() - start)\n'
+        )
+        timings = []
+        for i in range(REPEAT):
+            result = run(code, cwd=directory)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr)
+            timings.append(float(result.stdout))
+    return min(timings)
+
+
+def importtime_report(module):
+    ''' Returns the ``-X importtime`` entries of TBone's packages, as (cumulative microseconds, module name) '''
+    result = run('import {}'.format(module), '-X', 'importtime')
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        try:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            entries.append((int(cumulative), name.strip()))
+        except ValueError:
+            continue  # header line
+    return entries
+
+
+def main():
+    seconds = measure_synthetic_module()
+    print('Creating {} models and resources, in chains of {}: {:.3f}s'.format(MODELS, DEPTH, seconds))
+    for module in ('tbone.data', 'tbone.resources'):
+        entries = importtime_report(module)
+        total = next((cumulative for cumulative, name in entries if name == module), 0)
+        print('import {}: {:.1f}ms'.format(module, total / 1000))
+        for cumulative, name in sorted(entries, reverse=True)[:10]:
+            print('    {:>10.1f}ms  {}'.format(cumulative / 1000, name))
+
+
+if __name__ == '__main__':
+    main()
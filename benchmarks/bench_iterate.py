@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+'''
+Measures the peak memory of reading a large collection with ``find``, which loads the entire result set,
+and with ``iterate``, which creates models batch by batch as documents are fetched.
+Requires a MongoDB server, located by the ``DATABASE_URL`` environment variable, or running on localhost.
+The synthetic collection is created in the ``tbone_benchmarks`` database and dropped afterwards.
+'''
+
+import gc
+import sys
+import os
+import time
+import asyncio
+import datetime
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa E402
+from tbone.data.fields import *  # noqa E402
+from tbone.data.fields.mongo import ObjectIdField  # noqa E402
+from tbone.data.models import Model  # noqa E402
+from tbone.db.models import MongoCollectionMixin  # noqa E402
+
+COUNT = 100000
+INSERT_BATCH = 5000
+BATCH_SIZES = (100, 1000)
+
+
+class Order(Model, MongoCollectionMixin):
+    _id = ObjectIdField(primary_key=True)
+    customer = StringField()
+    email = StringField()
+    address = StringField()
+    total = FloatField()
+    items = IntegerField()
+    notes = StringField()
+    created = DateTimeField()
+    tags = ListField(StringField)
+
+    class Meta:
+        name = 'bench_iterate_orders'
+
+
+def fixture(start, count):
+    created = datetime.datetime(2018, 1, 1)
+    return [{
+        'customer': 'customer {}'.format(i),
+        'email': 'customer{}@example.com'.format(i),
+        'address': '{} Main Street, Springfield'.format(i),
+        'total': i * 1.5,
+        'items': i % 10 + 1,
+        'notes': 'Leave the parcel at the door ' * 4,
+        'created': created + datetime.timedelta(minutes=i),
+        'tags': ['priority', 'gift'],
+    } for i in range(start, start + count)]
+
+
+async def populate(db):
+    collection = db[Order.get_collection_name()]
+    await collection.drop()
+    for start in range(0, COUNT, INSERT_BATCH):
+        await collection.insert_many(fixture(start, INSERT_BATCH))
+
+
+async def read_with_find(db):
+    total = 0
+    for order in await Order.find(Order.get_cursor(db)):
+        total += order.items
+    return total
+
+
+async def read_with_iterate(db, batch_size):
+    total = 0
+    async for order in Order.iterate(db, batch_size=batch_size):
+        total += order.items
+    return total
+
+
+def measure(loop, coro):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    total = loop.run_until_complete(coro)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total, elapsed, peak
+
+
+def main():
+    loop = asyncio.get_event_loop()
+    client = AsyncIOMotorClient(os.environ.get('DATABASE_URL', 'mongodb://localhost:27017'))
+    db = client['tbone_benchmarks']
+    loop.run_until_complete(populate(db))
+    try:
+        print('Reading {} documents of a {} field model'.format(COUNT, len(Order._fields)))
+        print('    {:<26} {:>10} {:>14}'.format('', 'time', 'peak memory'))
+        scenarios = [('find', read_with_find, ())]
+        scenarios.extend(('iterate, batches of {}'.format(size), read_with_iterate, (size,)) for size in BATCH_SIZES)
+        expected = None
+        for title, read, args in scenarios:
+            total, elapsed, peak = measure(loop, read(db, *args))
+            assert expected in (None, total)
+            expected = total
+            print('    {:<26} {:>9.3f}s {:>11.1f} MB'.format(title, elapsed, peak / 2 ** 20))
+    finally:
+        loop.run_until_complete(db[Order.get_collection_name()].drop())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+'''
+Measures encoding a list of models to JSON, as done for list responses, using the accounts and books fixtures.
+Compares ``serialize_many`` followed by ``json.dumps`` with ``serialize_json_many``, which writes the JSON directly.
+'''
+
+import sys
+import os
+import json
+import asyncio
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_nested import account_model, book_model, load, books_fixture  # noqa E402
+from tbone.data.fields import ModelField  # noqa E402
+from tbone.utils import ExtendedJSONEncoder  # noqa E402
+
+NUMBER = 5
+
+
+def measure(model_class, fixture):
+    loop = asyncio.get_event_loop()
+    objects = model_class.from_many(fixture)
+
+    async def dumps():
+        return json.dumps(await model_class.serialize_many(objects), cls=ExtendedJSONEncoder)
+
+    async def serialize_json():
+        return await model_class.serialize_json_many(objects)
+
+    assert json.loads(loop.run_until_complete(dumps())) == \
+        json.loads(loop.run_until_complete(serialize_json()).decode('utf-8'))
+    return {
+        'json.dumps': timeit.timeit(lambda: loop.run_until_complete(dumps()), number=NUMBER) / NUMBER,
+        'serialize_json': timeit.timeit(lambda: loop.run_until_complete(serialize_json()), number=NUMBER) / NUMBER,
+    }
+
+
+def main():
+    scenarios = (
+        ('accounts', account_model(ModelField), load('accounts.json')),
+        ('books', book_model(ModelField), books_fixture()),
+    )
+    for title, model_class, fixture in scenarios:
+        results = measure(model_class, fixture)
+        print('Encoding {} {}'.format(len(fixture), title))
+        for name, seconds in results.items():
+            print('    {:<16} {:>8.3f}s'.format(name, seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+'''
+Measures the memory footprint of model instances with the default ``dict`` storage
+and with the slotted storage enabled by the ``slots`` model option.
+'''
+
+import gc
+import sys
+import os
+import datetime
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tbone.data.fields import *  # noqa E402
+from tbone.data.models import Model  # noqa E402
+
+COUNT = 50000
+
+
+class Document(Model):
+    title = StringField()
+    author = StringField()
+    isbn = StringField()
+    language = StringField()
+    format = StringField()
+    pages = IntegerField()
+    views = IntegerField(default=0)
+    impressions = IntegerField(default=0)
+    rating = FloatField()
+    available = BooleanField(default=True)
+    publication_date = DateTimeField()
+    tags = ListField(StringField)
+
+
+class SlottedDocument(Document):
+    class Meta:
+        slots = True
+
+
+DATA = {
+    'title': 'War and Peace',
+    'author': 'Leo Tolstoy',
+    'isbn': '9781602523692',
+    'language': 'en',
+    'format': 'Paperback',
+    'pages': 1225,
+    'rating': 4.5,
+    'publication_date': datetime.datetime(1869, 1, 1),
+    'tags': ['classic', 'russian'],
+}
+
+
+def measure(model_class):
+    gc.collect()
+    tracemalloc.start()
+    instances = [model_class(DATA) for i in range(COUNT)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # subtract the memory held by the list of instances itself
+    return (current - sys.getsizeof(instances)) / COUNT, instances
+
+
+def main():
+    print('Hydrating {} instances of a {} field model'.format(COUNT, len(Document._fields)))
+    results = {}
+    for model_class in (Document, SlottedDocument):
+        per_instance, instances = measure(model_class)
+        results[model_class] = per_instance
+        print('{:<20} {:>8.1f} bytes per instance'.format(model_class.__name__, per_instance))
+        del instances
+    saved = results[Document] - results[SlottedDocument]
+    print('slots saves {:.1f} bytes per instance ({:.0%})'.format(saved, saved / results[Document]))
+
+
+if __name__ == '__main__':
+    main()
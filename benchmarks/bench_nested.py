@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+'''
+Measures serialization of models with nested ``ModelField`` and ``ListField(ModelField(...))`` fields,
+using the accounts and books fixtures, and compares it with serializing nested data by creating and validating
+a new model instance, which is what ``ModelField`` did before.
+'''
+
+import sys
+import os
+import json
+import random
+import asyncio
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tbone.data.fields import *  # noqa E402
+from tbone.data.models import Model  # noqa E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'fixtures')
+COPIES = 20
+REVIEWS = 20
+NUMBER = 5
+
+
+class RevalidatingModelField(ModelField):
+    ''' Serializes nested data by creating and validating a new model instance '''
+
+    def serialize_sync(self, value, native=False):
+        instance = BaseField.to_python(self, value)
+        if instance is None:
+            return None
+        return instance.serialize_sync(native)
+
+    async def serialize(self, value, native=False):
+        instance = BaseField.to_python(self, value)
+        if instance is None:
+            return None
+        return await instance.serialize(native)
+
+
+class Profile(Model):
+    title = StringField()
+    first_name = StringField(required=True)
+    last_name = StringField(required=True)
+    suffix = StringField(projection=False)
+    avatar = StringField()
+    DOB = DateField()
+
+
+class Child(Model):
+    gender = StringField(choices=['M', 'F'])
+    first_name = StringField(required=True)
+    last_name = StringField(required=True)
+    DOB = DateField()
+
+
+class Address(Model):
+    city = StringField(required=True)
+    street_name = StringField(required=True)
+    street_number = IntegerField()
+    zipcode = StringField()
+    state = StringField()
+    country = StringField(required=True)
+
+
+class Review(Model):
+    user = StringField(required=True)
+    ratings = DictField(IntegerField)
+    text = StringField()
+
+    @serialize
+    async def total_rating(self):
+        return sum(self.ratings.values(), 0.0) / len(self.ratings.values())
+
+
+def account_model(field_class):
+    class Account(Model):
+        email = EmailField(required=True)
+        joined = DateTimeField()
+        profile = field_class(Profile, required=True)
+        gender = StringField(choices=['Male', 'Female'])
+        home_address = field_class(Address)
+        premium = BooleanField(default=False)
+        children = ListField(field_class(Child))
+        skills = ListField(StringField)
+
+    return Account
+
+
+def book_model(field_class):
+    class Book(Model):
+        isbn = StringField(primary_key=True)
+        title = StringField(required=True)
+        author = ListField(StringField)
+        format = StringField(choices=['Paperback', 'Hardcover', 'Digital', 'Audiobook'], default='Paperback')
+        publication_date = DateTimeField()
+        reviews = ListField(field_class(Review), default=[])
+
+    return Book
+
+
+def load(name):
+    with open(os.path.join(FIXTURES, name)) as f:
+        documents = json.load(f)
+    fixture = [dict(data) for i in range(COPIES) for data in documents]
+    for data in fixture:
+        data.pop('_id', None)
+    return fixture
+
+
+def books_fixture():
+    fixture = load('books.json')
+    for data in fixture:
+        data['publication_date'] = data['publication_date']['$date']
+        data['reviews'] = [{
+            'user': 'reader{}'.format(i),
+            'ratings': {'smooth_read': random.randint(1, 5), 'language': random.randint(1, 5)},
+            'text': 'Good read'
+        } for i in range(REVIEWS)]
+    return fixture
+
+
+def measure(model_factory, fixture):
+    loop = asyncio.get_event_loop()
+    results = {}
+    for name, field_class in (('revalidating', RevalidatingModelField), ('direct', ModelField)):
+        model_class = model_factory(field_class)
+        objects = model_class.from_many(fixture)
+        results[name] = timeit.timeit(
+            lambda: loop.run_until_complete(model_class.serialize_many(objects)), number=NUMBER) / NUMBER
+    return results
+
+
+def main():
+    scenarios = (
+        ('accounts', account_model, load('accounts.json')),
+        ('books with {} reviews'.format(REVIEWS), book_model, books_fixture()),
+    )
+    for title, model_factory, fixture in scenarios:
+        results = measure(model_factory, fixture)
+        print('Serializing {} {}'.format(len(fixture), title))
+        for name, seconds in results.items():
+            print('    {:<16} {:>8.3f}s'.format(name, seconds))
+        print('    direct serialization is {:.1f}x faster'.format(results['revalidating'] / results['direct']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+'''
+Measures event loop lag while deserializing a batch of models with a CPU intensive validator,
+comparing inline validation with offloading the field to a thread pool and to a process pool.
+A probe task sleeps for 1ms in a loop and records how late it wakes up, as other requests on the same worker would.
+'''
+
+import sys
+import os
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tbone.data.fields import *  # noqa E402
+from tbone.data.models import Model  # noqa E402
+
+COUNT = 200
+WORKERS = 4
+ROUNDS = 60  # rounds of the checksum, about 2ms per value
+
+
+def checksum(value):
+    ''' A Luhn checksum computed repeatedly, standing in for expensive parsing or signature checks '''
+    digits = [int(digit) for digit in value]
+    for i in range(ROUNDS):
+        total = 0
+        for index, digit in enumerate(reversed(digits)):
+            if index % 2 == 1:
+                digit *= 2
+                if digit > 9:
+                    digit -= 9
+            total += digit
+    if total % 10 != 0:
+        raise ValueError('Invalid checksum')
+
+
+def card_model(executor):
+    class Card(Model):
+        number = StringField(validators=[checksum], offload=True)
+        holder = StringField()
+
+        class Meta:
+            validation_executor = executor
+
+    # process pools pickle the model class by reference
+    Card.__qualname__ = Card.__name__ = 'Card{}'.format(id(Card))
+    globals()[Card.__name__] = Card
+    return Card
+
+
+def fixture():
+    number = '79927398713' * 10  # a valid Luhn number of 110 digits
+    return [{'number': number, 'holder': 'holder {}'.format(i)} for i in range(COUNT)]
+
+
+async def probe(lags, done):
+    loop = asyncio.get_event_loop()
+    while not done.is_set():
+        start = loop.time()
+        await asyncio.sleep(0.001)
+        lags.append(loop.time() - start - 0.001)
+
+
+async def deserialize_all(model_class, data_list):
+    async def deserialize(data):
+        obj = model_class()
+        await obj.deserialize(data)
+        return obj
+
+    return await asyncio.gather(*[deserialize(data) for data in data_list])
+
+
+def measure(model_class):
+    loop = asyncio.get_event_loop()
+    data_list = fixture()
+    loop.run_until_complete(deserialize_all(model_class, data_list[:WORKERS]))  # warm up the executor
+    lags = []
+    done = asyncio.Event()
+    probing = loop.create_task(probe(lags, done))
+    start = time.perf_counter()
+    loop.run_until_complete(deserialize_all(model_class, data_list))
+    elapsed = time.perf_counter() - start
+    done.set()
+    loop.run_until_complete(probing)
+    lags.sort()
+    return elapsed, lags[int(len(lags) * 0.99)] if lags else 0, lags[-1] if lags else 0
+
+
+def main():
+    threads = ThreadPoolExecutor(max_workers=WORKERS)
+    processes = ProcessPoolExecutor(max_workers=WORKERS)
+    scenarios = (
+        ('inline', card_model(None)),
+        ('thread pool', card_model(threads)),
+        ('process pool', card_model(processes)),
+    )
+    print('Deserializing {} models with an offloaded checksum validator'.format(COUNT))
+    print('    {:<14} {:>10} {:>14} {:>14}'.format('', 'total', 'p99 loop lag', 'max loop lag'))
+    for title, model_class in scenarios:
+        elapsed, p99, worst = measure(model_class)
+        print('    {:<14} {:>9.3f}s {:>12.1f}ms {:>12.1f}ms'.format(title, elapsed, p99 * 1000, worst * 1000))
+    threads.shutdown()
+    processes.shutdown()
+
+
+if __name__ == '__main__':
+    main()
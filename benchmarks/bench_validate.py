@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+'''
+Measures model validation on a model with dozens of fields, comparing the compiled
+validator chains with running every validator of every field.
+'''
+
+import sys
+import os
+import timeit
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tbone.data.fields import *  # noqa E402
+from tbone.data.models import Model  # noqa E402
+
+FIELDS = 40
+NUMBER = 20000
+
+attrs = {}
+for i in range(FIELDS):
+    if i % 4 == 0:
+        attrs['number_{}'.format(i)] = IntegerField()
+    elif i % 4 == 1:
+        attrs['bounded_{}'.format(i)] = IntegerField(min=0, max=100)
+    elif i % 4 == 2:
+        attrs['choice_{}'.format(i)] = StringField(choices=['a', 'b', 'c'])
+    else:
+        attrs['text_{}'.format(i)] = StringField()
+
+Document = types.new_class('Document', (Model,), exec_body=lambda namespace: namespace.update(attrs))
+
+DATA = {}
+for name in Document._fields:
+    if name.startswith('choice'):
+        DATA[name] = 'b'
+    elif name.startswith('text'):
+        DATA[name] = 'text'
+    else:
+        DATA[name] = 50
+
+
+def validate_all(data):
+    ''' Runs every validator of every field, regardless of the field's configuration '''
+    for name, field in Document._fields.items():
+        for validator in field.validators:
+            validator(data.get(name))
+
+
+def main():
+    document = Document(DATA)
+    print('Validating a {} field model {} times'.format(FIELDS, NUMBER))
+    every = timeit.timeit(lambda: validate_all(document._data), number=NUMBER)
+    compiled = timeit.timeit(document.validate, number=NUMBER)
+    print('{:<20} {:>8.3f}s'.format('every validator', every))
+    print('{:<20} {:>8.3f}s'.format('compiled chains', compiled))
+    print('compiled chains are {:.1f}x faster'.format(every / compiled))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+from .fields.simple import IntegerField, FloatField, BooleanField, DateTimeField
+
+__all__ = ['ModelBatch']
+
+_numpy_module = False  # numpy is imported when the first column is created
+
+
+def _numpy():
+    ''' Returns the ``numpy`` module, imported on first use, or ``None`` if it is not installed '''
+    global _numpy_module
+    if _numpy_module is False:
+        try:
+            import numpy
+        except ImportError:  # columns are kept as lists
+            numpy = None
+        _numpy_module = numpy
+    return _numpy_module
+
+
+def _column_dtype(field):
+    ''' Returns the NumPy type of a field's column, or ``None`` for columns of python objects '''
+    if isinstance(field, BooleanField):
+        return 'bool'
+    if isinstance(field, IntegerField):
+        return 'int64'
+    if isinstance(field, FloatField):
+        return 'float64'
+    if isinstance(field, DateTimeField):
+        return 'datetime64[us]'
+    return None
+
+
+def _object_array(values):
+    numpy = _numpy()
+    column = numpy.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _make_column(field, values):
+    '''
+    Returns the column holding the given values of a field.
+    Missing values of float columns are kept as ``NaN``.
+    Integer, boolean and date-time columns with missing values, or with timezone aware date-times, hold python objects
+    '''
+    numpy = _numpy()
+    if numpy is None:
+        return values
+    dtype = _column_dtype(field)
+    if dtype == 'float64':
+        return numpy.array([numpy.nan if value is None else value for value in values], dtype=dtype)
+    if dtype is None or any(value is None for value in values):
+        return _object_array(values)
+    if dtype.startswith('datetime64') and any(value.tzinfo is not None for value in values):
+        return _object_array(values)
+    return numpy.array(values, dtype=dtype)
+
+
+def _to_list(column):
+    ''' Returns the values of a column as a list of python objects '''
+    numpy = _numpy()
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        values = column.tolist()
+        if column.dtype.kind == 'f':
+            return [None if value != value else value for value in values]
+        return values
+    return list(column)
+
+
+def _to_python(value):
+    ''' Converts a value read from a column to a python object '''
+    numpy = _numpy()
+    if numpy is not None and isinstance(value, numpy.generic):
+        if isinstance(value, numpy.floating) and value != value:
+            return None
+        return value.item()
+    return value
+
+
+class ModelBatch(object):
+    '''
+    A columnar representation of a list of model instances of the same model class,
+    used for large result sets which are mostly aggregated or exported as a whole.
+    The value of every field is stored in a column. If NumPy is installed, columns of ``IntegerField``, ``FloatField``,
+    ``BooleanField`` and ``DateTimeField`` fields are typed NumPy arrays and other columns are object arrays.
+    Otherwise columns are lists.
+
+    Indexing a batch with a field name returns its column, so NumPy users can build masks for ``filter``
+    with vectorized comparisons. Indexing with an integer returns a row view, which is an instance of the model class
+    created from the row's values without validating them again. Changes made to a row view are not written to the batch
+
+    :param model_class:
+        The model class of the batch's rows
+    :param columns:
+        A ``dict`` of columns keyed by field name
+    :param length:
+        The number of rows in the batch
+    '''
+
+    def __init__(self, model_class, columns: dict, length: int):
+        self.model_class = model_class
+        self.columns = columns
+        self._length = length
+
+    @classmethod
+    def from_many(cls, model_class, data_list, validate=True):
+        '''
+        Creates a batch from a list of ``dict`` objects, such as documents returned by a datastore query.
+        Values are imported like ``Model.from_many``, and the given dictionaries are not modified
+
+        :param validate:
+            Determines if the rows are validated after import. Default is ``True``
+        '''
+        importers = model_class._field_validating_importers if validate else model_class._field_importers
+        values = {name: [importer(data.get(name)) for data in data_list] for name, importer in importers.items()}
+        if validate:
+            validate_fields = model_class._validate_fields
+            names = list(values)
+            for row in zip(*values.values()):
+                validate_fields(dict(zip(names, row)))
+        fields = model_class._fields
+        columns = {name: _make_column(fields[name], column) for name, column in values.items()}
+        return cls(model_class, columns, len(data_list))
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return (self.row(index) for index in range(self._length))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, slice):
+            return self._take(range(self._length)[key])
+        return self.row(key)
+
+    def __repr__(self):
+        return '<{} of {} {} rows>'.format(self.__class__.__name__, self._length, self.model_class.__name__)
+
+    def row(self, index: int):
+        ''' Returns a model instance holding the values of the row at the given index '''
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('Batch index out of range')
+        model_class = self.model_class
+        instance = model_class.__new__(model_class)
+        instance._data = model_class._data_class()
+        instance._data.update({name: _to_python(column[index]) for name, column in self.columns.items()})
+        instance._dirty = set()
+        return instance
+
+    def to_models(self) -> list:
+        ''' Returns a list of model instances, one for every row '''
+        return list(self)
+
+    def _take(self, indices):
+        numpy = _numpy()
+        indices = list(indices)
+        columns = {}
+        for name, column in self.columns.items():
+            if numpy is not None and isinstance(column, numpy.ndarray):
+                columns[name] = column[numpy.array(indices, dtype='int64')]
+            else:
+                columns[name] = [column[index] for index in indices]
+        return self.__class__(self.model_class, columns, len(indices))
+
+    def filter(self, mask):
+        '''
+        Returns a new batch with the rows selected by the given mask
+
+        :param mask:
+            A sequence of booleans with one item per row, such as a NumPy boolean array
+        '''
+        numpy = _numpy()
+        if numpy is not None and isinstance(mask, numpy.ndarray) and mask.dtype.kind == 'b':
+            if len(mask) != self._length:
+                raise ValueError('Mask length does not match the batch length')
+            columns = {name: column[mask] for name, column in self.columns.items()}
+            return self.__class__(self.model_class, columns, int(mask.sum()))
+        mask = list(mask)
+        if len(mask) != self._length:
+            raise ValueError('Mask length does not match the batch length')
+        return self._take(index for index, selected in enumerate(mask) if selected)
+
+    def where(self, name, predicate):
+        ''' Returns a new batch with the rows whose value of the given field satisfies the predicate '''
+        return self.filter([predicate(value) for value in _to_list(self.columns[name])])
+
+    def _values(self, name):
+        ''' Returns the column of the given field without missing values '''
+        numpy = _numpy()
+        column = self.columns[name]
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            if column.dtype.kind == 'f':
+                return column[~numpy.isnan(column)]
+            if column.dtype.kind in 'biuM':
+                return column
+        return [value for value in column if value is not None]
+
+    def count(self, name=None) -> int:
+        ''' Returns the number of rows, or the number of rows with a value for the given field '''
+        if name is None:
+            return self._length
+        return len(self._values(name))
+
+    def sum(self, name):
+        ''' Returns the sum of the values of the given field, ignoring missing values '''
+        numpy = _numpy()
+        values = self._values(name)
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return _to_python(values.sum())
+        return sum(values)
+
+    def mean(self, name):
+        ''' Returns the mean of the values of the given field, ignoring missing values. Returns ``None`` if there are none '''
+        numpy = _numpy()
+        values = self._values(name)
+        if len(values) == 0:
+            return None
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return _to_python(values.mean())
+        return sum(values) / len(values)
+
+    def min(self, name):
+        ''' Returns the smallest value of the given field, ignoring missing values. Returns ``None`` if there are none '''
+        numpy = _numpy()
+        values = self._values(name)
+        if len(values) == 0:
+            return None
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return _to_python(values.min())
+        return min(values)
+
+    def max(self, name):
+        ''' Returns the largest value of the given field, ignoring missing values. Returns ``None`` if there are none '''
+        numpy = _numpy()
+        values = self._values(name)
+        if len(values) == 0:
+            return None
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return _to_python(values.max())
+        return max(values)
+
+    def export_columns(self, native=True, fields=None) -> dict:
+        '''
+        Exports the batch into a ``dict`` of lists keyed by field name.
+        Columns are read into lists once, and every value is then converted with the field's ``to_python`` or ``to_data``,
+        as when exporting rows. Like ``Model.export_data``, this method does not include projection rules and export methods
+
+        :param fields:
+            An optional list of field names to export. By default all fields are exported
+        '''
+        model_fields = self.model_class._fields
+        exported = {}
+        for name in (fields if fields is not None else self.columns):
+            field = model_fields[name]
+            convert = field.to_python if native else field.to_data
+            exported[name] = [None if value is None else convert(value) for value in _to_list(self.columns[name])]
+        return exported
+
+    def export_data(self, native=True, fields=None) -> list:
+        '''
+        Exports the batch into a list of dictionaries, one for every row, like calling ``Model.export_data`` on every row.
+        Values are converted column by column with ``export_columns``
+        '''
+        model_fields = self.model_class._fields
+        columns = self.export_columns(native, fields)
+        rows = [{} for i in range(self._length)]
+        for name, values in columns.items():
+            skip_none = model_fields[name]._export_if_none is False
+            for row, value in zip(rows, values):
+                if value is None and skip_none:
+                    continue
+                row[name] = value
+        return rows
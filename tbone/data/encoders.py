@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+from json.encoder import encode_basestring_ascii
+from tbone.utils import ExtendedJSONEncoder
+
+__all__ = ['RawJSON', 'encode_json', 'write_json', 'json_key']
+
+
+class RawJSON(bytes):
+    '''
+    A fragment of encoded JSON, such as the output of ``Model.serialize_json``.
+    Written as is by ``write_json`` and ``encode_json``
+    '''
+
+
+INFINITY = float('inf')
+
+# containers are encoded by the standard library's C accelerated encoder, in compact form
+_encode = ExtendedJSONEncoder(separators=(',', ':')).encode
+
+
+def _write_str(buffer, value):
+    buffer += encode_basestring_ascii(value).encode('ascii')
+
+
+def _write_int(buffer, value):
+    buffer += int.__repr__(value).encode('ascii')
+
+
+def _write_float(buffer, value):
+    if value != value:
+        buffer += b'NaN'
+    elif value == INFINITY:
+        buffer += b'Infinity'
+    elif value == -INFINITY:
+        buffer += b'-Infinity'
+    else:
+        buffer += float.__repr__(value).encode('ascii')
+
+
+def _write_bool(buffer, value):
+    buffer += b'true' if value else b'false'
+
+
+def _write_none(buffer, value):
+    buffer += b'null'
+
+
+def _write_encoded(buffer, value):
+    buffer += _encode(value).encode('ascii')
+
+
+_WRITERS = {
+    str: _write_str,
+    int: _write_int,
+    float: _write_float,
+    bool: _write_bool,
+    type(None): _write_none,
+    RawJSON: bytearray.extend,
+}
+
+
+def json_key(key) -> bytes:
+    ''' Returns the encoded form of an object member's key, followed by the name separator '''
+    return _encode({key: None})[1:-5].encode('ascii')
+
+
+def write_json(buffer: bytearray, value):
+    '''
+    Writes the JSON form of a value to the given buffer, in compact form.
+    Produces the same data as ``json.dumps`` with ``ExtendedJSONEncoder``.
+    Fragments of ``RawJSON`` are written as is
+    '''
+    writer = _WRITERS.get(type(value))
+    if writer is not None:
+        writer(buffer, value)
+    elif isinstance(value, RawJSON):
+        buffer += value
+    else:
+        _write_encoded(buffer, value)
+
+
+def _contains_raw(value) -> bool:
+    ''' Checks for fragments of ``RawJSON`` in the members of nested ``dict`` objects, or the items of their lists '''
+    if type(value) is dict:
+        return any(_contains_raw(item) for item in value.values())
+    if type(value) is list:
+        return any(isinstance(item, RawJSON) for item in value)
+    return isinstance(value, RawJSON)
+
+
+def _write_embedding(buffer: bytearray, value):
+    if type(value) is dict:
+        buffer += b'{'
+        separator = b''
+        for key, item in value.items():
+            buffer += separator
+            buffer += json_key(key)
+            if _contains_raw(item):
+                _write_embedding(buffer, item)
+            else:
+                write_json(buffer, item)
+            separator = b','
+        buffer += b'}'
+    elif type(value) is list:
+        buffer += b'['
+        separator = b''
+        for item in value:
+            buffer += separator
+            write_json(buffer, item)
+            separator = b','
+        buffer += b']'
+    else:
+        write_json(buffer, value)
+
+
+def encode_json(value) -> bytes:
+    '''
+    Returns the JSON form of a value as ``bytes``. See ``write_json``.
+    Fragments of ``RawJSON`` can be the value itself, the members of nested ``dict`` objects,
+    or the items of their lists, such as the objects of a list response
+    '''
+    if isinstance(value, RawJSON):
+        return bytes(value)
+    if _contains_raw(value):
+        buffer = bytearray()
+        _write_embedding(buffer, value)
+        return bytes(buffer)
+    return _encode(value).encode('ascii')
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 # encoding: utf-8
 
+import asyncio
 from collections import OrderedDict
 from functools import wraps
+from tbone.utils import iscoroutinefunction
 
 __all__ = ['BaseField']
 
@@ -35,7 +37,9 @@ class Ternary(object):
 
 class FieldDescriptor(object):
     '''
-    ``FieldDescriptor`` for exposing fields to allow access to the underlying data
+    ``FieldDescriptor`` for exposing fields to allow access to the underlying data.
+    Assignments and deletions are recorded in the model instance's set of dirty fields, once the instance has one,
+    and invalidate the cached serialize methods which depend on the field
     '''
 
     def __init__(self, field):
@@ -43,16 +47,84 @@ class FieldDescriptor(object):
 
     def __get__(self, instance, owner):
         if instance is not None:
-            if self.field.name == 'participants':
-                import pdb; pdb.set_trace()
             return instance._data.get(self.field.name, None) or self.field.default
         return self.field
 
     def __set__(self, instance, value):
         instance._data[self.field.name] = value
+        if instance._dirty is not None:
+            instance._dirty.add(self.field.name)
+        if instance._serialize_cache:
+            instance._invalidate_serialized((self.field.name,))
 
     def __delete__(self, instance):
-        del instance._data[self.name]
+        del instance._data[self.field.name]
+        if instance._dirty is not None:
+            instance._dirty.add(self.field.name)
+        if instance._serialize_cache:
+            instance._invalidate_serialized((self.field.name,))
+
+
+class SlotFieldDescriptor(object):
+    '''
+    ``FieldDescriptor`` for models declared with the ``slots`` option.
+    Reads and writes the field's fixed slot in the model's data storage directly.
+    Defaults are materialized when the storage is created, so they are not evaluated on reads
+    '''
+
+    def __init__(self, field, member):
+        self.field = field
+        self._get = member.__get__
+        self._set = member.__set__
+
+    def __get__(self, instance, owner):
+        if instance is not None:
+            return self._get(instance._data, None)
+        return self.field
+
+    def __set__(self, instance, value):
+        self._set(instance._data, value)
+        if instance._dirty is not None:
+            instance._dirty.add(self.field.name)
+        if instance._serialize_cache:
+            instance._invalidate_serialized((self.field.name,))
+
+    def __delete__(self, instance):
+        self._set(instance._data, self.field.default)
+        if instance._dirty is not None:
+            instance._dirty.add(self.field.name)
+        if instance._serialize_cache:
+            instance._invalidate_serialized((self.field.name,))
+
+
+class LazyFieldDescriptor(object):
+    '''
+    Wraps the descriptor of a field in models declared with the ``lazy_hydration`` option.
+    Converts the field's raw value to its python type on first access, and then delegates to the wrapped descriptor
+    '''
+
+    def __init__(self, descriptor, name, importer):
+        self.descriptor = descriptor
+        self.field = descriptor.field
+        self.name = name
+        self._importer = importer
+
+    def __get__(self, instance, owner):
+        if instance is not None:
+            raw = instance._raw
+            if raw and self.name in raw:
+                instance._data[self.name] = self._importer(raw.pop(self.name))
+        return self.descriptor.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        if instance._raw:
+            instance._raw.pop(self.name, None)
+        self.descriptor.__set__(instance, value)
+
+    def __delete__(self, instance):
+        if instance._raw:
+            instance._raw.pop(self.name, None)
+        self.descriptor.__delete__(instance)
 
 
 class FieldMeta(type):
@@ -61,15 +133,31 @@ class FieldMeta(type):
     '''
     @classmethod
     def __prepare__(mcl, name, bases):
-        ''' Adds the validator decorator so member methods can be decorated as validation methods '''
-        def validator(func):
-            func._validation_method_ = True
-
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                return func(*args, **kwargs)
-
-            return wrapper
+        '''
+        Adds the validator decorator so member methods can be decorated as validation methods.
+        The decorator accepts an optional ``skip_if`` callable which receives the field instance
+        and returns ``True`` when the validator has nothing to check, so it is left out of the field's validator chain.
+        Coroutine methods are asynchronous validators, which are run by ``validate_async``
+        '''
+        def validator(func=None, skip_if=None):
+            def decorator(func):
+                func._validation_method_ = True
+                func._skip_validation_if_ = skip_if
+
+                if iscoroutinefunction(func):
+                    @wraps(func)
+                    async def wrapper(*args, **kwargs):
+                        return await func(*args, **kwargs)
+                else:
+                    @wraps(func)
+                    def wrapper(*args, **kwargs):
+                        return func(*args, **kwargs)
+
+                return wrapper
+
+            if func is None:
+                return decorator
+            return decorator(func)
         d = dict()
         d['validator'] = validator
         return d
@@ -120,7 +208,8 @@ class BaseField(object, metaclass=FieldMeta):
 
     :param validators:
         An optional list of validator functions. Requires a list of calllables.
-        Used for validation functions which are not implemented as internal ``Field`` methods
+        Used for validation functions which are not implemented as internal ``Field`` methods.
+        Coroutine functions are asynchronous validators, which are run by ``validate_async``
 
     :param projection:
         Determines if the field is serialized by the model using the model's ``serialize`` methods.
@@ -145,6 +234,19 @@ class BaseField(object, metaclass=FieldMeta):
         This declaration has no impact on the datastore, and is used by the ``Resource`` class as the model's identifier.
         If the model is also mixed with a persistency class, it would make sense that the field which
         is defined as the primary key may also be indexed as unique
+
+    :param compiled:
+        Determines if the model compiles the field's import, export, serialization and validation steps
+        when the model class is created.
+        Set to ``False`` for fields whose attributes are modified after the model is declared,
+        so the model reads them on every call.
+        Default: True
+
+    :param offload:
+        Declares the field's coercion and validation as CPU intensive, such as parsing or checksum validation.
+        Models declared with a ``validation_executor`` run the import and validation of such fields in the executor
+        when data is deserialized or validated asynchronously, so they do not block the event loop.
+        Default: False
     '''
     _data_type = None
     _python_type = None
@@ -159,16 +261,24 @@ class BaseField(object, metaclass=FieldMeta):
 
     def __init__(self, required=False, default=None, choices=None,
                  validators=None, projection=True, export_if_none=True, readonly=False,
-                 primary_key=False, **kwargs):
+                 primary_key=False, compiled=True, offload=False, **kwargs):
         super(BaseField, self).__init__()
 
         self._required = required
         self._default = default
         self._choices = choices
+        self._choices_set = None
+        if choices:
+            try:
+                self._choices_set = frozenset(choices)
+            except TypeError:   # unhashable choices are matched against the list
+                pass
         self._projection = Ternary(projection)
         self._export_if_none = export_if_none
         self._readonly = readonly
         self._primary_key = primary_key
+        self._compiled = compiled
+        self._offload = offload
         self._bound = False                         # Whether the Field is bound to a Model
         self._is_composite = False
 
@@ -181,6 +291,8 @@ class BaseField(object, metaclass=FieldMeta):
             for validator in validators:
                 if callable(validator):
                     self.validators.append(validator)
+        self._validator_chain = None                # compiled on first use or when bound to a model
+        self._async_validators = None               # compiled with the validator chain
 
     @property
     def is_composite(self):
@@ -216,6 +328,13 @@ class BaseField(object, metaclass=FieldMeta):
             return None
         return self._python_type(value)
 
+    def _import_trusted(self, value):
+        '''
+        Imports field data which was validated before it was stored, such as documents read from a datastore.
+        Fields which hold models override it to create the models without validating them again
+        '''
+        return self._import(value)
+
 
     def _check_required(self, value):
         '''
@@ -258,6 +377,35 @@ class BaseField(object, metaclass=FieldMeta):
         except ValueError as ex:
             raise ValueError(ex, self._errors['to_python'])
 
+    def _to_python_trusted(self, value):
+        ''' Same as ``to_python``, for field data which was validated before it was stored. See ``_import_trusted`` '''
+        try:
+            if value is None and self._default is not None:
+                return self.default
+            self._check_required(value)
+            if not isinstance(value, self._python_type):
+                value = self._import_trusted(value)
+            return value
+        except ValueError as ex:
+            raise ValueError(ex, self._errors['to_python'])
+
+
+    @property
+    def async_serialize(self):
+        '''
+        Determines if the field's serialization must be awaited.
+        Fields which override ``serialize`` are considered asynchronous, unless they override this property as well
+        '''
+        return type(self).serialize is not BaseField.serialize
+
+    def serialize_sync(self, value, native=False):
+        '''
+        Synchronous form of ``serialize``, used by models for fields which do not perform any I/O.
+        Calls the field's ``to_python`` or ``to_data`` methods
+        '''
+        if native:
+            return self.to_python(value)
+        return self.to_data(value)
 
     async def serialize(self, value, native=False):
         '''
@@ -283,6 +431,21 @@ class BaseField(object, metaclass=FieldMeta):
             default = default()
         return default
 
+    def __copy__(self):
+        '''
+        Returns a copy of the field for binding to a model which inherits it.
+        The copy shares the field's definition, such as its choices, default and nested fields,
+        and the field's own validator methods are rebound to the copy.
+        Attributes which depend on the model class are replaced when the copy is added to the model
+        '''
+        field = self.__class__.__new__(self.__class__)
+        field.__dict__.update(self.__dict__)
+        field.validators = [
+            validator.__func__.__get__(field, self.__class__) if getattr(validator, '__self__', None) is self else validator
+            for validator in self.validators
+        ]
+        return field
+
     def add_to_class(self, cls, name):
         '''
         Hook that replaces the `Field` attribute on a class with a named
@@ -293,18 +456,95 @@ class BaseField(object, metaclass=FieldMeta):
         self._container_model_class = cls
         setattr(cls, name, FieldDescriptor(self))
         self._bound = True
+        self._validator_chain = self._compile_validators()
+
+    def _compile_validators(self):
+        '''
+        Compiles the field's synchronous validators into a single callable, leaving out validators
+        whose ``skip_if`` condition says they have nothing to check, and collects its asynchronous validators.
+        Returns ``False`` if the field has no synchronous validation to perform
+        '''
+        validators = []
+        async_validators = []
+        for validator in self.validators:
+            # only the field's own validator methods carry a skip condition
+            skip_if = getattr(validator, '_skip_validation_if_', None) if getattr(validator, '__self__', None) is self else None
+            if skip_if is not None and skip_if(self):
+                continue
+            if iscoroutinefunction(validator):
+                async_validators.append(validator)
+            else:
+                validators.append(validator)
+        self._async_validators = tuple(async_validators)
+
+        if len(validators) == 0:
+            return False
+        if len(validators) == 1:
+            return validators[0]
+
+        validators = tuple(validators)
+
+        def validate(value):
+            for validator in validators:
+                validator(value)
+
+        return validate
+
+    @property
+    def validator_chain(self):
+        '''
+        Returns the compiled validator chain of the field, or ``False`` if the field has nothing to validate.
+        The chain is compiled when the field is bound to a model, or on first use for unbound fields.
+        '''
+        if self._validator_chain is None:
+            self._validator_chain = self._compile_validators()
+        return self._validator_chain
+
+    @property
+    def async_validators(self) -> tuple:
+        ''' Returns the asynchronous validators of the field, which are compiled with its validator chain '''
+        if self._async_validators is None or not self._compiled:
+            self._validator_chain = self._compile_validators()
+        return self._async_validators
 
     def validate(self, value):
         '''
         Run all validate functions pertaining to this field and raise exceptions.
+        Asynchronous validators are not run, see ``validate_async``
         '''
-        for validator in self.validators:
-            validator(value)
+        # fields which are not compiled pick up changes to their validators on every call
+        validate = self.validator_chain if self._compiled else self._compile_validators()
+        if validate:
+            validate(value)
 
-    @validator
+    async def validate_async(self, value):
+        '''
+        Runs the field's synchronous validators and then its asynchronous validators concurrently.
+        Raises the error of the first asynchronous validator which fails, after all of them completed
+        '''
+        self.validate(value)
+        validators = self.async_validators
+        if len(validators) == 1:
+            await validators[0](value)
+        elif validators:
+            results = await asyncio.gather(*[validator(value) for validator in validators], return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+    @validator(skip_if=lambda field: not field._choices)
     def choices(self, value):
         if self._choices:
-            if value not in self._choices and value is not None:
+            if value is None:
+                return
+            if self._choices_set is not None:
+                try:
+                    valid = value in self._choices_set
+                except TypeError:
+                    valid = value in self._choices
+            else:
+                valid = value in self._choices
+            if not valid:
                 raise ValueError(
                     self._errors['choices'].format(
                         ', '.join([str(x) for x in self._choices]), getattr(self, 'name', None)
@@ -46,6 +46,13 @@ class ListField(CompositeField):
             data.append(self.field.to_python(value))
         return data
 
+    def _import_trusted(self, value_list):
+        if value_list is None:
+            return None
+        if not isinstance(value_list, list):
+            raise ValueError('Data is not of type list')
+        return [self.field._to_python_trusted(value) for value in value_list]
+
     def _export(self, value_list):
         if value_list is None:
             return None
@@ -56,7 +63,24 @@ class ListField(CompositeField):
             data.append(self.field.to_data(value))
         return data
 
+    @property
+    def async_serialize(self):
+        return self.field.async_serialize
+
+    def serialize_sync(self, value_list: list, native=False) -> list:
+        if value_list is None:
+            return None
+
+        if not isinstance(value_list, list):
+            raise ValueError('Data is not of type list')
+
+        serialize = self.field.serialize_sync
+        return [serialize(value) for value in value_list]
+
     async def serialize(self, value_list: list, native=False) -> list:
+        if not self.field.async_serialize:
+            return self.serialize_sync(value_list, native)
+
         if value_list is None:
             return None
 
@@ -108,7 +132,31 @@ class DictField(CompositeField):
 
         return data
 
+    def _import_trusted(self, associative):
+        if associative is None:
+            return None
+        if not isinstance(associative, dict):
+            raise ValueError('Data is not of type dict')
+        return {key: self.field._to_python_trusted(value) for key, value in associative.items()}
+
+    @property
+    def async_serialize(self):
+        return self.field.async_serialize
+
+    def serialize_sync(self, associative: dict, native=False) -> dict:
+        if associative is None:
+            return None
+
+        if not isinstance(associative, dict):
+            raise ValueError('Data is not of type dict')
+
+        serialize = self.field.serialize_sync
+        return {key: serialize(value) for key, value in associative.items()}
+
     async def serialize(self, associative: dict, native=False) -> dict:
+        if not self.field.async_serialize:
+            return self.serialize_sync(associative, native)
+
         if associative is None:
             return None
 
@@ -134,7 +182,11 @@ class DictField(CompositeField):
 
 class ModelField(CompositeField):
     '''
-    A field that can hold an instance of the specified model
+    A field that can hold an instance of the specified model.
+    Data held by the field was validated when it was imported, so it is exported and serialized without validating it again.
+    Instances are serialized directly, and so is data held as a ``dict`` in native form, such as the items of
+    ``ListField(ModelField(...))``, if the model has no serialize methods.
+    Otherwise a model instance is created from the ``dict``
     '''
     _data_type = dict
 
@@ -164,6 +216,12 @@ class ModelField(CompositeField):
             return None
         return instance.export_data(native=True)
 
+    def _to_python_trusted(self, value):
+        instance = super(ModelField, self)._to_python_trusted(value)
+        if instance is None:
+            return None
+        return instance.export_data(native=True)
+
     def _import(self, value):
         if isinstance(value, self._python_type):
             return value
@@ -175,24 +233,71 @@ class ModelField(CompositeField):
             raise ValueError('Cannot convert type {} to {}'.format(
                 type(value), self._python_type.__name__))
 
-    def _export(self, value):
-        if isinstance(value, self._python_type):
-            return value.export_data(native=False)
+    def _import_trusted(self, value):
+        if isinstance(value, dict):
+            return self._model_class._from_native(value)
+        return self._import(value)
+
+    def _instance(self, value):
+        ''' Returns the model instance of data held by the field, without validating it again '''
+        if isinstance(value, self._model_class):
+            return value
         elif isinstance(value, dict):
-            return self._python_type(value).export_data(native=False)
+            return self._model_class._from_native(value)
         elif value is None:  # no data was passed
             return None
         else:
             raise ValueError('Cannot convert type {} to {}'.format(
                 type(value), self._python_type.__name__))
 
-    async def serialize(self, value, native=False):
-        # create a model instance from data
-        instance = super(ModelField, self).to_python(value)
+    def _serialized_value(self, value):
+        '''
+        Returns the instance, or the ``dict`` of a model without serialize methods, to serialize.
+        Applies the field's default and required attributes like ``to_python``
+        '''
+        try:
+            if value is None and self._default is not None:
+                value = self.default
+            self._check_required(value)
+            if isinstance(value, dict) and not self._model_class._has_serialize_methods:
+                return value
+            return self._instance(value)
+        except ValueError as ex:
+            raise ValueError(ex, self._errors['to_python'])
+
+    def _export(self, value):
+        instance = self._instance(value)
         if instance is None:
             return None
+        return instance.export_data(native=False)
+
+    @property
+    def async_serialize(self):
+        return self._model_class._async_serialize
+
+    def serialize_sync(self, value, native=False):
+        value = self._serialized_value(value)
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            model_class = self._model_class
+            serialize = model_class._serialize_sync_native if native else model_class._serialize_sync_primitive
+            return serialize(None, value)
         # return the model's serialization
-        dd = await instance.serialize(native)
+        return value.serialize_sync(native)
+
+    async def serialize(self, value, native=False):
+        if not self.async_serialize:
+            return self.serialize_sync(value, native)
+        value = self._serialized_value(value)
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            model_class = self._model_class
+            serialize = model_class._serialize_native if native else model_class._serialize_primitive
+            return await serialize(None, value)
+        # return the model's serialization
+        dd = await value.serialize(native)
         return dd
 
 
@@ -240,3 +345,8 @@ class PolyModelField(CompositeField):
         else:
             raise ValueError('Cannot convert type {} to {}'.format(
                 type(value), self._python_type.__name__))
+
+    def _import_trusted(self, value):
+        if isinstance(value, dict) and not isinstance(value, self._python_type):
+            return self._model_classes[value['type']]._from_native(value['data'])
+        return self._import(value)
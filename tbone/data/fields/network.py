@@ -23,8 +23,5 @@ class EmailField(StringField):
 
 
 class URLField(StringField):
-
-    @validator
-    def url(self, value):
-        # TODO: implement this
-        return value
+    # TODO: Add URL validation
+    pass
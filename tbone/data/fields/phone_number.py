@@ -2,8 +2,11 @@
 # encoding: utf-8
 
 import phonenumbers
+from functools import lru_cache
 from .simple import StringField
 
+PHONE_NUMBER_CACHE_SIZE = 4096
+
 
 class PhoneNumber(phonenumbers.phonenumber.PhoneNumber):
     '''
@@ -24,13 +27,12 @@ class PhoneNumber(phonenumbers.phonenumber.PhoneNumber):
 
     @classmethod
     def from_string(cls, phone_number, region=None):
-        try:
-            phone_number_obj = cls()
-            phonenumbers.parse(number=phone_number, region=region,
-                               keep_raw_input=True, numobj=phone_number_obj)
-            return phone_number_obj
-        except phonenumbers.phonenumberutil.NumberParseException:
-            return None
+        '''
+        Returns the parsed phone number, or ``None`` if the string cannot be parsed.
+        Parsed numbers are kept in a bounded LRU cache keyed by the string and region,
+        so the returned object is shared and should not be modified
+        '''
+        return _parse_phone_number(cls, phone_number, region)
 
     def is_valid(self):
         return phonenumbers.is_valid_number(self)
@@ -84,9 +86,30 @@ class PhoneNumber(phonenumbers.phonenumber.PhoneNumber):
             return False
 
 
+@lru_cache(maxsize=PHONE_NUMBER_CACHE_SIZE)
+def _parse_phone_number(cls, phone_number, region):
+    try:
+        phone_number_obj = cls()
+        phonenumbers.parse(number=phone_number, region=region,
+                           keep_raw_input=True, numobj=phone_number_obj)
+        return phone_number_obj
+    except phonenumbers.phonenumberutil.NumberParseException:
+        return None
+
+
+@lru_cache(maxsize=PHONE_NUMBER_CACHE_SIZE)
+def to_e164(phone_number, region=None):
+    ''' Returns the E.164 form of a phone number string, or ``None`` if the string cannot be parsed '''
+    phone_number_obj = PhoneNumber.from_string(phone_number, region)
+    if phone_number_obj is None:
+        return None
+    return phone_number_obj.as_e164
+
+
 class PhoneNumberDescriptor(object):
     '''
     Descriptor for the phone number field. returns a PhoneNumber object.
+    The parsed object is memoized on the instance until the field's value changes.
     use like this:
         customer.phone_number.as_international
         customer.phone_number.as_national
@@ -94,40 +117,72 @@ class PhoneNumberDescriptor(object):
     '''
     def __init__(self, field):
         self.field = field
+        self._memo = '_{}_phone_number'.format(field.name)
 
     def __get__(self, instance=None, owner=None):
         if instance is None:
             raise AttributeError(
                 "The '%s' attribute can only be accessed from %s instances."
                 % (self.field.name, owner.__name__))
-        value = instance.__dict__[self.field]
+        value = instance._data.get(self.field.name)
         if value is None or isinstance(value, PhoneNumber):
             return value
-        return PhoneNumber.from_string(value)
+        memo = instance.__dict__.get(self._memo)
+        if memo is not None and memo[0] is value:
+            return memo[1]
+        phone_number = PhoneNumber.from_string(value, self.field._region)
+        instance.__dict__[self._memo] = (value, phone_number)
+        return phone_number
 
     def __set__(self, instance, value):
-        instance.__dict__[self.field] = value
+        instance._data[self.field.name] = value
+        if instance._dirty is not None:
+            instance._dirty.add(self.field.name)
+        if instance._serialize_cache:
+            instance._invalidate_serialized((self.field.name,))
 
 
 class PhoneNumberField(StringField):
+    '''
+    A phone number field. Numbers are stored in their E.164 form when imported, and exported as is.
+    Numbers which cannot be parsed are kept as imported and rejected on export
+
+    :param region:
+        An optional region code, used for parsing numbers which are not in international form
+    '''
     ERRORS = {
         'invalid': "Invalid phone number",
     }
 
+    def __init__(self, region=None, **kwargs):
+        self._region = region
+        super(PhoneNumberField, self).__init__(**kwargs)
+
+    def _import(self, value):
+        if value is None:
+            return None
+        if isinstance(value, PhoneNumber):
+            return value.as_e164
+        value = super(PhoneNumberField, self)._import(value)
+        return to_e164(value, self._region) or value
+
     def to_data(self, value):
         if value is None:
             return None
         if isinstance(value, PhoneNumber):
             return value.as_e164
-        phone_number = PhoneNumber.from_string(value)
+        phone_number = to_e164(value, self._region)
         if phone_number:
-            return phone_number.as_e164
+            return phone_number
         raise ValueError(self._errors['invalid'])
 
     def add_to_class(self, cls, name):
         '''
         Overrides the base class to add a PhoheNumberDescriptor rather than the standard FieldDescriptor
         '''
+        self._name = name
+        self._container_model_class = cls
         self.model_class = cls
         setattr(cls, name, PhoneNumberDescriptor(self))
         self._bound = True
+        self._validator_chain = self._compile_validators()
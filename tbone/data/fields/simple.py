@@ -1,11 +1,21 @@
 #!/usr/bin/env python
 # encoding: utf-8
 
+import re
 import datetime
-import dateutil.parser
+from functools import lru_cache
 from .base import BaseField
 
 
+ISO_8601_DATETIME = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6})\d*)?)?(Z|[+-]\d{2}(?::?\d{2})?)?)?$'
+)
+ISO_8601_TIME = re.compile(r'^(\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6})\d*)?)?$')
+
+DATETIME_CACHE_SIZE = 4096
+
+
 class StringField(BaseField):
     ''' Unicode string field '''
     _data_type = str
@@ -24,7 +34,7 @@ class NumberField(BaseField):
         self.max = max
         super(NumberField, self).__init__(**kwargs)
 
-    @validator
+    @validator(skip_if=lambda field: field.min is None and field.max is None)
     def range(self, value):
         if self.min is not None and value < self.min:
             raise ValueError(self._errors['min'].format(self.min))
@@ -64,10 +74,129 @@ class BooleanField(BaseField):
     _python_type = bool
 
 
+# ``dateutil`` time zones by offset in seconds, created on first use so ``dateutil`` is not imported with the module
+_timezones = {}
+
+
+def _timezone(offset):
+    timezone = _timezones.get(offset)
+    if timezone is None:
+        from dateutil.tz import tzutc, tzoffset
+        timezone = _timezones[offset] = tzutc() if offset == 0 else tzoffset(None, offset)
+    return timezone
+
+
+def _parse_timezone(tz):
+    if tz is None:
+        return None
+    if tz == 'Z':
+        return _timezone(0)
+    sign = -1 if tz[0] == '-' else 1
+    tz = tz[1:].replace(':', '')
+    return _timezone(sign * (int(tz[:2]) * 3600 + int(tz[2:4] or 0) * 60))
+
+
+def dateutil_parse(value):
+    ''' Parses a date-time string with ``dateutil.parser.parse``. ``dateutil`` is imported on first use '''
+    from dateutil.parser import parse
+    return parse(value)
+
+
+def parse_iso_datetime(value):
+    '''
+    Parses strict ISO-8601 dates, date-times and times to ``datetime.datetime``.
+    Times without a date are combined with the current date, like ``dateutil.parser.parse`` does.
+    Returns ``None`` if the string is not in one of these forms
+    '''
+    match = ISO_8601_DATETIME.match(value)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction, tz = match.groups()
+        date = (int(year), int(month), int(day))
+    else:
+        match = ISO_8601_TIME.match(value)
+        if match is None:
+            return None
+        hour, minute, second, fraction = match.groups()
+        tz = None
+        today = datetime.date.today()
+        date = (today.year, today.month, today.day)
+    return datetime.datetime(
+        *date,
+        hour=int(hour) if hour else 0,
+        minute=int(minute) if minute else 0,
+        second=int(second) if second else 0,
+        microsecond=int(fraction.ljust(6, '0')) if fraction else 0,
+        tzinfo=_parse_timezone(tz)
+    )
+
+
+def parse_datetime(value, format=None, parser=None):
+    '''
+    Parses a string to ``datetime.datetime``.
+    Tries the given ``strptime`` format first, then the strict ISO-8601 parser,
+    and falls back to the given parser for strings in any other form, or to ``dateutil`` if no parser is given
+    '''
+    if format is not None:
+        try:
+            return datetime.datetime.strptime(value, format)
+        except ValueError:
+            pass
+    dt = parse_iso_datetime(value)
+    if dt is None:
+        dt = (parser or dateutil_parse)(value)
+    return dt
+
+
+# parsed values are immutable, so the cache is shared by all fields declared with ``cache=True``
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _parse_dated_datetime(value, format):
+    ''' Parses strings with the given format, or ISO-8601 strings which include a date. Returns ``None`` for other strings '''
+    if format is not None:
+        try:
+            return datetime.datetime.strptime(value, format)
+        except ValueError:
+            pass
+    if ISO_8601_DATETIME.match(value) is None:
+        return None
+    return parse_iso_datetime(value)
+
+
+def parse_datetime_cached(value, format=None, parser=None):
+    '''
+    Same as ``parse_datetime``, caching the strings parsed with the given format or as ISO-8601 strings which include a date.
+    Other strings are not cached, since parsers fill in their missing parts, such as the date of a time-only string, from the current date
+    '''
+    dt = _parse_dated_datetime(value, format)
+    if dt is None:
+        dt = parse_iso_datetime(value) or (parser or dateutil_parse)(value)
+    return dt
+
+
 class DTBaseField(BaseField):
-    ''' Base field for all fields related to date and time '''
+    '''
+    Base field for all fields related to date and time.
+    Strings are parsed with a strict ISO-8601 parser, and only strings in other forms are passed to ``dateutil``
+
+    :param format:
+        An optional ``strptime`` format, tried before the ISO-8601 parser
+
+    :param parser:
+        The parser used for strings which are not in ISO-8601 form or in the given format.
+        Default: ``dateutil.parser.parse``
+
+    :param cache:
+        Caches parsed strings in a per-process LRU cache shared by all fields declared with ``cache=True``.
+        Useful when the same values repeat across many documents. Only strings in ISO-8601 form or in the given format are cached.
+        Default: ``False``
+    '''
     _data_type = str
 
+    def __init__(self, format=None, parser=None, cache=False, **kwargs):
+        self._format = format
+        self._parser = parser
+        self._parse = parse_datetime_cached if cache else parse_datetime
+        super(DTBaseField, self).__init__(**kwargs)
+
     def to_data(self, value):
         if value is None:
             if self._default is not None:
@@ -81,7 +210,7 @@ class DTBaseField(BaseField):
         elif isinstance(value, self._python_type) or isinstance(value, datetime.datetime):
             return value
         elif isinstance(value, str):
-            return dateutil.parser.parse(value)
+            return self._parse(value, self._format, self._parser)
         raise ValueError('{0} Unacceptable type for {1} field'.format(value.__class__.__name__, self._python_type.__name__))
 
 
@@ -2,10 +2,13 @@
 # encoding: utf-8
 
 import asyncio
-from copy import deepcopy
+from copy import copy
 from collections import OrderedDict
+from tbone.utils import public_attributes, iscoroutinefunction
 from .fields import BaseField
-from functools import wraps
+from .fields.base import FieldDescriptor, SlotFieldDescriptor, LazyFieldDescriptor
+from .encoders import RawJSON, write_json, json_key
+from functools import wraps, partial
 
 
 class ModelOptions(object):
@@ -39,6 +42,44 @@ class ModelOptions(object):
 
     :param indices:
         Used for definding database indices
+
+    :param slots:
+        Stores the model's data in a fixed-slot storage object generated from the model's fields, instead of a ``dict``.
+        Reduces the memory footprint of every model instance. Defaults are materialized once, when the instance is created.
+    :type slots:
+        Boolean - Default is ``False``
+
+    :param lazy_hydration:
+        Determines if instances created from datastore documents keep the raw document values and convert them to
+        python types only when a field is first accessed, or when the instance is serialized, exported or validated.
+        Persistency mixins use this to make the cost of loading documents scale with the fields actually used.
+        Lazily hydrated instances are not validated when loaded.
+    :type lazy_hydration:
+        Boolean - Default is ``False``
+
+    :param validate_on_load:
+        Determines if instances created from datastore documents are validated.
+        Data read from the datastore was validated when it was saved, so by default it is only coerced to python types.
+        Set to ``True`` for collections which are also written by other systems.
+    :type validate_on_load:
+        Boolean - Default is ``False``
+
+    :param validation_executor:
+        An executor, such as ``concurrent.futures.ProcessPoolExecutor``, which imports and validates the fields
+        declared with ``offload=True`` when data is deserialized, or validated with ``validate_async``.
+        The work of all such fields of an instance, or of a list of instances, is sent to the executor in a single call.
+        Process pools require the model class to be importable by its module and name.
+        By default such fields are imported and validated inline
+
+    :param bulk_batch_size:
+        The number of operations which persistency mixins send to the datastore in every batch of a bulk write.
+    :type bulk_batch_size:
+        Integer - Default is ``1000``
+
+    :param iterate_batch_size:
+        The number of documents which persistency mixins fetch from the datastore, and create models from, in every batch when iterating query results.
+    :type iterate_batch_size:
+        Integer - Default is ``500``
     '''
     name = None
     namespace = None
@@ -47,25 +88,58 @@ class ModelOptions(object):
     exclude_serialize = []
     creation_args = {}
     indices = []
+    slots = False
+    lazy_hydration = False
+    validate_on_load = False
+    validation_executor = None
+    bulk_batch_size = 1000
+    iterate_batch_size = 500
 
     def __init__(self, meta=None):
         if meta:
-            for attr in dir(meta):
-                if not attr.startswith('_'):
-                    setattr(self, attr, getattr(meta, attr))
+            self.__dict__.update(public_attributes(meta))
 
 
 class ModelMeta(type):
     '''Metaclass for Model'''
     @classmethod
     def __prepare__(mcl, name, bases):
-        ''' Adds the ``serialize`` decorator so member methods can be decorated for serialization '''
-        def serialize(func):
+        '''
+        Adds the ``serialize`` decorator so member methods can be decorated for serialization.
+        Methods decorated with ``cached=True`` are executed once per instance and their result is reused,
+        until one of the fields listed in ``depends_on`` is assigned, deleted or imported.
+        Without ``depends_on`` the result is invalidated when any field changes
+        '''
+        def serialize(func=None, cached=False, depends_on=None):
+            if func is None:
+                return partial(serialize, cached=cached, depends_on=depends_on)
             func._serialize_method_ = True
+            func._serialize_async_ = iscoroutinefunction(func)
+            func._serialize_cached_ = cached
+            func._serialize_depends_on_ = tuple(depends_on) if depends_on is not None else None
 
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                return func(*args, **kwargs)
+            if not cached:
+                @wraps(func)
+                def wrapper(*args, **kwargs):
+                    return func(*args, **kwargs)
+            elif func._serialize_async_:
+                @wraps(func)
+                async def wrapper(self):
+                    cache = self._serialize_cache
+                    if cache is not None and func.__name__ in cache:
+                        return cache[func.__name__]
+                    value = await func(self)
+                    self._cache_serialized(func.__name__, value)
+                    return value
+            else:
+                @wraps(func)
+                def wrapper(self):
+                    cache = self._serialize_cache
+                    if cache is not None and func.__name__ in cache:
+                        return cache[func.__name__]
+                    value = func(self)
+                    self._cache_serialized(func.__name__, value)
+                    return value
 
             return wrapper
         d = dict()
@@ -80,7 +154,8 @@ class ModelMeta(type):
         # get model fields and exports from base classes
         for base in reversed(bases):
             if hasattr(base, '_fields'):
-                fields.update(deepcopy(base._fields))  # copy all fields
+                # inherited fields are shallow copies which share the base field's definition
+                fields.update((name, copy(field)) for name, field in base._fields.items())
                 # remove excludes
                 if 'Meta' in attrs and hasattr(attrs['Meta'], 'exclude_fields'):
                     ex = attrs['Meta'].exclude_fields
@@ -89,7 +164,7 @@ class ModelMeta(type):
                             del fields[f]
 
             if hasattr(base, '_serialize_methods'):
-                serialize_methods.update(deepcopy(base._serialize_methods))
+                serialize_methods.update(base._serialize_methods)
                 # remove excludes
                 if 'Meta' in attrs and hasattr(attrs['Meta'], 'exclude_serialize'):
                     ex = attrs['Meta'].exclude_serialize
@@ -122,9 +197,577 @@ class ModelMeta(type):
         opts = getattr(cls, 'Meta', None)
         cls._meta = ModelOptions(opts)
 
+        # replace the data dict with a slotted storage class, if requested
+        if cls._meta.slots:
+            cls._data_class = _make_data_class(cls, fields)
+            for name, field in fields.items():
+                if type(cls.__dict__.get(name)) is FieldDescriptor:
+                    member = cls._data_class._members[name]
+                    setattr(cls, name, SlotFieldDescriptor(field, member))
+        else:
+            cls._data_class = dict
+
+        # convert raw values on first access, if requested
+        cls._field_importers = {name: _compile_field_import(field) for name, field in fields.items()}
+        cls._field_validating_importers = {name: _compile_field_import(field, trusted=False) for name, field in fields.items()}
+        if cls._meta.lazy_hydration:
+            for name in fields:
+                setattr(cls, name, LazyFieldDescriptor(cls.__dict__[name], name, cls._field_importers[name]))
+
+        # compile the model's data functions now that all fields are bound
+        cls._import_fields = _compile_import(fields)
+        cls._import_fields_trusted = _compile_import(fields, trusted=True)
+        cls._export_native = _compile_export(fields, native=True)
+        cls._export_primitive = _compile_export(fields, native=False)
+        cls._async_serialize = any(
+            field.async_serialize for field in fields.values()
+            if field._projection != None or not field._compiled  # noqa E711
+        ) or any(getattr(func, '_serialize_async_', True) for func in serialize_methods.values())
+        cls._has_serialize_methods = len(serialize_methods) > 0
+        cls._serialize_dependents = _serialize_dependents(fields, serialize_methods)
+        cls._serialize_native = _compile_serialize(fields, serialize_methods, native=True)
+        cls._serialize_primitive = _compile_serialize(fields, serialize_methods, native=False)
+        if not cls._async_serialize:
+            cls._serialize_sync_native = _compile_serialize_sync(fields, serialize_methods, native=True)
+            cls._serialize_sync_primitive = _compile_serialize_sync(fields, serialize_methods, native=False)
+        cls._validate_fields = staticmethod(_compile_validate(cls, fields))
+        validate_async = _compile_validate_async(cls, fields)
+        cls._has_async_validators = validate_async is not None
+        cls._validate_fields_async = staticmethod(validate_async or _validated)
+        # fields whose import and validation run in the validation executor, if the model has one
+        cls._offload_fields = frozenset(
+            name for name, field in fields.items() if field._offload
+        ) if cls._meta.validation_executor is not None else frozenset()
+
         return cls
 
 
+class SlottedData(object):
+    '''
+    Base class for the data storage of models declared with the ``slots`` option.
+    Subclasses are generated per model with one slot per field, and expose the part of the ``dict`` interface used by models.
+    Keys which do not match a field are ignored by ``update``
+    '''
+    __slots__ = ()
+    _members = {}
+    _defaults = ()
+
+    def __init__(self):
+        for member, default, factory in self._defaults:
+            member.__set__(self, default() if factory else default)
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, dict(self.items()))
+
+    def __getitem__(self, key):
+        try:
+            return self._members[key].__get__(self, None)
+        except (KeyError, AttributeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self._members:
+            raise KeyError(key)
+        self._members[key].__set__(self, value)
+
+    def __delitem__(self, key):
+        try:
+            self._members[key].__delete__(self)
+        except (KeyError, AttributeError):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        member = self._members.get(key)
+        if member is None:
+            return False
+        try:
+            member.__get__(self, None)
+        except AttributeError:
+            return False
+        return True
+
+    def __iter__(self):
+        return (key for key in self._members if key in self)
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def get(self, key, default=None):
+        member = self._members.get(key)
+        if member is None:
+            return default
+        try:
+            return member.__get__(self, None)
+        except AttributeError:
+            return default
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def update(self, data):
+        members = self._members
+        for key, value in data.items():
+            if key in members:
+                members[key].__set__(self, value)
+
+    def copy(self):
+        return dict(self.items())
+
+
+def _serialize_dependents(fields, serialize_methods):
+    ''' Maps every field to the names of the cached serialize methods whose results are invalidated when it changes '''
+    dependents = {name: [] for name in fields}
+    for method_name, func in serialize_methods.items():
+        if not getattr(func, '_serialize_cached_', False):
+            continue
+        depends_on = func._serialize_depends_on_
+        for name in (fields if depends_on is None else depends_on):
+            if name not in dependents:
+                raise AttributeError('Serialize method {} depends on unknown field {}'.format(method_name, name))
+            dependents[name].append(func.__name__)
+    return {name: tuple(methods) for name, methods in dependents.items() if methods}
+
+
+def _make_data_class(cls, fields):
+    '''
+    Generates the slotted data storage class of a model.
+    Slots are prefixed with ``s_`` since fields such as ``_id`` would otherwise produce private, name-mangled slots
+    '''
+    slots = tuple('s_' + name for name in fields)
+    data_class = type('{}Data'.format(cls.__name__), (SlottedData,), {'__slots__': slots})
+    data_class._members = {name: getattr(data_class, slot) for name, slot in zip(fields, slots)}
+    data_class._defaults = tuple(
+        (data_class._members[name], field._default, callable(field._default)) for name, field in fields.items()
+    )
+    return data_class
+
+
+# ------- compiled data functions ------- #
+#
+# ``ModelMeta`` resolves all per-field decisions (projection, ``export_if_none``, conversion
+# methods and defaults) once, when the model class is created, into a plan of tuples per model.
+# A step of ``None`` in a plan marks a field which opted out with ``compiled=False``.
+# Such fields go through the generic path, which reads the field's attributes on every call.
+
+
+def _compile_import(fields, trusted=False):
+    '''
+    Compiles the function used by ``import_data`` to coerce data to python types.
+    The function coerces all fields, or only the fields whose names are given.
+    Trusted imports coerce data which was validated before it was stored, without validating the models held by fields
+    '''
+    plan = []
+    for name, field in fields.items():
+        if field._compiled:
+            default = field._default
+            plan.append((name, field._import_trusted if trusted else field._import, default, callable(default)))
+        else:
+            plan.append((name, None, None, False))
+    plan = tuple(plan)
+    steps = {step[0]: step for step in plan}
+
+    def import_fields(instance, data, names=None):
+        if names is not None:
+            selected = [steps[name] for name in names if name in steps]
+        else:
+            selected = plan
+        for name, _import, default, factory in selected:
+            if _import is None:
+                field = fields[name]
+                _import = field._import_trusted if trusted else field._import
+                data[name] = _import(data.get(name)) or field.default
+                continue
+            value = _import(data.get(name))
+            if not value:
+                value = default() if factory else default
+            data[name] = value
+
+    return import_fields
+
+
+def _compile_field_import(field, trusted=True):
+    '''
+    Compiles the function used to coerce a single raw value of a field, such as the value of a lazily hydrated field.
+    Values are trusted by default, since they are read from a datastore, see ``BaseField._import_trusted``
+    '''
+    if not field._compiled:
+        if trusted:
+            return lambda value: field._import_trusted(value) or field.default
+        return lambda value: field._import(value) or field.default
+    _import, default = field._import_trusted if trusted else field._import, field._default
+    if callable(default):
+        return lambda value: _import(value) or default()
+    return lambda value: _import(value) or default
+
+
+def _compile_export(fields, native):
+    '''
+    Compiles the function used by ``export_data`` for the given export mode.
+    The function exports all fields, or only the fields whose names are given
+    '''
+    plan = []
+    for name, field in fields.items():
+        if field._compiled:
+            convert = field.to_python if native else field.to_data
+            plan.append((name, convert, field._export_if_none is False))
+        else:
+            plan.append((name, None, False))
+    plan = tuple(plan)
+    steps = {step[0]: step for step in plan}
+
+    def export(instance, data, names=None):
+        if names is not None:
+            selected = [steps[name] for name in names if name in steps]
+        else:
+            selected = plan
+        converted_data = {}
+        for name, convert, skip_none in selected:
+            value = data.get(name)
+            if convert is None:
+                field = fields[name]
+                if value is None and field._export_if_none is False:
+                    continue
+                converted_data[name] = field.to_python(value) if native else field.to_data(value)
+                continue
+            if value is None and skip_none:
+                continue
+            converted_data[name] = convert(value)
+        return converted_data
+
+    return export
+
+
+def _serialize_plan(fields, native):
+    ''' Resolves the conversion step of every serialized field for the given serialization mode '''
+    plan = []
+    for name, field in fields.items():
+        if not field._compiled:
+            plan.append((name, None, field.async_serialize, False))
+            continue
+        if field._projection == None:  # noqa E711
+            continue  # never serialized
+        if field.async_serialize:
+            convert, is_async = partial(field.serialize, native=native), True
+        elif type(field).serialize_sync is BaseField.serialize_sync:
+            convert, is_async = field.to_python if native else field.to_data, False
+        else:
+            convert, is_async = partial(field.serialize_sync, native=native), False
+        plan.append((name, convert, is_async, field._projection == True))  # noqa E712
+    return tuple(plan)
+
+
+def _compile_serialize(fields, serialize_methods, native):
+    '''
+    Compiles the function used by ``serialize`` for the given serialization mode.
+    Synchronous fields and serialize methods are executed inline, and only asynchronous ones are awaited.
+    The function serializes the instance's data, or the given data of a model without serialize methods
+    '''
+    plan = _serialize_plan(fields, native)
+    methods = tuple((name, func, getattr(func, '_serialize_async_', True))
+                    for name, func in serialize_methods.items())
+
+    async def serialize(instance, raw_data=None):
+        data = {}
+        if raw_data is None:
+            raw_data = instance._data
+        for name, convert, is_async, always in plan:
+            if convert is None:
+                field = fields[name]
+                if field._projection != None:  # noqa E711
+                    if is_async:
+                        field_data = await field.serialize(raw_data.get(name), native)
+                    else:
+                        field_data = field.serialize_sync(raw_data.get(name), native)
+                    if field_data:
+                        data[name] = field_data
+                    elif field._projection == True:  # noqa E712
+                        data[name] = None
+                continue
+            field_data = convert(raw_data.get(name))
+            if is_async:
+                field_data = await field_data
+            if field_data:
+                data[name] = field_data
+            elif always:
+                data[name] = None
+        # iterate through all serialize methods
+        for name, func, is_async in methods:
+            if is_async:
+                data[name] = await func(instance)
+            else:
+                data[name] = func(instance)
+        return data
+
+    return serialize
+
+
+def _compile_serialize_sync(fields, serialize_methods, native):
+    '''
+    Compiles the function used by ``serialize_sync`` for models without asynchronous parts.
+    The function serializes the instance's data, or the given data of a model without serialize methods
+    '''
+    plan = _serialize_plan(fields, native)
+    methods = tuple(serialize_methods.items())
+
+    def serialize_sync(instance, raw_data=None):
+        data = {}
+        if raw_data is None:
+            raw_data = instance._data
+        for name, convert, is_async, always in plan:
+            if convert is None:
+                field = fields[name]
+                if field._projection != None:  # noqa E711
+                    field_data = field.serialize_sync(raw_data.get(name), native)
+                    if field_data:
+                        data[name] = field_data
+                    elif field._projection == True:  # noqa E712
+                        data[name] = None
+                continue
+            field_data = convert(raw_data.get(name))
+            if field_data:
+                data[name] = field_data
+            elif always:
+                data[name] = None
+        for name, func in methods:
+            data[name] = func(instance)
+        return data
+
+    return serialize_sync
+
+
+def _json_plan(fields, serialize_methods):
+    ''' Resolves the encoded keys and conversion steps used for writing the model's serialized form as JSON '''
+    plan = []
+    for name, convert, is_async, always in _serialize_plan(fields, native=False):
+        # nested model instances are written directly by the nested model's JSON writer
+        nested = None
+        if convert is not None and not is_async:
+            nested = getattr(fields[name], '_model_class', None)
+        plan.append((name, json_key(name), convert, is_async, always, nested))
+    methods = tuple((json_key(name), func, getattr(func, '_serialize_async_', True))
+                    for name, func in serialize_methods.items())
+    return tuple(plan), methods
+
+
+def _write_json_nested(nested, value, buffer, separator, key, always):
+    ''' Writes a nested model instance and returns ``True`` if a member was written '''
+    start = len(buffer)
+    buffer += separator
+    buffer += key
+    nested._json_writer()(value, buffer)
+    if buffer[-2:] == b'{}':  # empty objects are omitted like other empty values
+        del buffer[start:]
+        if not always:
+            return False
+        buffer += separator
+        buffer += key
+        buffer += b'null'
+    return True
+
+
+def _write_json_extra(buffer, separator, extra):
+    for key, value in extra.items():
+        buffer += separator
+        buffer += json_key(key)
+        write_json(buffer, value)
+        separator = b','
+
+
+def _compile_serialize_json(fields, serialize_methods):
+    '''
+    Compiles the function used by ``serialize_json`` to write the serialized form of the model as JSON,
+    in primitive form, straight to a buffer without creating the intermediate ``dict``
+    '''
+    plan, methods = _json_plan(fields, serialize_methods)
+
+    async def serialize_json(instance, buffer, extra=None):
+        if instance._raw:
+            instance._materialize()
+        raw_data = instance._data
+        buffer += b'{'
+        separator = b''
+        for name, key, convert, is_async, always, nested in plan:
+            value = raw_data.get(name)
+            if convert is None:
+                field = fields[name]
+                if field._projection == None:  # noqa E711
+                    continue
+                if is_async:
+                    value = await field.serialize(value, False)
+                else:
+                    value = field.serialize_sync(value, False)
+                always = field._projection == True  # noqa E712
+            elif nested is not None and isinstance(value, nested):
+                if _write_json_nested(nested, value, buffer, separator, key, always):
+                    separator = b','
+                continue
+            elif is_async:
+                value = await convert(value)
+            else:
+                value = convert(value)
+            if value:
+                buffer += separator
+                buffer += key
+                write_json(buffer, value)
+            elif always:
+                buffer += separator
+                buffer += key
+                buffer += b'null'
+            else:
+                continue
+            separator = b','
+        for key, func, is_async in methods:
+            buffer += separator
+            buffer += key
+            write_json(buffer, (await func(instance)) if is_async else func(instance))
+            separator = b','
+        if extra:
+            _write_json_extra(buffer, separator, extra)
+        buffer += b'}'
+
+    return serialize_json
+
+
+def _compile_serialize_json_sync(fields, serialize_methods):
+    ''' Compiles the function used by ``serialize_json_sync`` for models without asynchronous parts '''
+    plan, methods = _json_plan(fields, serialize_methods)
+
+    def serialize_json_sync(instance, buffer, extra=None):
+        if instance._raw:
+            instance._materialize()
+        raw_data = instance._data
+        buffer += b'{'
+        separator = b''
+        for name, key, convert, is_async, always, nested in plan:
+            value = raw_data.get(name)
+            if convert is None:
+                field = fields[name]
+                if field._projection == None:  # noqa E711
+                    continue
+                value = field.serialize_sync(value, False)
+                always = field._projection == True  # noqa E712
+            elif nested is not None and isinstance(value, nested):
+                if _write_json_nested(nested, value, buffer, separator, key, always):
+                    separator = b','
+                continue
+            else:
+                value = convert(value)
+            if value:
+                buffer += separator
+                buffer += key
+                write_json(buffer, value)
+            elif always:
+                buffer += separator
+                buffer += key
+                buffer += b'null'
+            else:
+                continue
+            separator = b','
+        for key, func, is_async in methods:
+            buffer += separator
+            buffer += key
+            write_json(buffer, func(instance))
+            separator = b','
+        if extra:
+            _write_json_extra(buffer, separator, extra)
+        buffer += b'}'
+
+    return serialize_json_sync
+
+
+def _compile_validate(cls, fields):
+    '''
+    Compiles the function used by ``validate`` to validate all fields of the model.
+    Compiled fields with nothing to validate are left out of the plan.
+    The function validates all fields, or only the fields whose names are given
+    '''
+    plan = []
+    for name, field in fields.items():
+        if not field._compiled:
+            plan.append((name, None))
+        elif field.validator_chain:
+            plan.append((name, field.validator_chain))
+    plan = tuple(plan)
+    steps = dict(plan)
+
+    def validate(data, names=None):
+        if names is not None:
+            selected = [(name, steps[name]) for name in names if name in steps]
+        else:
+            selected = plan
+        name = None
+        try:
+            for name, validate in selected:
+                if validate is None:
+                    fields[name].validate(data.get(name))
+                else:
+                    validate(data.get(name))
+        except Exception as ex:
+            raise Exception('Failed to validate field "{}" model "{}"'.format(name, cls.__name__), ex)
+
+    return validate
+
+
+def import_and_validate(model_class, data_list, coerce=True):
+    '''
+    Imports and validates the values of the given fields, for every ``dict`` in the list, and returns the imported values.
+    Used for running the work of fields declared with ``offload=True`` in the model's ``validation_executor``,
+    so it is a module level function which process pools can send to their workers
+
+    :param coerce:
+        Determines if the values are coerced to python types before they are validated.
+        Set to ``False`` for values which were already imported
+    '''
+    importers = model_class._field_validating_importers
+    validate = model_class._validate_fields
+    result = []
+    for data in data_list:
+        if coerce:
+            data = {name: importers[name](value) for name, value in data.items()}
+        validate(data, list(data))
+        result.append(data)
+    return result
+
+
+async def _validated(data, names=None):
+    ''' The asynchronous validation of models without asynchronous validators '''
+
+
+def _compile_validate_async(cls, fields):
+    '''
+    Compiles the function used by ``validate_async`` to run the asynchronous validators of the model's fields concurrently.
+    Returns ``None`` if no field has asynchronous validators.
+    Fields which are not compiled are always included, since their validators can change
+    '''
+    plan = tuple((name, field) for name, field in fields.items() if not field._compiled or field.async_validators)
+    if len(plan) == 0:
+        return None
+
+    async def check(name, coroutine):
+        try:
+            await coroutine
+        except Exception as ex:
+            raise Exception('Failed to validate field "{}" model "{}"'.format(name, cls.__name__), ex)
+
+    async def validate(data, names=None):
+        selected = plan if names is None else [(name, field) for name, field in plan if name in names]
+        checks = [
+            check(name, validator(data.get(name)))
+            for name, field in selected for validator in field.async_validators
+        ]
+        if len(checks) == 0:
+            return
+        # all checks complete before the first error is raised, so none is left running
+        for result in await asyncio.gather(*checks, return_exceptions=True):
+            if isinstance(result, Exception):
+                raise result
+
+    return validate
+
+
 class ModelSerializer(object):
     '''
     Mixin class for adding nonblocking serialization methods.
@@ -134,34 +777,119 @@ class ModelSerializer(object):
     async def serialize(self, native=False):
         '''
         Returns a serialized from of the model taking into account projection rules and ``@serialize`` decorated methods.
-        
+        Models without asynchronous fields or serialize methods are serialized inline using ``serialize_sync``
+
         :param native:
             Deternines if data is serialized to Python native types or primitive form. Defaults to ``False``
         '''
-        data = {}
-        # iterate through all fields
-        for field_name, field in self._fields.items():
-            # serialize field data
-            raw_data = self._data.get(field_name)
-            # add field's data to model data based on projection settings
-            if field._projection != None:  # noqa E711
-                field_data = await field.serialize(raw_data, native)
-                if field_data:
-                    data[field_name] = field_data
-                elif field._projection == True: # noqa E711
-                    data[field_name] = None
-
-        # iterate through all export methods
-        for name, func in self._serialize_methods.items():
-            data[name] = await func(self)
-        return data
+        if not self._async_serialize:
+            return self.serialize_sync(native)
+        if self._raw:
+            self._materialize()
+        if native:
+            return await self._serialize_native()
+        return await self._serialize_primitive()
+
+    def serialize_sync(self, native=False):
+        '''
+        Synchronous form of ``serialize``.
+        Available only for models where no field and no ``@serialize`` decorated method is a coroutine
+
+        :param native:
+            Deternines if data is serialized to Python native types or primitive form. Defaults to ``False``
+        '''
+        if self._async_serialize:
+            raise TypeError('Model {} has asynchronous fields or serialize methods. Use serialize instead'.format(
+                self.__class__.__name__))
+        if self._raw:
+            self._materialize()
+        if native:
+            return self._serialize_sync_native()
+        return self._serialize_sync_primitive()
+
+    @classmethod
+    async def serialize_many(cls, objects, native=False):
+        '''
+        Serializes a list of model instances.
+        Serializes inline when the model has no asynchronous parts and concurrently otherwise
+        '''
+        if not cls._async_serialize:
+            return [obj.serialize_sync(native) for obj in objects]
+        return await asyncio.gather(*[obj.serialize(native) for obj in objects])
+
+    @classmethod
+    def _json_writer(cls):
+        '''
+        Returns the function which writes the model's serialized form as JSON.
+        The function is compiled on first use, since it is needed only by models which are encoded to JSON
+        '''
+        writer = cls.__dict__.get('_write_json')
+        if writer is None:
+            if cls._async_serialize:
+                writer = _compile_serialize_json(cls._fields, cls._serialize_methods)
+            else:
+                writer = _compile_serialize_json_sync(cls._fields, cls._serialize_methods)
+            setattr(cls, '_write_json', writer)
+        return writer
+
+    async def serialize_json(self, extra=None):
+        '''
+        Returns the serialized form of the model encoded as JSON, in primitive form.
+        The result is equivalent to encoding the output of ``serialize`` with ``json.dumps``,
+        but it is written straight to a bytes buffer, using keys which are encoded when the model's JSON writer is compiled.
+        Returns ``RawJSON``, a ``bytes`` object which can be embedded into data encoded with ``tbone.data.encoders.encode_json``
+
+        :param extra:
+            An optional ``dict`` of additional members to add to the encoded object
+        '''
+        buffer = bytearray()
+        if self._async_serialize:
+            await self._json_writer()(self, buffer, extra)
+        else:
+            self._json_writer()(self, buffer, extra)
+        return RawJSON(buffer)
+
+    def serialize_json_sync(self, extra=None):
+        '''
+        Synchronous form of ``serialize_json``.
+        Available only for models where no field and no ``@serialize`` decorated method is a coroutine
+        '''
+        if self._async_serialize:
+            raise TypeError('Model {} has asynchronous fields or serialize methods. Use serialize_json instead'.format(
+                self.__class__.__name__))
+        buffer = bytearray()
+        self._json_writer()(self, buffer, extra)
+        return RawJSON(buffer)
+
+    @classmethod
+    async def serialize_json_many(cls, objects, extra=None):
+        '''
+        Serializes a list of model instances to a JSON array. See ``serialize_json``
+
+        :param extra:
+            An optional callable which receives a model instance and returns a ``dict`` of additional members
+            to add to the instance's encoded object
+        '''
+        writer = cls._json_writer()
+        buffer = bytearray(b'[')
+        if cls._async_serialize:
+            encoded = await asyncio.gather(*[obj.serialize_json(extra(obj) if extra else None) for obj in objects])
+            buffer += b','.join(encoded)
+        else:
+            separator = b''
+            for obj in objects:
+                buffer += separator
+                writer(obj, buffer, extra(obj) if extra else None)
+                separator = b','
+        buffer += b']'
+        return RawJSON(buffer)
 
     async def deserialize(self, data: dict, silent=True):
         '''
         Deserializes a Python ``dict`` into the model by assigning values to their respective fields.
         Ignores data attributes that do not match one of the Model's fields.
         Ignores data attributes who's matching fields are declared with the ``readonly`` attribute
-        Validates the data after import.
+        Validates the data after import. If the model already holds imported data, only the incoming fields are validated.
         Override in sub classes to modify or add to deserialization behavior
 
         :param data:
@@ -173,8 +901,27 @@ class ModelSerializer(object):
         :type silent:
             ``bool``
         '''
-        self.import_data(self. _deserialize(data))
-        self.validate()
+        data = self._deserialize(data)
+        # instances which were already imported validate only the incoming fields
+        fields = None if self._dirty is None else list(data)
+        if not self._offload_fields:
+            self.import_data(data)
+            self.validate(fields)
+            return
+        supplied = [name for name in self._offload_fields if name in data]
+        # the first import validates all fields, including offloaded fields which were not supplied
+        offloaded = {
+            name: data.pop(name, None) for name in self._offload_fields
+            if fields is None or name in data
+        }
+        self.import_data(data)
+        self._validate_inline(self._data, fields)
+        if offloaded:
+            imported = (await self._run_offloaded([offloaded]))[0]
+            self._data.update(imported)
+            self._dirty.update(supplied)
+            if self._serialize_cache:
+                self._invalidate_serialized(imported)
 
     def _deserialize(self, data: dict, silent=True) -> dict:
         ''' Internal deserialize method for sifting out unacceptable data for the model '''
@@ -200,12 +947,113 @@ class Model(ModelSerializer, metaclass=ModelMeta):
 
     '''
 
+    _raw = None  # raw values pending conversion in lazily hydrated instances
+    _dirty = None  # names of fields modified since the instance was created or loaded, None before the first import
+    _serialize_cache = None  # results of cached serialize methods, created on first use
+
     def __init__(self, data={}, **kwargs):
-        self._data = {}
+        self._data = self._data_class()
         if bool(data):
             self.import_data(data)
             self.validate()
 
+    @classmethod
+    def from_raw(cls, data: dict):
+        '''
+        Creates a model instance which keeps the raw values of the given data and converts them to python types
+        only when a field is first accessed, or when the instance is serialized, exported or validated.
+        The instance is created without calling ``__init__`` and is not validated.
+        Used by persistency mixins for models declared with the ``lazy_hydration`` option
+        '''
+        instance = cls.__new__(cls)
+        instance._data = cls._data_class()
+        instance._raw = {name: data.get(name) for name in cls._fields}
+        instance._dirty = set()
+        return instance
+
+    @classmethod
+    def from_db(cls, data: dict):
+        '''
+        Creates a model instance from a document read from the datastore.
+        The data is coerced to python types, but the instance is validated only if the model
+        is declared with the ``validate_on_load`` option, since data is validated before it is saved.
+        Keys which do not match one of the model's fields are ignored.
+        '''
+        return cls.from_many([data], validate=cls._meta.validate_on_load)[0]
+
+    @classmethod
+    def from_many(cls, data_list, validate=True):
+        '''
+        Creates a list of model instances from a list of ``dict`` objects in a single pass.
+        Each field is coerced across all items at once and the given dictionaries are not modified.
+        Keys which do not match one of the model's fields are ignored.
+        Instances are created without calling ``__init__``.
+        Models declared with the ``lazy_hydration`` option are created with ``from_raw`` if they are not validated,
+        since validation requires all fields to be imported
+
+        :param data_list:
+            A list of ``dict`` objects, such as documents returned by a datastore query
+        :param validate:
+            Determines if the instances are validated after import. Default is ``True``
+        '''
+        if cls._meta.lazy_hydration and not validate:
+            return [cls.from_raw(data) for data in data_list]
+        new, data_class = cls.__new__, cls._data_class
+        instances = []
+        for i in range(len(data_list)):
+            instance = new(cls)
+            instance._data = data_class()
+            instance._dirty = set()
+            instances.append(instance)
+        pairs = [(instance._data, data) for instance, data in zip(instances, data_list)]
+        # models held by fields are validated with the instances, and are otherwise trusted
+        importers = cls._field_validating_importers if validate else cls._field_importers
+        for name, importer in importers.items():
+            for instance_data, data in pairs:
+                instance_data[name] = importer(data.get(name))
+        if validate:
+            validate_fields = cls._validate_fields
+            for instance in instances:
+                validate_fields(instance._data)
+        return instances
+
+    @classmethod
+    def _from_native(cls, data: dict):
+        '''
+        Creates a model instance from data in native form, which was validated when it was imported,
+        such as the data held by ``ModelField`` in lists and dictionaries. The instance is not validated again
+        '''
+        if cls._meta.lazy_hydration:
+            return cls.from_raw(data)
+        instance = cls.__new__(cls)
+        instance._data = cls._data_class()
+        instance._data.update(data)
+        instance._import_fields_trusted(instance._data)
+        instance._dirty = set()
+        return instance
+
+    def _cache_serialized(self, name, value):
+        ''' Stores the result of a cached serialize method '''
+        if self._serialize_cache is None:
+            self._serialize_cache = {}
+        self._serialize_cache[name] = value
+
+    def _invalidate_serialized(self, names):
+        ''' Discards the results of cached serialize methods which depend on the given fields '''
+        cache = self._serialize_cache
+        dependents = self._serialize_dependents
+        for name in names:
+            for method_name in dependents.get(name, ()):
+                cache.pop(method_name, None)
+
+    def _materialize(self):
+        ''' Converts all raw values still pending in a lazily hydrated instance to python types '''
+        raw, self._raw = self._raw, None
+        data = self._data
+        importers = self._field_importers
+        for name, value in raw.items():
+            data[name] = importers[name](value)
+
     def __repr__(self):
         desc = self.description()
         if desc is None:
@@ -214,6 +1062,8 @@ class Model(ModelSerializer, metaclass=ModelMeta):
 
     def __iter__(self):
         ''' Implements iterator on model matching only fields with data matching them '''
+        if self._raw:
+            self._materialize()
         return (key for key in self._fields if key in self._data)
 
     def __eq__(self, other):
@@ -241,53 +1091,142 @@ class Model(ModelSerializer, metaclass=ModelMeta):
         return iter(cls._fields)
 
     def items(self):
+        if self._raw:
+            self._materialize()
         return [(field, self._data[field]) for field in self]
 
     @classmethod
-    def _validate(cls, data):
-        try:
-            for name, field in cls._fields.items():
-                field.validate(data.get(name))
-        except Exception as ex:
-            raise Exception('Failed to validate field "{}" model "{}"'.format(name, cls.__name__), ex)
+    def _validate(cls, data, fields=None):
+        cls._validate_fields(data, fields)
 
-    def validate(self):
+    def validate(self, fields=None):
         '''
         Performs model data validation by iterating through all model fields
         and validating the field's data according to the field's internal validation rules or
         validation methods provided during model declaration
+
+        :param fields:
+            An optional list of field names to validate. By default all fields are validated
         '''
-        self._validate(self._data)
+        if self._raw:
+            self._materialize()
+        self._validate(self._data, fields)
 
-    def _convert(self, data, native):
-        converted_data = {}
-        for name, field in self._fields.items():
-            value = data.get(name)
-            if value is None and field._export_if_none is False:
-                continue
-            if native is True:
-                conversion_func = field.to_python
-            else:
-                conversion_func = field.to_data
-            converted_data[name] = conversion_func(value)
-        return converted_data
+    @classmethod
+    async def _validate_async(cls, data, fields=None):
+        if cls._offload_fields:
+            await cls._validate_many_async([data], fields)
+            return
+        cls._validate_fields(data, fields)
+        await cls._validate_fields_async(data, fields)
+
+    @classmethod
+    def _validate_inline(cls, data, fields=None):
+        ''' Validates the fields which are not offloaded to the model's validation executor '''
+        names = cls._fields if fields is None else fields
+        cls._validate_fields(data, [name for name in names if name not in cls._offload_fields])
+
+    @classmethod
+    async def _run_offloaded(cls, data_list, coerce=True):
+        ''' Runs ``import_and_validate`` for the given list of offloaded field values in the model's validation executor '''
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(cls._meta.validation_executor, import_and_validate, cls, data_list, coerce)
+
+    @classmethod
+    async def _validate_many_async(cls, data_list, fields=None):
+        if cls._offload_fields:
+            offloaded = []
+            for data in data_list:
+                cls._validate_inline(data, fields)
+                names = cls._offload_fields if fields is None else cls._offload_fields.intersection(fields)
+                offloaded.append({name: data.get(name) for name in names})
+            if any(offloaded):
+                await cls._run_offloaded(offloaded, coerce=False)
+        else:
+            for data in data_list:
+                cls._validate_fields(data, fields)
+        if cls._has_async_validators:
+            results = await asyncio.gather(*[cls._validate_fields_async(data, fields) for data in data_list],
+                                           return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+    async def validate_async(self, fields=None):
+        '''
+        Validates the model like ``validate``, and then runs the asynchronous validators of all fields concurrently.
+        Asynchronous validators perform checks which require I/O, such as lookups in the database.
+        The synchronous validators of all fields run first, so asynchronous validators receive values which passed them
+
+        :param fields:
+            An optional list of field names to validate. By default all fields are validated
+        '''
+        if self._raw:
+            self._materialize()
+        await self._validate_async(self._data, fields)
+
+    async def run_async_validators(self, fields=None):
+        '''
+        Runs only the asynchronous validators of the model's fields concurrently,
+        for data which already passed the synchronous validators, such as data imported with ``deserialize``
+
+        :param fields:
+            An optional list of field names to validate. By default all fields are validated
+        '''
+        if self._raw:
+            self._materialize()
+        await self._validate_fields_async(self._data, fields)
+
+    @classmethod
+    async def validate_many_async(cls, objects, fields=None):
+        '''
+        Validates a list of model instances with ``validate_async``.
+        Fields declared with ``offload=True`` are validated for all instances in a single call to the model's
+        ``validation_executor``, and the asynchronous validators of all instances run concurrently
+
+        :param fields:
+            An optional list of field names to validate. By default all fields are validated
+        '''
+        for obj in objects:
+            if obj._raw:
+                obj._materialize()
+        await cls._validate_many_async([obj._data for obj in objects], fields)
+
+    def _convert(self, data, native, fields=None):
+        if native is True:
+            return self._export_native(data, fields)
+        return self._export_primitive(data, fields)
 
     def import_data(self, data: dict):
         '''
         Imports data into model and converts to python form.
         Model fields and container of model fields retain their model class structure.
-        Merges with existing if data is partial
+        Merges with existing if data is partial.
+        The first import converts all fields. Later imports convert only the fields present in the data,
+        and their names are added to the instance's set of dirty fields, along with fields assigned directly
         '''
         if not isinstance(data, dict):
             raise ValueError('Cannot import data not as dict')
+        if self._raw:
+            self._materialize()
+        if self._serialize_cache:
+            self._invalidate_serialized(data)
         self._data.update(data)
+        if self._dirty is None:
+            self._import_fields(self._data)
+            self._dirty = set(name for name in data if name in self._fields)
+        else:
+            self._import_fields(self._data, data)
+            self._dirty.update(name for name in data if name in self._fields)
 
-        for name, field in self._fields.items():
-            self._data[name] = field._import(self._data.get(name)) or field.default
-
-    def export_data(self, native=True):
+    def export_data(self, native=True, fields=None):
         '''
         Export the model into a dictionary.
         This method does not include projection rules and export methods
+
+        :param fields:
+            An optional list of field names to export. By default all fields are exported
         '''
-        return self._convert(self._data, native)
+        if self._raw:
+            self._materialize()
+        return self._convert(self._data, native, fields)
@@ -4,13 +4,13 @@
 import os
 import time
 import logging
-from pymongo.errors import ConnectionFailure
-from motor.motor_asyncio import AsyncIOMotorClient
 
 logger = logging.getLogger(__file__)
 
 
 def _get_client(**kwargs):
+    # the driver is imported when connecting, so importing tbone.db does not load it
+    from motor.motor_asyncio import AsyncIOMotorClient
     url = os.environ.get('DATABASE_URL', None)
     if url is None:
         url = 'mongodb://{cred}{host}:{port}{extra}'.format(
@@ -25,6 +25,7 @@ def _get_client(**kwargs):
 
 
 def connect(**kwargs):
+    from pymongo.errors import ConnectionFailure
     db = None
     for i in range(kwargs['connection_retries'] + 1):
         try:
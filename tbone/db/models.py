@@ -3,10 +3,12 @@
 
 import logging
 import asyncio
+from collections import namedtuple, deque
 from datetime import timedelta
 from bson.objectid import ObjectId
+from bson.son import SON
 from pymongo.errors import *
-from pymongo import ReturnDocument
+from pymongo import ASCENDING, ReturnDocument, InsertOne, ReplaceOne, UpdateOne, DeleteOne
 from tbone.dispatch import Signal
 
 
@@ -14,6 +16,83 @@ logger = logging.getLogger(__file__)
 
 pre_save = Signal()
 post_save = Signal()
+post_bulk_save = Signal()
+
+BulkInsert = namedtuple('BulkInsert', 'instance')
+BulkInsert.__doc__ = 'Bulk write operation which inserts a model instance as a new document'
+BulkReplace = namedtuple('BulkReplace', 'instance')
+BulkReplace.__doc__ = 'Bulk write operation which replaces the document matching the primary key of a model instance with its data'
+BulkUpdate = namedtuple('BulkUpdate', 'key, data')
+BulkUpdate.__doc__ = 'Bulk write operation which sets the given fields of the document matching the primary key, using ``$set``'
+BulkDelete = namedtuple('BulkDelete', 'key')
+BulkDelete.__doc__ = 'Bulk write operation which deletes the document matching the primary key'
+
+
+class ModelIterator(object):
+    '''
+    Asynchronous iterator over the model instances of the documents matching a query, returned by ``MongoCollectionMixin.iterate``.
+    Documents are fetched from the cursor in batches and models are created one batch at a time,
+    so only a single batch is held in memory regardless of the size of the result set.
+    If the connection fails, the query is sent again, skipping the documents which were already fetched.
+    Documents are sorted by ``_id`` after the given sort, so they keep their positions when the query is sent again
+    '''
+    def __init__(self, model_class, db, query={}, projection=None, sort=[], batch_size=None):
+        self.model_class = model_class
+        self.db = db
+        self.query = query
+        self.projection = projection
+        # the natural order of documents may change between queries, so ``_id`` is added as tie-breaker
+        self.sort = list(sort or [])
+        if '_id' not in [key for key, order in self.sort]:
+            self.sort.append(('_id', ASCENDING))
+        self.batch_size = batch_size or model_class._meta.iterate_batch_size
+        self._cursor = None
+        self._models = deque()
+        self._fetched = 0
+        self._exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._models:
+            if self._exhausted:
+                raise StopAsyncIteration
+            await self._fetch_batch()
+            if not self._models:
+                raise StopAsyncIteration
+        return self._models.popleft()
+
+    async def _fetch_batch(self):
+        documents = []
+        for i in self.model_class.connection_retries():
+            try:
+                if self._cursor is None:
+                    self._cursor = self.model_class.get_cursor(self.db, self.query, self.projection, self.sort)
+                    self._cursor.skip(self._fetched + len(documents))
+                    self._cursor.batch_size(self.batch_size)
+                async for document in self._cursor:
+                    documents.append(document)
+                    if len(documents) == self.batch_size:
+                        break
+                else:
+                    self._exhausted = True
+                break
+            except ConnectionFailure as ex:
+                self._cursor = None
+                exceed = await self.model_class.check_reconnect_tries_and_wait(i, 'iterate')
+                if exceed:
+                    raise ex
+        self._fetched += len(documents)
+        self._models.extend(self.model_class.create_models(documents))
+
+    async def close(self):
+        ''' Closes the cursor of an iteration which is stopped before all documents are fetched '''
+        self._exhausted = True
+        self._models.clear()
+        if self._cursor is not None:
+            await self._cursor.close()
+            self._cursor = None
 
 
 class MongoCollectionMixin(object):
@@ -68,16 +147,62 @@ class MongoCollectionMixin(object):
             await asyncio.sleep(timeout)
 
     @classmethod
-    async def count(cls, db, filters={}):
+    async def count(cls, db, filters={}, limit=None):
+        '''
+        Returns the number of documents matching the filters
+
+        :param limit:
+            An optional maximum number of documents to count. Counting stops once the limit is reached
+        '''
+        kwargs = {} if limit is None else {'limit': limit}
         for i in cls.connection_retries():
             try:
-                result = await db[cls.get_collection_name()].count_documents(filters)
+                result = await db[cls.get_collection_name()].count_documents(filters, **kwargs)
                 return result
             except ConnectionFailure as ex:
                 exceed = await cls.check_reconnect_tries_and_wait(i, 'count')
                 if exceed:
                     raise ex
 
+    @classmethod
+    async def estimated_count(cls, db):
+        ''' Returns the number of documents in the collection, read from the collection's metadata without scanning it '''
+        for i in cls.connection_retries():
+            try:
+                return await db[cls.get_collection_name()].estimated_document_count()
+            except ConnectionFailure as ex:
+                exceed = await cls.check_reconnect_tries_and_wait(i, 'estimated_count')
+                if exceed:
+                    raise ex
+
+    @classmethod
+    async def find_documents_with_count(cls, db, query={}, sort=[], skip=0, limit=0):
+        '''
+        Returns a page of the documents matching the query, along with the number of all matching documents,
+        using a single ``$facet`` aggregation
+        '''
+        page = []
+        if sort:
+            page.append({'$sort': SON(sort)})
+        page.append({'$skip': skip})
+        if limit:
+            page.append({'$limit': limit})
+        pipeline = [
+            {'$match': cls.process_query(query)},
+            {'$facet': {'documents': page, 'count': [{'$count': 'count'}]}}
+        ]
+        for i in cls.connection_retries():
+            try:
+                result = await db[cls.get_collection_name()].aggregate(pipeline).to_list(length=None)
+                break
+            except ConnectionFailure as ex:
+                exceed = await cls.check_reconnect_tries_and_wait(i, 'find_documents_with_count')
+                if exceed:
+                    raise ex
+        facets = result[0] if result else {}
+        count = facets.get('count')
+        return facets.get('documents', []), count[0]['count'] if count else 0
+
     @classmethod
     async def find_one(cls, db, query):
         result = None
@@ -113,19 +238,46 @@ class MongoCollectionMixin(object):
                 return result
 
     @classmethod
-    async def find(cls, cursor):
-        result = None
+    async def find_documents(cls, cursor):
+        ''' Returns the documents matched by the given cursor, without creating model instances '''
         for i in cls.connection_retries():
             try:
-                result = await cursor.to_list(length=None)
-                for i in range(len(result)):
-                    result[i] = cls.create_model(result[i])
-                return result
+                return await cursor.to_list(length=None)
             except ConnectionFailure as e:
                 exceed = await cls.check_reconnect_tries_and_wait(i, 'find')
                 if exceed:
                     raise e
 
+    @classmethod
+    async def find(cls, cursor, batch=False):
+        '''
+        Returns the model instances of the documents matched by the given cursor
+
+        :param batch:
+            Determines if the documents are returned as a columnar ``ModelBatch`` rather than a list of model instances.
+            Default is ``False``
+        '''
+        result = await cls.find_documents(cursor)
+        if batch:
+            # batches are opt-in, and may import numpy
+            from tbone.data.batch import ModelBatch
+            return ModelBatch.from_many(cls, result, validate=cls._meta.validate_on_load)
+        return cls.create_models(result)
+
+    @classmethod
+    def iterate(cls, db, query={}, projection=None, sort=[], batch_size=None):
+        '''
+        Returns an asynchronous iterator over the model instances of the documents matching the query,
+        creating the models batch by batch as the documents are fetched, instead of loading the entire result set like ``find``::
+
+            async for book in Book.iterate(db, {'language': 'en'}, batch_size=200):
+                ...
+
+        :param batch_size:
+            The number of documents fetched in every batch. Defaults to the model's ``iterate_batch_size`` option
+        '''
+        return ModelIterator(cls, db, query, projection, sort, batch_size)
+
     @classmethod
     async def distinct(cls, db, key):
         for i in cls.connection_retries():
@@ -160,21 +312,154 @@ class MongoCollectionMixin(object):
                 if exceed:
                     raise ex
 
+    @classmethod
+    async def insert_many(cls, db, objects, ordered=True, batch_size=None, validate=True):
+        '''
+        Inserts a list of model instances with ``bulk_write``, assigning the ``_id`` of every inserted instance.
+        Returns the combined result of all batches
+        '''
+        return await cls.bulk_write(db, [BulkInsert(obj) for obj in objects], ordered=ordered, batch_size=batch_size,
+                                    validate=validate)
+
+    @classmethod
+    async def bulk_write(cls, db, operations, ordered=True, batch_size=None, validate=True):
+        '''
+        Performs a list of write operations, sending them to the database in batches.
+        Operations are ``BulkInsert``, ``BulkReplace``, ``BulkUpdate`` and ``BulkDelete``.
+        The model instances and update data of every batch are validated before the batch is written,
+        and a single ``post_bulk_save`` signal is sent for the operations written by every batch.
+        Returns the combined result of all batches, in the form of ``pymongo``'s ``BulkWriteResult.bulk_api_result``
+
+        :param db:
+            Handle to the MongoDB database
+
+        :param ordered:
+            Determines if the operations are performed in order, stopping at the first failed operation.
+            Otherwise all operations are attempted, and the errors of all batches are raised when they are done.
+            In both cases a ``BulkWriteError`` is raised, and the index of every write error refers to the given list.
+            Default is ``True``
+
+        :param batch_size:
+            The number of operations sent in every batch. Defaults to the model's ``bulk_batch_size`` option
+
+        :param validate:
+            Determines if the batches are validated before they are written.
+            Set to ``False`` for operations which the caller already validated. Default is ``True``
+        '''
+        batch_size = batch_size or cls._meta.bulk_batch_size
+        operations = list(operations)
+        collection = db[cls.get_collection_name()]
+        summary = {'nInserted': 0, 'nMatched': 0, 'nModified': 0, 'nRemoved': 0, 'nUpserted': 0, 'writeErrors': []}
+        for offset in range(0, len(operations), batch_size):
+            batch = operations[offset:offset + batch_size]
+            requests, documents = await cls._bulk_requests(batch, validate)
+            try:
+                result = (await cls._bulk_write_batch(collection, requests, ordered)).bulk_api_result
+            except BulkWriteError as ex:
+                result = ex.details
+            errors = result.get('writeErrors') or []
+            for key in ('nInserted', 'nMatched', 'nModified', 'nRemoved', 'nUpserted'):
+                summary[key] += result.get(key, 0)
+            summary['writeErrors'].extend(dict(error, index=error['index'] + offset) for error in errors)
+            failed = set(error['index'] for error in errors)
+            if ordered and failed:
+                batch = batch[:min(failed)]
+            cls._bulk_written(db, batch, documents, failed)
+            if ordered and failed:
+                break
+        if summary['writeErrors']:
+            raise BulkWriteError(summary)
+        return summary
+
+    @classmethod
+    async def _bulk_requests(cls, batch, validate=True):
+        '''
+        Validates the operations of a batch and returns their ``pymongo`` write requests,
+        along with the inserted documents, which receive their ``_id`` when they are written
+        '''
+        instances = [op.instance for op in batch if isinstance(op, (BulkInsert, BulkReplace))]
+        if instances and validate:
+            await cls.validate_many_async(instances)
+        requests = []
+        documents = []
+        for op in batch:
+            document = None
+            if isinstance(op, BulkInsert):
+                document = op.instance.prepare_data()
+                requests.append(InsertOne(document))
+            elif isinstance(op, BulkReplace):
+                if op.instance.pk is None:
+                    raise Exception('Missing object primary key')
+                requests.append(ReplaceOne({cls.primary_key: op.instance.pk}, op.instance.prepare_data()))
+            elif isinstance(op, BulkUpdate):
+                if validate:
+                    await cls._validate_async(op.data, list(op.data))
+                requests.append(UpdateOne({cls.primary_key: op.key}, {'$set': op.data}))
+            elif isinstance(op, BulkDelete):
+                requests.append(DeleteOne({cls.primary_key: op.key}))
+            else:
+                raise TypeError('Unsupported bulk write operation {}'.format(op))
+            documents.append(document)
+        return requests, documents
+
+    @classmethod
+    async def _bulk_write_batch(cls, collection, requests, ordered):
+        for i in cls.connection_retries():
+            try:
+                return await collection.bulk_write(requests, ordered=ordered)
+            except ConnectionFailure as ex:
+                exceed = await cls.check_reconnect_tries_and_wait(i, 'bulk_write')
+                if exceed:
+                    raise ex
+
+    @classmethod
+    def _bulk_written(cls, db, batch, documents, failed):
+        ''' Updates the instances of the operations written by a batch, and sends a single ``post_bulk_save`` signal for them '''
+        written = {'inserted': [], 'replaced': [], 'updated': [], 'deleted': []}
+        for index, op in enumerate(batch):
+            if index in failed:
+                continue
+            if isinstance(op, BulkInsert):
+                op.instance._id = documents[index]['_id']
+                op.instance._db = db
+                op.instance._dirty = set()
+                written['inserted'].append(op.instance)
+            elif isinstance(op, BulkReplace):
+                op.instance._db = db
+                op.instance._dirty = set()
+                written['replaced'].append(op.instance)
+            elif isinstance(op, BulkUpdate):
+                written['updated'].append(op.key)
+            else:
+                written['deleted'].append(op.key)
+        if any(written.values()):
+            asyncio.ensure_future(post_bulk_save.send(sender=cls, db=db, **written))
+
     @classmethod
     def create_model(cls, data: dict, fields=None):
         '''
-        Creates model instance from data (dict).
+        Creates model instance from data (dict) read from the database.
+        The instance is not validated, unless the model is declared with the ``validate_on_load`` option.
+        Models declared with the ``lazy_hydration`` option keep the raw data and convert fields on first access
         '''
-        if fields is None:
-            fields = set(cls._fields.keys())
-        else:
-            if not isinstance(fields, set):
-                fields = set(fields)
-        new_keys = set(data.keys()) - fields
-        if new_keys:
-            for new_key in new_keys:
-                del data[new_key]
-        return cls(data)
+        if fields is not None:
+            data = {key: value for key, value in data.items() if key in fields}
+        return cls.from_db(data)
+
+    @classmethod
+    def create_models(cls, data_list: list, fields=None):
+        '''
+        Creates model instances from a list of documents in a single pass, without modifying the documents.
+        Document keys which do not match the model's fields are ignored.
+        Like ``create_model``, instances are validated only if the model is declared with the ``validate_on_load`` option.
+
+        :param fields:
+            An optional subset of the model's fields to import from the documents
+        '''
+        if fields is not None:
+            fields = set(fields)
+            data_list = [{key: value for key, value in data.items() if key in fields} for data in data_list]
+        return cls.from_many(data_list, validate=cls._meta.validate_on_load)
 
     def prepare_data(self, data=None):
         '''
@@ -195,13 +480,14 @@ class MongoCollectionMixin(object):
         self._db = db or self.db
         data = self.prepare_data()
         # validate object
-        self.validate()
+        await self.validate_async()
         # connect to DB to save the model
         for i in self.connection_retries():
             try:
                 created = False if '_id' in data else True
                 result = await self.db[self.get_collection_name()].insert_one(data)
                 self._id = result.inserted_id
+                self._dirty = set()
                 # emit post save
                 asyncio.ensure_future(post_save.send(
                     sender=self.__class__,
@@ -223,12 +509,13 @@ class MongoCollectionMixin(object):
         self._db = db or self.db
         data = self.prepare_data()
         # validate object
-        self.validate()
+        await self.validate_async()
         for i in self.connection_retries():
             try:
                 created = False if '_id' in data else True
                 result = await db[self.get_collection_name()].insert_one(data)
                 self._id = result.inserted_id
+                self._dirty = set()
                 # emit post save
                 asyncio.ensure_future(post_save.send(
                     sender=self.__class__,
@@ -242,10 +529,18 @@ class MongoCollectionMixin(object):
                 if exceed:
                     raise ex
 
-    async def update(self, db=None, data=None):
+    async def update(self, db=None, data=None, partial=False):
         '''
         Update the entire document by replacing its content with new data, retaining its primary key
+
+        :param data:
+            Optional data to merge into the model before updating
+        :param partial:
+            Updates only the fields modified since the model was loaded or saved, using ``$set`` and ``$unset``
+            instead of replacing the document. See ``save_changes``
         '''
+        if partial:
+            return await self._update_changes(db, data)
         db = db or self.db
         if data:  # update model explicitely with a new data structure
             # merge the current model's data with the new data
@@ -284,6 +579,59 @@ class MongoCollectionMixin(object):
                 if exceed:
                     raise ex
 
+    async def save_changes(self, db=None):
+        '''
+        Updates the document with the fields modified since the model was loaded or saved,
+        using ``$set`` for modified values and ``$unset`` for values which are no longer exported.
+        Modified fields are validated before the update.
+        Returns the updated model, or the model itself if no fields were modified.
+        Changes made inside nested models are not tracked, assign the nested model to its field to include it
+        '''
+        return await self._update_changes(db)
+
+    async def _update_changes(self, db=None, data=None):
+        db = db or self.db
+        if data:
+            self.import_data(data)
+        dirty = [name for name in (self._dirty or ()) if name != self.primary_key]
+        if len(dirty) == 0:
+            return self
+        if self.pk is None:
+            raise Exception('Missing object primary key')
+        await self.validate_async(dirty)
+        exported = self.export_data(native=True, fields=dirty)
+        update = {}
+        if exported:
+            update['$set'] = exported
+        unset = {name: '' for name in dirty if name not in exported}
+        if unset:
+            update['$unset'] = unset
+        query = {self.primary_key: self.pk}
+        for i in self.connection_retries():
+            try:
+                result = await db[self.get_collection_name()].find_one_and_update(
+                    filter=query,
+                    update=update,
+                    return_document=ReturnDocument.AFTER
+                )
+                if result:
+                    self._dirty = set()
+                    updated_obj = self.create_model(result)
+                    updated_obj._db = db
+                    # emit post save
+                    asyncio.ensure_future(post_save.send(
+                        sender=self.__class__,
+                        db=db,
+                        instance=updated_obj,
+                        created=False)
+                    )
+                    return updated_obj
+                return None
+            except ConnectionFailure as ex:
+                exceed = await self.check_reconnect_tries_and_wait(i, 'update')
+                if exceed:
+                    raise ex
+
     @classmethod
     async def modify(cls, db, key, data: dict):
         '''
@@ -305,7 +653,7 @@ class MongoCollectionMixin(object):
         if data is None:
             raise BadRequest('Failed to modify document. No data fields to modify')
         # validate partial data
-        cls._validate(data)
+        await cls._validate_async(data)
 
         query = {cls.primary_key: key}
         for i in cls.connection_retries():
@@ -17,9 +17,11 @@ class AioHttpWebSocketCarrier(object):
 
     async def deliver(self, data):
         try:
-            self._socket.send_str(
-                json.dumps(data, cls=ExtendedJSONEncoder)
-            )
+            if isinstance(data, bytes):
+                payload = data.decode('utf-8')
+            else:
+                payload = json.dumps(data, cls=ExtendedJSONEncoder)
+            self._socket.send_str(payload)
             return True
         except Exception as ex:
             logger.exception(ex)
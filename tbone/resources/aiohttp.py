@@ -11,6 +11,8 @@ class AioHttpResource(object):
     '''
     @classmethod
     def build_http_response(cls, data, status=200):
+        if isinstance(data, bytes):
+            return Response(status=status, body=data, content_type='application/json')
         res = Response(status=status, text=data, content_type='application/json')
         return res
 
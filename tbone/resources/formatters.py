@@ -3,6 +3,7 @@
 
 
 import json
+from tbone.data.encoders import encode_json
 from tbone.utils import ExtendedJSONEncoder
 
 
@@ -21,7 +22,11 @@ class Formatter(object):
 
 
 class JSONFormatter(Formatter):
-    ''' Implements JSON formatting and parsing '''
+    '''
+    Implements JSON formatting and parsing.
+    ``format_raw`` formats data which contains fragments of ``RawJSON``, such as the objects of a list response
+    encoded by ``Model.serialize_json_many``, into compact JSON ``bytes``
+    '''
     def parse(self, body):
         if isinstance(body, bytes):
             return json.loads(body.decode('utf-8'))
@@ -29,3 +34,6 @@ class JSONFormatter(Formatter):
 
     def format(self, data):
         return json.dumps(data, cls=ExtendedJSONEncoder)
+
+    def format_raw(self, data):
+        return encode_json(data)
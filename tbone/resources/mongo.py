@@ -1,24 +1,101 @@
 #!/usr/bin/env python
 # encoding: utf-8
 
+import json
+import time
+import base64
+import binascii
 import asyncio
 import logging
 from functools import singledispatch
+from collections import OrderedDict
+from collections.abc import Sequence
+from bson import json_util
 from bson.objectid import ObjectId
 from bson.errors import InvalidId
+from pymongo.errors import BulkWriteError
+from tbone.data.encoders import RawJSON
 from tbone.data.fields.mongo import DBRefField
-from tbone.db.models import MongoCollectionMixin, post_save
+from tbone.db.models import MongoCollectionMixin, post_save, post_bulk_save, BulkInsert, BulkReplace, BulkUpdate, BulkDelete
 from tbone.dispatch.channels.mongo import MongoChannel
-from tbone.resources import ModelResource
+from tbone.resources import ModelResource, Resource
+from tbone.resources.formatters import JSONFormatter
 from tbone.resources.verbs import *
 from tbone.resources.signals import *
 
 LIMIT = 20
 OFFSET = 0
+COUNT_CACHE_SIZE = 1024  # cached counts kept, least recently used ones are dropped first
+CONCURRENT_COUNT_STRATEGIES = ('facet', 'concurrent', 'cached')
+NEXT = 'next'
+PREVIOUS = 'previous'
+
+# counts of the ``cached`` count strategy, by database name, collection name and encoded filters, with the time they expire
+_count_cache = OrderedDict()
 
 logger = logging.getLogger(__file__)
 
 
+def serialize_documents(object_class, documents, extras=None, encode=True):
+    '''
+    Creates model instances from documents and serializes them with a private event loop.
+    Executed by the ``serialize_executor`` of resources which offload the serialization of large lists,
+    so it is a module level function which process pools can pickle.
+    Returns the objects encoded as a JSON array, or a list of serialized ``dict`` objects if ``encode`` is ``False``
+
+    :param extras:
+        An optional list of ``dict`` objects, one per document, with additional members to add to the encoded objects
+    '''
+    objects = object_class.create_models(documents)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        if not encode:
+            return loop.run_until_complete(object_class.serialize_many(objects))
+        extra = None
+        if extras is not None:
+            extras = {id(obj): item for obj, item in zip(objects, extras)}
+
+            def extra(obj):
+                return extras[id(obj)]
+        return bytes(loop.run_until_complete(object_class.serialize_json_many(objects, extra)))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+class OffloadedModels(Sequence):
+    '''
+    The model instances of a list serialized by the ``serialize_executor``, as sent with the ``resource_post_list`` signal.
+    Instances are created from the documents on first access, so receivers which only read ``serialized``
+    do not create and serialize the objects on the event loop again
+    '''
+    def __init__(self, object_class, documents, serialized, links=False):
+        self._object_class = object_class
+        self._documents = documents
+        self._serialized = serialized
+        self._links = links
+        self._instances = None
+
+    @property
+    def serialized(self):
+        ''' The serialized objects, without hypermedia links '''
+        if isinstance(self._serialized, RawJSON):
+            self._serialized = json.loads(self._serialized.decode('utf-8'))
+            if self._links:
+                for obj in self._serialized:
+                    obj.pop('_links', None)
+        return self._serialized
+
+    def __getitem__(self, index):
+        if self._instances is None:
+            self._instances = self._object_class.create_models(self._documents)
+        return self._instances[index]
+
+    def __len__(self):
+        return len(self._documents)
+
+
 class MongoResource(ModelResource):
     '''
     A specialized ``Resource`` subclass used for creating API endpoints coupled to a MongoDB collection.
@@ -60,6 +137,33 @@ class MongoResource(ModelResource):
         elif created is False and 'updated' in cls._meta.outgoing_detail:
             await _emit('resource_update')
 
+    @classmethod
+    @receiver(post_bulk_save)
+    async def post_bulk_save(cls, sender, db, inserted, replaced, updated, deleted):
+        '''
+        Emits a single resource event for every kind of change made by a batch of bulk writes.
+        Updates made with ``$set`` carry only the primary key of the updated object, and so do deletes
+        '''
+        resource = cls()
+        pk_field = sender._fields[resource.pk]
+
+        async def serialize(instances):
+            objects = await sender.serialize_many(instances)
+            if cls._meta.hypermedia is True:
+                for obj in objects:
+                    resource.add_hypermedia(obj)
+            return objects
+
+        def keys(values):
+            return [{resource.pk: pk_field.to_data(value)} for value in values]
+
+        if inserted and 'created' in cls._meta.outgoing_list:
+            await resource.emit(db, 'resource_create_list', await serialize(inserted))
+        if (replaced or updated) and 'updated' in cls._meta.outgoing_list:
+            await resource.emit(db, 'resource_update_list', await serialize(replaced) + keys(updated))
+        if deleted and 'deleted' in cls._meta.outgoing_list:
+            await resource.emit(db, 'resource_delete_list', keys(deleted))
+
     @classmethod
     @receiver(resource_post_list)
     async def post_list(cls, sender, db, instances):
@@ -68,11 +172,70 @@ class MongoResource(ModelResource):
         Useful when wanting to know when certain documents have come up in a query.
         Implement in resource subclasses to provide domain-specific behavior
         '''
-        serialized_objects = await asyncio.gather(*[obj.serialize() for obj in instances])
+        serialized_objects = getattr(instances, 'serialized', None)
+        if serialized_objects is None:
+            serialized_objects = await cls._meta.object_class.serialize_many(instances)
         await cls.emit(db, 'resource_get_list', serialized_objects)
 
     # ------------- resource overrides ---------------- #
 
+    def _encodes_json(self):
+        '''
+        Returns ``True`` if list results are encoded straight to JSON with ``Model.serialize_json_many``.
+        Only resources which set the ``encode_json`` option, use the ``JSONFormatter`` and do not override
+        ``add_hypermedia`` encode their lists, all others receive serialized ``dict`` objects
+        '''
+        return self._meta.encode_json is True and isinstance(self._meta.formatter, JSONFormatter) and \
+            type(self).add_hypermedia is Resource.add_hypermedia
+
+    def format(self, method, data):
+        ''' Formats responses which may contain ``RawJSON`` fragments into ``bytes``, if lists are encoded straight to JSON '''
+        if data is None or not self._encodes_json():
+            return super(MongoResource, self).format(method, data)
+        return self._meta.formatter.format_raw(data)
+
+    async def serialize_list(self, object_list):
+        ''' Serializes the objects of a list response '''
+        object_class = self._meta.object_class
+        if not self._encodes_json():
+            return await object_class.serialize_many(object_list)
+        extra = None
+        if self._meta.hypermedia is True:
+            pk_field = object_class._fields[self.pk]
+
+            def extra(obj):
+                return {'_links': self.hypermedia_links(pk_field.to_data(obj.pk))}
+        return await object_class.serialize_json_many(object_list, extra)
+
+    async def offload_serialize_list(self, documents):
+        '''
+        Serializes the objects of a list response from the documents returned by the query, in chunks which
+        are submitted to the resource's ``serialize_executor``, so the event loop is not blocked by large lists
+        '''
+        object_class = self._meta.object_class
+        encode = self._encodes_json()
+        extras = None
+        if encode and self._meta.hypermedia is True:
+            pk_field = object_class._fields[self.pk]
+            pk_importer = object_class._field_importers[self.pk]
+            extras = [{'_links': self.hypermedia_links(pk_field.to_data(pk_importer(document.get(self.pk))))}
+                      for document in documents]
+        size = self._meta.serialize_chunk_size
+        loop = asyncio.get_event_loop()
+        chunks = await asyncio.gather(*[
+            loop.run_in_executor(
+                self._meta.serialize_executor, serialize_documents, object_class,
+                documents[i:i + size], extras[i:i + size] if extras else None, encode
+            ) for i in range(0, len(documents), size)
+        ])
+        if not encode:
+            return [obj for chunk in chunks for obj in chunk]
+        # join the items of the encoded arrays into a single array
+        return RawJSON(b'[' + b','.join(chunk[1:-1] for chunk in chunks if len(chunk) > 2) + b']')
+
+    async def _send_post_list(self, object_list):
+        await resource_post_list.send(sender=self._meta.object_class, db=self.db, instances=object_list)
+
     async def list(self, *args, **kwargs):
         '''
         Corresponds to GET request without a resource identifier, fetching documents from the database
@@ -80,6 +243,7 @@ class MongoResource(ModelResource):
         limit = int(kwargs.pop('limit', self.limit))
         limit = 1000 if limit == 0 else limit  # lets not go crazy here
         offset = int(kwargs.pop('offset', self.offset))
+        token = kwargs.pop('cursor', None)
         projection = None
         # perform full text search or standard filtering
         if self._meta.fts_operator in kwargs.keys():
@@ -98,28 +262,175 @@ class MongoResource(ModelResource):
             sort = self.build_sort(**kwargs)
             if isinstance(self._meta.sort, list):
                 sort.extend(self._meta.sort)
-        cursor = self._meta.object_class.get_cursor(db=self.db, query=filters, projection=projection, sort=sort)
-        cursor.skip(offset)
-        cursor.limit(limit)
-        total_count = await self._meta.object_class.count(db=self.db, filters=filters)
-        object_list = await self._meta.object_class.find(cursor)
-        # serialize results
-        serialized_objects = await asyncio.gather(*[obj.serialize() for obj in object_list])
+        # full text searches are sorted by score, and always paginated with an offset
+        keyset = self._meta.pagination == 'keyset' and projection is None
+        if keyset:
+            sort = self.keyset_sort(sort)
+            direction, values = self.decode_cursor(token) if token else (NEXT, None)
+            documents, total_count, more = await self.find_keyset_page(filters, sort, direction, values, limit)
+            cursors = self.page_cursors(documents, sort, direction, values is not None, more)
+        else:
+            documents, total_count = await self.find_page(filters, projection, sort, offset, limit)
+        object_list = None
+        if self._meta.serialize_executor is None or len(documents) < self._meta.serialize_offload_threshold:
+            object_list, documents = self._meta.object_class.create_models(documents), None
+        if object_list is None:
+            # serialize large lists outside the event loop
+            serialized_objects = await self.offload_serialize_list(documents)
+            # receivers get the serialized objects, which are copied before hypermedia links are added to the response
+            object_list = OffloadedModels(
+                self._meta.object_class, documents,
+                serialized_objects if isinstance(serialized_objects, RawJSON) else [dict(obj) for obj in serialized_objects],
+                links=self._meta.hypermedia is True
+            )
+        else:
+            # serialize results, inline when the model has no asynchronous parts
+            serialized_objects = await self.serialize_list(object_list)
         # signal post list
-        asyncio.ensure_future(resource_post_list.send(
-            sender=self._meta.object_class,
-            db=self.db,
-            instances=object_list)
-        )
+        asyncio.ensure_future(self._send_post_list(object_list))
+        meta = {
+            'total_count': total_count,
+            'limit': limit
+        }
+        if keyset:
+            meta.update(cursors)
+        else:
+            meta['offset'] = offset
         return {
-            'meta': {
-                'total_count': total_count,
-                'limit': limit,
-                'offset': offset
-            },
+            'meta': meta,
             'objects': serialized_objects
         }
 
+    async def find_page(self, filters, projection, sort, offset, limit):
+        '''
+        Returns the documents of a page of a list query, along with the total count of the documents matching the query,
+        according to the resource's ``count_strategy``
+        '''
+        object_class = self._meta.object_class
+        strategy = self._meta.count_strategy
+        if strategy == 'facet' and projection is None:
+            return await object_class.find_documents_with_count(self.db, filters, sort, offset, limit)
+        cursor = object_class.get_cursor(db=self.db, query=filters, projection=projection, sort=sort)
+        cursor.skip(offset)
+        cursor.limit(limit)
+        return await self._find_counted(filters, cursor)
+
+    async def find_keyset_page(self, filters, sort, direction, values, limit):
+        '''
+        Returns the documents of a page of a list query which follow, or precede, the given sort key values,
+        along with the total count of the documents matching the filters and whether more documents exist beyond the page
+        '''
+        if direction == PREVIOUS:
+            # walk backwards from the cursor and restore the order of the page afterwards
+            sort = [(key, -order) for key, order in sort]
+        query = filters
+        if values is not None:
+            keyset = self.build_keyset_filter(sort, values)
+            query = {'$and': [filters, keyset]} if filters else keyset
+        cursor = self._meta.object_class.get_cursor(db=self.db, query=query, sort=sort)
+        cursor.limit(limit + 1)  # the extra document tells if there is another page
+        documents, total_count = await self._find_counted(filters, cursor)
+        more = len(documents) > limit
+        documents = documents[:limit]
+        if direction == PREVIOUS:
+            documents.reverse()
+        return documents, total_count, more
+
+    async def _find_counted(self, filters, cursor):
+        find = self._meta.object_class.find_documents(cursor)
+        if self._meta.count_strategy in CONCURRENT_COUNT_STRATEGIES:
+            total_count, documents = await asyncio.gather(self.count(filters), find)
+            return documents, total_count
+        total_count = await self.count(filters)
+        return await find, total_count
+
+    def keyset_sort(self, sort):
+        ''' Returns the sort of a keyset paginated list query, with ``_id`` as tie-breaker so every document has a unique position '''
+        if '_id' not in [key for key, order in sort]:
+            sort = sort + [('_id', 1)]
+        return sort
+
+    def build_keyset_filter(self, sort, values):
+        ''' Returns a filter matching the documents which come after the given sort key values, in the order of the given sort '''
+        if len(values) != len(sort):
+            raise BadRequest('Pagination cursor does not match the sort order')
+        clauses = []
+        for i, (key, order) in enumerate(sort):
+            # null values sort before all others, and do not compare with them
+            if order == 1:
+                after = {key: {'$ne': None}} if values[i] is None else {key: {'$gt': values[i]}}
+            elif values[i] is None:
+                continue
+            else:
+                after = {'$or': [{key: {'$lt': values[i]}}, {key: None}]}
+            after.update({k: value for (k, o), value in zip(sort[:i], values[:i])})
+            clauses.append(after)
+        if not clauses:
+            return {'_id': {'$exists': False}}  # nothing follows the last document
+        return clauses[0] if len(clauses) == 1 else {'$or': clauses}
+
+    def page_cursors(self, documents, sort, direction, from_cursor, more):
+        ''' Returns the ``next`` and ``previous`` cursors of a keyset paginated page '''
+        if direction == PREVIOUS:
+            has_previous, has_next = more, True
+        else:
+            has_previous, has_next = from_cursor, more
+        return {
+            NEXT: self.encode_cursor(NEXT, documents[-1], sort) if has_next and documents else None,
+            PREVIOUS: self.encode_cursor(PREVIOUS, documents[0], sort) if has_previous and documents else None
+        }
+
+    def encode_cursor(self, direction, document, sort):
+        ''' Returns an opaque cursor token holding the sort key values of the document at the edge of a page '''
+        values = [sort_value(document, key) for key, order in sort]
+        return base64.urlsafe_b64encode(json_util.dumps([direction, values]).encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, token):
+        ''' Returns the direction and the sort key values held by a cursor token '''
+        if isinstance(token, list):
+            token = token[0]
+        if isinstance(token, bytes):
+            token = token.decode('utf-8')
+        try:
+            direction, values = json_util.loads(base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8'))
+        except (binascii.Error, UnicodeError, ValueError, TypeError):
+            raise BadRequest('Invalid pagination cursor')
+        if direction not in (NEXT, PREVIOUS) or not isinstance(values, list):
+            raise BadRequest('Invalid pagination cursor')
+        return direction, values
+
+    async def count(self, filters):
+        ''' Returns the total count of the documents matching the filters of a list query, according to the resource's ``count_strategy`` '''
+        object_class = self._meta.object_class
+        strategy = self._meta.count_strategy
+        if strategy == 'none':
+            return None
+        if strategy == 'estimated' and not filters:
+            return await object_class.estimated_count(self.db)
+        if strategy == 'capped':
+            cap = self._meta.count_cap
+            count = await object_class.count(db=self.db, filters=filters, limit=cap + 1)
+            return '{}+'.format(cap) if count > cap else count
+        if strategy == 'cached':
+            return await self._cached_count(filters)
+        return await object_class.count(db=self.db, filters=filters)
+
+    async def _cached_count(self, filters):
+        object_class = self._meta.object_class
+        # extended JSON tells apart values which encode alike, such as ObjectIds and strings
+        key = (self.db.name, object_class.get_collection_name(), json_util.dumps(filters, sort_keys=True))
+        now = time.monotonic()
+        cached = _count_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _count_cache.move_to_end(key)
+            return cached[1]
+        count = await object_class.count(db=self.db, filters=filters)
+        _count_cache[key] = (now + self._meta.count_cache_ttl, count)
+        _count_cache.move_to_end(key)
+        while len(_count_cache) > COUNT_CACHE_SIZE:
+            _count_cache.popitem(last=False)
+        return count
+
     async def detail(self, **kwargs):
         '''
         Corresponds to GET request with a resource unique identifier, fetching a single document from the database
@@ -135,8 +446,11 @@ class MongoResource(ModelResource):
 
     async def create(self, **kwargs):
         '''
-        Corresponds to POST request without a resource identifier, inserting a document into the database
+        Corresponds to POST request without a resource identifier, inserting a document into the database.
+        A list of objects is inserted with ``create_list``
         '''
+        if isinstance(self.data, list):
+            return await self.create_list(**kwargs)
         try:
             # create model
             obj = self._meta.object_class()
@@ -192,6 +506,169 @@ class MongoResource(ModelResource):
         else:
             raise BadRequest('Failed to delete object')
 
+    # ------------- bulk list operations ---------------- #
+
+    def bulk_result(self, status, obj=None, error=None) -> dict:
+        ''' Returns the result of a single item of a bulk operation '''
+        result = {'status': status}
+        if obj is not None:
+            result['object'] = obj
+        if error is not None:
+            result['error'] = str(error)
+        return result
+
+    def bulk_response(self, results) -> dict:
+        '''
+        Returns the response of a bulk operation, holding the result of every item in the order of the request.
+        The response status is ``207 Multi-Status``, and every result holds the status of its item
+        '''
+        self.response_status = MULTI_STATUS
+        return {'objects': results}
+
+    async def _prepare_items(self, results, prepare):
+        '''
+        Prepares the items of a bulk request concurrently, recording a ``400 Bad Request`` result for items which fail.
+        Returns the list of prepared items with their index in the request
+        '''
+        async def run(index, item):
+            try:
+                return index, await prepare(item)
+            except Exception as ex:
+                results[index] = self.bulk_result(BAD_REQUEST, error=ex)
+                return index, None
+
+        if not isinstance(self.data, list):
+            raise BadRequest('Bulk operations require a list of objects')
+        prepared = await asyncio.gather(*[run(index, item) for index, item in enumerate(self.data)])
+        return [(index, value) for index, value in prepared if value is not None]
+
+    def _item_key(self, item):
+        ''' Returns the primary key of a bulk request item, given as an object or as the key itself '''
+        if isinstance(item, dict):
+            if item.get(self.pk) is None:
+                raise ValueError('Missing object primary key')
+            return self.pk_type(item[self.pk])
+        return self.pk_type(item)
+
+    async def _existing(self, results, prepared, key):
+        ''' Records a ``404 Not Found`` result for prepared items whose documents do not exist, and returns the others '''
+        object_class = self._meta.object_class
+        cursor = object_class.get_cursor(self.db, {self.pk: {'$in': [key(value) for index, value in prepared]}},
+                                         projection={self.pk: 1})
+        existing = set(document[self.pk] for document in await object_class.find_documents(cursor))
+        found = []
+        for index, value in prepared:
+            if key(value) in existing:
+                found.append((index, value))
+            else:
+                results[index] = self.bulk_result(NOT_FOUND, error='Object matching the given {} was not found'.format(self.pk))
+        return found
+
+    async def _bulk_write(self, results, prepared, operations):
+        '''
+        Writes the operations of the prepared items with unordered bulk writes, recording a ``400 Bad Request`` result
+        for every item which failed. Returns the prepared items which were written
+        '''
+        try:
+            await self._meta.object_class.bulk_write(self.db, operations, ordered=False, validate=False)
+            failed = set()
+        except BulkWriteError as ex:
+            failed = set(error['index'] for error in ex.details['writeErrors'])
+            for error in ex.details['writeErrors']:
+                results[prepared[error['index']][0]] = self.bulk_result(BAD_REQUEST, error=error.get('errmsg'))
+        return [item for position, item in enumerate(prepared) if position not in failed]
+
+    async def create_list(self, **kwargs):
+        '''
+        Corresponds to POST request with a list of objects, inserting the documents with bulk writes.
+        Objects are deserialized and validated concurrently. Responds with the result of every object, see ``bulk_response``
+        '''
+        object_class = self._meta.object_class
+        results = [None] * len(self.data) if isinstance(self.data, list) else []
+
+        async def prepare(item):
+            obj = object_class()
+            await obj.deserialize(item)
+            await obj.run_async_validators()  # deserialize runs the other validators
+            obj.prepare_data()  # required fields are checked when the document is exported
+            return obj
+
+        prepared = await self._prepare_items(results, prepare)
+        written = await self._bulk_write(results, prepared, [BulkInsert(obj) for index, obj in prepared])
+        serialized = await object_class.serialize_many([obj for index, obj in written])
+        for (index, obj), data in zip(written, serialized):
+            results[index] = self.bulk_result(CREATED, obj=data)
+        return self.bulk_response(results)
+
+    async def update_list(self, **kwargs):
+        '''
+        Corresponds to PUT request with a list of objects, replacing the documents matching their primary keys with bulk writes.
+        Responds with the result of every object, see ``bulk_response``
+        '''
+        object_class = self._meta.object_class
+        results = [None] * len(self.data) if isinstance(self.data, list) else []
+
+        async def prepare(item):
+            key = self._item_key(item)
+            obj = object_class()
+            await obj.deserialize(item)
+            setattr(obj, self.pk, key)
+            await obj.run_async_validators()  # deserialize runs the other validators
+            obj.prepare_data()  # required fields are checked when the document is exported
+            return obj
+
+        prepared = await self._prepare_items(results, prepare)
+        prepared = await self._existing(results, prepared, lambda obj: obj.pk)
+        written = await self._bulk_write(results, prepared, [BulkReplace(obj) for index, obj in prepared])
+        serialized = await object_class.serialize_many([obj for index, obj in written])
+        for (index, obj), data in zip(written, serialized):
+            results[index] = self.bulk_result(ACCEPTED, obj=data)
+        return self.bulk_response(results)
+
+    async def modify_list(self, **kwargs):
+        '''
+        Corresponds to PATCH request with a list of partial objects, modifying the documents matching their primary keys
+        with bulk ``$set`` updates. Responds with the result of every object, holding the modified document.
+        See ``bulk_response``
+        '''
+        object_class = self._meta.object_class
+        results = [None] * len(self.data) if isinstance(self.data, list) else []
+
+        async def prepare(item):
+            key = self._item_key(item)
+            data = {name: value for name, value in item.items() if name != self.pk}
+            await object_class._validate_async(data, list(data))
+            return key, data
+
+        prepared = await self._prepare_items(results, prepare)
+        prepared = await self._existing(results, prepared, lambda value: value[0])
+        written = await self._bulk_write(results, prepared, [BulkUpdate(key, data) for index, (key, data) in prepared])
+        if written:
+            cursor = object_class.get_cursor(self.db, {self.pk: {'$in': [key for index, (key, data) in written]}})
+            objects = {obj.pk: obj for obj in await object_class.find(cursor)}
+            written = [(index, objects[key]) for index, (key, data) in written if key in objects]
+        serialized = await object_class.serialize_many([obj for index, obj in written])
+        for (index, obj), data in zip(written, serialized):
+            results[index] = self.bulk_result(ACCEPTED, obj=data)
+        return self.bulk_response(results)
+
+    async def delete_list(self, **kwargs):
+        '''
+        Corresponds to DELETE request with a list of primary keys, or of objects holding them,
+        deleting the matching documents with bulk writes. Responds with the result of every item, see ``bulk_response``
+        '''
+        results = [None] * len(self.data) if isinstance(self.data, list) else []
+
+        async def prepare(item):
+            return self._item_key(item)
+
+        prepared = await self._prepare_items(results, prepare)
+        prepared = await self._existing(results, prepared, lambda key: key)
+        written = await self._bulk_write(results, prepared, [BulkDelete(key) for index, key in prepared])
+        for index, key in written:
+            results[index] = self.bulk_result(NO_CONTENT)
+        return self.bulk_response(results)
+
     def build_filters(self, **kwargs):
         ''' Break url parameters and turn into filters '''
         filters = {}
@@ -240,6 +717,15 @@ class MongoResource(ModelResource):
         return sort
 
 
+def sort_value(document, key):
+    ''' Returns the value of a sort key in a document, following dotted keys into embedded documents '''
+    for part in key.split('.'):
+        if not isinstance(document, dict):
+            return None
+        document = document.get(part)
+    return document
+
+
 @singledispatch
 def convert_value(value):
     ''' Utility functions to convert url params to mongodb filter operators and values '''
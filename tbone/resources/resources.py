@@ -6,6 +6,7 @@ import logging
 from enum import Enum
 from functools import wraps
 from tbone.dispatch.channels import Channel
+from tbone.utils import public_attributes
 from .formatters import JSONFormatter
 from .authentication import NoAuthentication
 from .verbs import *
@@ -67,6 +68,45 @@ class ResourceOptions(object):
 
     :param channel:
         Defines the Channel class which the resource will emit events into. Defaults to in-memory
+
+    :param serialize_executor:
+        An optional ``concurrent.futures.Executor``, usually a ``ProcessPoolExecutor``, used by ``MongoResource``
+        to serialize large lists outside the event loop. Default is ``None``, which serializes all lists on the event loop
+
+    :param serialize_offload_threshold:
+        The number of objects in a list from which its serialization is offloaded to the ``serialize_executor``.
+        Default is ``500``
+
+    :param serialize_chunk_size:
+        The number of objects serialized by each task submitted to the ``serialize_executor``. Default is ``250``
+
+    :param encode_json:
+        If ``True``, ``MongoResource`` encodes the objects of list responses straight to JSON with ``Model.serialize_json_many``,
+        as long as the resource uses the ``JSONFormatter`` and does not override ``add_hypermedia``.
+        The ``objects`` of such list responses are a ``RawJSON`` fragment, and responses are formatted to ``bytes``.
+        Default is ``False``, which serializes the objects to ``dict`` objects
+
+    :param count_strategy:
+        Determines how ``MongoResource`` counts the documents matching a list query, reported as the ``total_count`` of the response.
+
+        - ``exact`` counts the matching documents before the page is fetched. This is the default
+        - ``concurrent`` counts the matching documents while the page is fetched
+        - ``estimated`` reads the number of documents from the collection's metadata if the query has no filters, and counts them otherwise
+        - ``capped`` counts up to ``count_cap`` documents, reporting larger counts as a string such as ``"10000+"``
+        - ``facet`` fetches the page and the count with a single ``$facet`` aggregation. Full text searches are counted concurrently
+        - ``cached`` counts concurrently, and caches the count of every filter for ``count_cache_ttl`` seconds
+        - ``none`` does not count the documents, reporting ``None``
+
+    :param count_cap:
+        The number of documents from which the ``capped`` count strategy stops counting. Default is ``10000``
+
+    :param count_cache_ttl:
+        The number of seconds the ``cached`` count strategy keeps a count. Default is ``5``
+
+    :param pagination:
+        Determines how ``MongoResource`` paginates list queries. Default is ``offset``, which skips the number of documents given by the ``offset`` parameter.
+        Setting ``keyset`` pages through the documents with the opaque ``next`` and ``previous`` cursors of the response,
+        passed back with the ``cursor`` parameter, which are translated to range filters on the sort keys
     '''
     name = None
     object_class = None
@@ -81,12 +121,18 @@ class ResourceOptions(object):
     outgoing_detail = ['created', 'updated', 'deleted']
     formatter = JSONFormatter()
     authentication = NoAuthentication()
+    serialize_executor = None
+    serialize_offload_threshold = 500
+    serialize_chunk_size = 250
+    encode_json = False
+    count_strategy = 'exact'
+    count_cap = 10000
+    count_cache_ttl = 5
+    pagination = 'offset'
 
     def __init__(self, meta=None):
         if meta:
-            for attr in dir(meta):
-                if not attr.startswith('_'):
-                    setattr(self, attr, getattr(meta, attr))
+            self.__dict__.update(public_attributes(meta))
 
 
 class ResourceMeta(type):
@@ -122,11 +168,8 @@ class ResourceMeta(type):
 
         # copy resource options defined in this resource, if any
         if hasattr(cls, 'Meta'):
-            for attr in dir(cls.Meta):
-                if not attr.startswith('_'):
-                    setattr(options, attr, getattr(cls.Meta, attr))
-        # create the combined resource options class
-        cls._meta = ResourceOptions(options)
+            options.__dict__.update(public_attributes(cls.Meta))
+        cls._meta = options
         return cls
 
 
@@ -177,6 +220,7 @@ class Resource(object, metaclass=ResourceMeta):
         self.request = kwargs.get('request', None)
         self.endpoint = kwargs.get('endpoint', 'list')
         self.data = None
+        self.response_status = None                 # set by methods which respond with a status other than the default
 
     def request_method(self):
         ''' Returns the HTTP method for the current request. '''
@@ -252,7 +296,7 @@ class Resource(object, metaclass=ResourceMeta):
             data = await handler(self, *args, **kwargs)
             # format the response object
             formatted = self.format(method, data)
-            status = self.responses.get(method, OK)
+            status = self.response_status or self.responses.get(method, OK)
             return self.build_http_response(formatted, status=status)
         except Exception as ex:
             return self.dispatch_error(ex)
@@ -263,7 +307,7 @@ class Resource(object, metaclass=ResourceMeta):
             method = self.request_method()
             # call the wrapped handler
             data = await handler(self, *args, **kwargs)
-            status = self.responses.get(method, OK)
+            status = self.response_status or self.responses.get(method, OK)
             response = {
                 'type': 'response',
                 'key': getattr(self.request, 'key', None),
@@ -344,9 +388,16 @@ class Resource(object, metaclass=ResourceMeta):
         # add hypermedia to the response, if response is not empty
         if data and self._meta.hypermedia is True:
             if self.endpoint == 'list' and method == 'GET':
+                # objects encoded directly to JSON already include their links
+                if isinstance(data['objects'], list):
+                    for item in data['objects']:
+                        self.add_hypermedia(item)
+            elif self.endpoint == 'list' and isinstance(self.data, list):
+                # results of bulk operations hold the status of every item, and the object if it was written
                 for item in data['objects']:
-                    self.add_hypermedia(item)
-            else:
+                    if isinstance(item.get('object'), dict):
+                        self.add_hypermedia(item['object'])
+            elif isinstance(data, dict):
                 self.add_hypermedia(data)
 
         return data
@@ -422,17 +473,21 @@ class Resource(object, metaclass=ResourceMeta):
             return self._meta.formatter.parse(body)
         return {}
 
+    def hypermedia_links(self, pk):
+        ''' Returns the HATEOAS links of the object with the given primary key '''
+        return {
+            'self': {
+                'href': '{}{}/'.format(self.get_resource_uri(), pk)
+            }
+        }
+
     def add_hypermedia(self, obj):
         '''
         Adds HATEOAS links to the resource. Adds href link to self.
         Override in subclasses to include additional functionality
         '''
         if hasattr(self, 'pk'):
-            obj['_links'] = {
-                'self': {
-                    'href': '{}{}/'.format(self.get_resource_uri(), obj[self.pk])
-                }
-            }
+            obj['_links'] = self.hypermedia_links(obj[self.pk])
 
     def format(self, method, data):
         ''' Calls format on list or detail '''
@@ -456,7 +511,7 @@ class Resource(object, metaclass=ResourceMeta):
     @classmethod
     def connect_signal_receivers(cls):
         # connect signal receivers
-        for item in dir(cls):
+        for item in sorted(set(name for base in cls.__mro__ for name in vars(base))):
             attr = getattr(cls, item)
             if hasattr(attr, '_signal_receiver_'):
                 logger.debug('signal receiver subscription', attr)
@@ -11,6 +11,8 @@ class SanicResource(HttpResource):
     '''
     @classmethod
     def build_http_response(cls, data, status=200):
+        if isinstance(data, bytes):
+            return response.raw(data, content_type='application/json', status=status)
         return response.text(
             data,
             headers={'Content-Type': 'application/json'},
@@ -7,6 +7,7 @@ OK = 200
 CREATED = 201
 ACCEPTED = 202
 NO_CONTENT = 204
+MULTI_STATUS = 207
 
 BAD_REQUEST = 400
 UNAUTHORIZED = 401
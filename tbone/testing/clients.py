@@ -34,6 +34,8 @@ class ResourceTestClient(object):
     def parse_response_data(self, response):
         if isinstance(response.payload, dict):
             return response.payload
+        if isinstance(response.payload, bytes):
+            return json.loads(response.payload.decode('utf-8'))
         return json.loads(response.payload)
 
     async def process_request(self, method, url, headers, args, body):
@@ -58,6 +60,8 @@ class ResourceTestClient(object):
             response = await handler(request)
             # if the protocol is websockets we convert the HTTP response object so the tests don't have to be written twice
             if self.protocol == Resource.Protocol.websocket:
+                if isinstance(response, bytes):
+                    response = response.decode('utf-8')
                 response = json.loads(response)
                 return Response(headers={}, payload=response['payload'], status=response['status'])
             return response
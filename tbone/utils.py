@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 # encoding: utf-8
 
+import sys
 import json
-import uuid
+import inspect
 import decimal
 import datetime
+import functools
 
 
 class ExtendedJSONEncoder(json.JSONEncoder):
@@ -19,10 +21,50 @@ class ExtendedJSONEncoder(json.JSONEncoder):
     def default(self, data):
         if isinstance(data, (datetime.datetime, datetime.date, datetime.time)):
             return data.isoformat()
-        elif isinstance(data, decimal.Decimal) or isinstance(data, uuid.UUID):
+        elif isinstance(data, decimal.Decimal):
             return str(data)
-        else:
-            return super(ExtendedJSONEncoder, self).default(data)
+        # UUIDs can exist only if the uuid module was imported, so it is not imported here
+        uuid = sys.modules.get('uuid')
+        if uuid is not None and isinstance(data, uuid.UUID):
+            return str(data)
+        return super(ExtendedJSONEncoder, self).default(data)
+
+
+def _is_coroutine_function(func) -> bool:
+    while isinstance(func, functools.partial):
+        func = func.func
+    if inspect.iscoroutinefunction(func):
+        return True
+    # generator based coroutines decorated with ``asyncio.coroutine`` are marked with a plain sentinel object
+    return type(getattr(func, '_is_coroutine', None)) is object
+
+
+def iscoroutinefunction(func) -> bool:
+    '''
+    Returns ``True`` if calling the given callable returns a coroutine. Detects coroutine functions and methods,
+    ``functools.partial`` objects wrapping them, and objects whose ``__call__`` method is a coroutine function
+    '''
+    if _is_coroutine_function(func):
+        return True
+    while isinstance(func, functools.partial):
+        func = func.func
+    if inspect.isroutine(func) or inspect.isclass(func):
+        return False
+    return _is_coroutine_function(getattr(func, '__call__', None))
+
+
+def public_attributes(klass) -> dict:
+    '''
+    Returns the public attributes of a class, including inherited ones.
+    Reads the dictionaries of the classes in the MRO, which is cheaper than ``dir``,
+    since ``dir`` sorts the names and includes the attributes of ``object``
+    '''
+    attributes = {}
+    for base in reversed(klass.__mro__[:-1]):
+        for name, value in vars(base).items():
+            if not name.startswith('_'):
+                attributes[name] = value
+    return attributes
 
 
 def run_once(func):
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 # encoding: utf-8
 
+import asyncio
 import pytest
 import datetime
+import functools
 from tbone.data.fields import *
 from tbone.data.models import Model
 from tbone.testing.fixtures import event_loop
@@ -49,6 +51,41 @@ def test_time_field():
     assert isinstance(res, datetime.time)
 
 
+def test_datetime_parsing():
+    # strict ISO-8601 strings are parsed without dateutil
+    def fail(value):
+        raise AssertionError('Unexpected fallback for {}'.format(value))
+
+    field = DateTimeField(parser=fail)
+    assert field('2017-07-25T10:20:30.5+02:00') == datetime.datetime(
+        2017, 7, 25, 10, 20, 30, 500000, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+    assert field('2017-07-25 10:20') == datetime.datetime(2017, 7, 25, 10, 20)
+    assert DateField(parser=fail)('2017-07-25') == datetime.date(2017, 7, 25)
+    assert TimeField(parser=fail)('10:20:30') == datetime.time(10, 20, 30)
+
+    # other forms fall back to the parser
+    assert DateTimeField()('Jul 25 2017 10:20') == datetime.datetime(2017, 7, 25, 10, 20)
+    with pytest.raises(ValueError):
+        DateTimeField()('not a date')
+
+    # custom format
+    field = DateField(format='%d/%m/%Y', parser=fail)
+    assert field('25/07/2017') == datetime.date(2017, 7, 25)
+    assert field('2017-07-25') == datetime.date(2017, 7, 25)
+
+    # cached values
+    field = DateTimeField(cache=True)
+    assert field('2017-07-25T10:20:30') is field('2017-07-25T10:20:30')
+    # values without a date are not cached, since their date is the current date
+    today = [datetime.datetime(2017, 7, 25, 10, 20)]
+    field = DateTimeField(cache=True, parser=lambda value: today[0])
+    assert field('10:20 AM') == datetime.datetime(2017, 7, 25, 10, 20)
+    today[0] = datetime.datetime(2017, 7, 26, 10, 20)
+    assert field('10:20 AM') == datetime.datetime(2017, 7, 26, 10, 20)
+    assert field('10:20') == datetime.datetime.combine(datetime.date.today(), datetime.time(10, 20))
+    assert field('10:20') is not field('10:20')
+
+
 def test_default():
     number = IntegerField(default=5)
     assert number.to_data(None) == 5
@@ -77,6 +114,103 @@ def test_choices():
         country.validate('NP')
 
 
+def test_validator_chain():
+    # fields without choices or range limits have nothing to validate
+    assert StringField().validator_chain is False
+    assert IntegerField().validator_chain is False
+    assert URLField().validator_chain is False
+    IntegerField().validate(None)
+
+    # only active validators are compiled into the chain
+    f = IntegerField(min=5)
+    assert f.validator_chain == f.range
+    with pytest.raises(ValueError):
+        f.validate(3)
+
+    # unhashable values are still matched against the choices
+    f = ListField(IntegerField, choices=[[1, 2], [3, 4]])
+    f.validate([1, 2])
+    with pytest.raises(ValueError):
+        f.validate([5, 6])
+    f = StringField(choices=['CA', 'US'])
+    with pytest.raises(ValueError):
+        f.validate(['CA'])
+
+    class M(Model):
+        name = StringField()
+        age = IntegerField(min=0)
+        country = StringField(choices=['CA', 'US'])
+
+    assert M._fields['name'].validator_chain is False
+    m = M({'name': 'Ron', 'age': 40, 'country': 'US'})
+    m.validate()
+    m.country = 'MX'
+    with pytest.raises(Exception):
+        m.validate()
+
+
+@pytest.mark.asyncio
+async def test_async_validators():
+    calls = []
+
+    class CodeField(StringField):
+        @validator
+        async def registered(self, value):
+            calls.append(value)
+            await asyncio.sleep(0.05)
+            if value == 'XX':
+                raise ValueError('Code is not registered')
+
+    async def validate_available(value):
+        await asyncio.sleep(0.05)
+        if value == 'YY':
+            raise ValueError('Code is taken')
+
+    f = CodeField(choices=['AA', 'BB', 'XX', 'YY'], validators=[validate_available])
+    # asynchronous validators are left out of the synchronous chain
+    assert f.validator_chain == f.choices
+    assert len(f.async_validators) == 2
+    f.validate('XX')
+    await f.validate_async('AA')
+    for code in ('XX', 'YY', 'ZZ'):
+        with pytest.raises(ValueError):
+            await f.validate_async(code)
+    # synchronous validators run first
+    assert 'ZZ' not in calls
+
+    # partials and callable objects are asynchronous validators too
+    class Available:
+        async def __call__(self, value):
+            await validate_available(value)
+
+    for available in (functools.partial(validate_available), Available()):
+        f = StringField(validators=[available])
+        assert f.validator_chain is False
+        assert len(f.async_validators) == 1
+        await f.validate_async('AA')
+        with pytest.raises(ValueError):
+            await f.validate_async('YY')
+
+    class M(Model):
+        code = CodeField()
+        backup = CodeField(validators=[validate_available])
+        name = StringField()
+
+    assert M._has_async_validators
+    assert not Model._has_async_validators
+    m = M({'code': 'AA', 'backup': 'BB', 'name': 'Ron'})
+    # validators of all fields run concurrently
+    start = asyncio.get_event_loop().time()
+    await m.validate_async()
+    assert asyncio.get_event_loop().time() - start < 0.1
+    m.backup = 'YY'
+    m.validate()
+    with pytest.raises(Exception) as ex:
+        await m.validate_async()
+    assert 'backup' in str(ex.value)
+    await m.validate_async(['code', 'name'])
+
+
 def test_required():
     number = IntegerField(required=True)
 
@@ -130,3 +264,33 @@ def test_email_field_validation():
     with pytest.raises(ValueError):
         f.validate('r.channel4.com')
         f.validate('r@channel4')
+
+
+def test_phone_number_field():
+    pytest.importorskip('phonenumbers')
+    from tbone.data.fields.phone_number import PhoneNumber, PhoneNumberField
+
+    class M(Model):
+        phone = PhoneNumberField()
+        local_phone = PhoneNumberField(region='US')
+
+    # numbers are stored in their E.164 form when imported
+    m = M({'phone': '+1 (617) 605-0925', 'local_phone': '(617) 605-0925'})
+    assert m._data['phone'] == '+16176050925'
+    assert m._data['local_phone'] == '+16176050925'
+    assert m.export_data(native=False) == {'phone': '+16176050925', 'local_phone': '+16176050925'}
+
+    # parsed numbers are memoized per instance until the value changes
+    phone = m.phone
+    assert isinstance(phone, PhoneNumber)
+    assert phone.as_national == '(617) 605-0925'
+    assert m.phone is phone
+    m.phone = '+442083661177'
+    assert m.phone is not phone
+    assert m.phone == '+44 20 8366 1177'
+
+    # numbers which cannot be parsed are rejected on export
+    m = M({'phone': '55-(800)503-6017'})
+    assert m._data['phone'] == '55-(800)503-6017'
+    with pytest.raises(ValueError):
+        m.export_data(native=False)
@@ -2,10 +2,16 @@
 # encoding: utf-8
 
 import pytest
+import functools
 import datetime
+import json
 from itertools import zip_longest
 from tbone.data.fields import *
+from tbone.data.fields.base import Ternary
 from tbone.data.models import *
+from tbone.data.batch import ModelBatch
+from tbone.data.encoders import RawJSON, encode_json
+from tbone.utils import ExtendedJSONEncoder
 from tbone.testing.fixtures import event_loop
 
 
@@ -74,6 +80,62 @@ async def test_model_serialize_decorator():
     assert data['full_name'] == 'Ron Burgundy'
 
 
+@pytest.mark.asyncio
+async def test_model_cached_serialize_methods():
+    calls = []
+
+    class M(Model):
+        first_name = StringField()
+        last_name = StringField()
+        age = IntegerField()
+
+        @serialize(cached=True, depends_on=['first_name', 'last_name'])
+        async def full_name(self):
+            calls.append('full_name')
+            return '{} {}'.format(self.first_name, self.last_name)
+
+        @serialize(cached=True)
+        def summary(self):
+            calls.append('summary')
+            return '{} ({})'.format(self.first_name, self.age)
+
+    m = M({'first_name': 'Ron', 'last_name': 'Burgundy', 'age': 42})
+    data = await m.serialize()
+    assert data['full_name'] == 'Ron Burgundy'
+    assert data['summary'] == 'Ron (42)'
+    await m.serialize()
+    await m.serialize_json()
+    assert sorted(calls) == ['full_name', 'summary']
+
+    # fields which are not dependencies invalidate only methods without declared dependencies
+    calls.clear()
+    m.age = 43
+    assert (await m.serialize())['summary'] == 'Ron (43)'
+    assert calls == ['summary']
+
+    # assignments, deletions and imports invalidate dependent results
+    calls.clear()
+    m.first_name = 'Brick'
+    assert (await m.serialize())['full_name'] == 'Brick Burgundy'
+    m.import_data({'last_name': 'Tamland'})
+    assert (await m.serialize())['full_name'] == 'Brick Tamland'
+    del m.last_name
+    assert (await m.serialize())['full_name'] == 'Brick None'
+    assert calls.count('full_name') == 3
+
+    # results are cached per instance
+    other = M({'first_name': 'Brian', 'last_name': 'Fantana'})
+    assert (await other.serialize())['full_name'] == 'Brian Fantana'
+
+    with pytest.raises(AttributeError):
+        class Broken(Model):
+            name = StringField()
+
+            @serialize(cached=True, depends_on=['nickname'])
+            def title(self):
+                return self.name
+
+
 def test_model_items():
     class M(Model):
         first_name = StringField()
@@ -124,8 +186,529 @@ def test_model_field_exclusion():
     assert 'full_name' not in PublicUser._serialize_methods
 
 
+def test_model_field_inheritance():
+    class Person(Model):
+        name = StringField(required=True)
+        age = IntegerField(min=0, max=120)
+        gender = StringField(choices=['M', 'F'])
+
+    class Employee(Person):
+        salary = FloatField()
+
+    # inherited fields are separate copies bound to the subclass, sharing the base field's definition
+    base_field, field = Person._fields['age'], Employee._fields['age']
+    assert field is not base_field
+    assert field.container_model is Employee
+    assert base_field.container_model is Person
+    assert field._choices is None and Employee._fields['gender']._choices is Person._fields['gender']._choices
+    assert all(validator.__self__ is field for validator in field.validators if hasattr(validator, '__self__'))
+
+    with pytest.raises(Exception) as ex:
+        Employee({'name': 'Brick', 'age': 150})
+    assert 'Employee' in str(ex.value)
+    with pytest.raises(Exception):
+        Employee({'name': 'Brick', 'gender': 'X'})
+    assert Employee({'name': 'Brick', 'age': 30, 'gender': 'M'}).age == 30
+    # the class options of base models are inherited
+    assert Employee._meta.slots is False
+
+
+@pytest.mark.asyncio
+async def test_model_compiled_and_generic_fields():
+    class M(Model):
+        name = StringField()
+        age = IntegerField(export_if_none=False)
+        nickname = StringField(compiled=False)
+
+    m = M({'name': 'Ron Burgundy'})
+    assert m.export_data() == {'name': 'Ron Burgundy', 'nickname': None}
+
+    data = await m.serialize()
+    assert data == {'name': 'Ron Burgundy', 'age': None, 'nickname': None}
+
+    # fields which opted out of compilation are read on every call
+    M._fields['nickname']._projection = Ternary(None)
+    M._fields['age']._projection = Ternary(None)
+    data = await m.serialize()
+    assert 'nickname' not in data
+    assert 'age' in data
+
+
+@pytest.mark.asyncio
+async def test_model_serialize_sync():
+    class Tag(Model):
+        name = StringField()
+
+    class Post(Model):
+        title = StringField()
+        tags = ListField(ModelField(Tag))
+
+        @serialize
+        def tag_count(self):
+            return len(self.tags)
+
+    class AsyncPost(Post):
+        @serialize
+        async def summary(self):
+            return self.title[:4]
+
+    assert Post._async_serialize is False
+    assert AsyncPost._async_serialize is True
+
+    data = {'title': 'Trees Are Tall', 'tags': [{'name': 'trees'}, {'name': 'nature'}]}
+    post = Post(data)
+    serialized = post.serialize_sync()
+    assert serialized == await post.serialize()
+    assert serialized['tags'] == [{'name': 'trees'}, {'name': 'nature'}]
+    assert serialized['tag_count'] == 2
+
+    async_post = AsyncPost(data)
+    with pytest.raises(TypeError):
+        async_post.serialize_sync()
+    serialized = await async_post.serialize()
+    assert serialized['summary'] == 'Tree'
+    assert serialized['tag_count'] == 2
+
+    assert await Post.serialize_many([post, post]) == [post.serialize_sync()] * 2
+
+
+@pytest.mark.asyncio
+async def test_model_slots():
+    calls = []
+
+    def now():
+        calls.append(1)
+        return datetime.datetime(2017, 7, 25)
+
+    class M(Model):
+        name = StringField()
+        age = IntegerField(default=0)
+        created = DateTimeField(default=now)
+
+        class Meta:
+            slots = True
+
+    class N(M):
+        pass
+
+    assert not isinstance(M()._data, dict)
+    assert not isinstance(N()._data, dict)
+
+    m = M()
+    calls.clear()
+    # defaults are materialized once, when the instance is created
+    assert m.created == m.created == datetime.datetime(2017, 7, 25)
+    assert calls == []
+    assert m.age == 0
+
+    m.import_data({'name': 'Ron Burgundy', 'age': 45, 'unknown': True})
+    assert m.name == 'Ron Burgundy'
+    assert m.age == 45
+    assert dict(m.items()) == {'name': 'Ron Burgundy', 'age': 45, 'created': datetime.datetime(2017, 7, 25)}
+    # the slotted storage exposes the data like a dict
+    assert list(m._data.items()) == list(m.items())
+    assert m._data.copy() == dict(m.items())
+    assert 'Ron Burgundy' in repr(m._data)
+    assert m.export_data(native=False)['created'] == '2017-07-25T00:00:00'
+
+    m.name = 'Brick Tamland'
+    data = await m.serialize()
+    assert data['name'] == 'Brick Tamland'
+    assert m == M(m.export_data())
+
+
+@pytest.mark.asyncio
+async def test_model_lazy_hydration():
+    class Person(Model):
+        first_name = StringField()
+        last_name = StringField()
+
+    class M(Model):
+        name = StringField()
+        age = IntegerField(default=0)
+        dob = DateTimeField()
+        friends = ListField(ModelField(Person))
+
+        class Meta:
+            lazy_hydration = True
+
+    data = {
+        'name': 'Ron Burgundy',
+        'dob': '1942-01-15T12:00:00',
+        'friends': [{'first_name': 'Brick', 'last_name': 'Tamland'}]
+    }
+    m = M.from_raw(data)
+    # nothing is converted until accessed
+    assert m._raw['dob'] == '1942-01-15T12:00:00'
+    assert m.dob == datetime.datetime(1942, 1, 15, 12)
+    assert 'dob' not in m._raw
+    assert 'friends' in m._raw
+
+    # assigned values override pending raw values
+    m.name = 'Brian Fantana'
+    assert m.name == 'Brian Fantana'
+
+    eager = M(data)
+    eager.name = 'Brian Fantana'
+    assert await m.serialize() == await eager.serialize()
+    assert m._raw is None
+    assert m.age == 0
+
+
+def test_model_from_many():
+    class M(Model):
+        name = StringField()
+        age = IntegerField(default=0, min=0)
+        dob = DateTimeField()
+
+    data_list = [
+        {'name': 'Ron Burgundy', 'age': 45, 'dob': '1942-01-15T12:00:00', '_internal': 1},
+        {'name': 'Brick Tamland', 'dob': datetime.datetime(1960, 6, 1)},
+    ]
+    models = M.from_many(data_list)
+    assert [m.export_data() for m in models] == [M(data).export_data() for data in data_list]
+    assert models[1].age == 0
+    # source documents are not modified
+    assert data_list[0]['_internal'] == 1
+    assert data_list[0]['dob'] == '1942-01-15T12:00:00'
+
+    with pytest.raises(Exception):
+        M.from_many([{'name': 'Champ Kind', 'age': -1}])
+    assert M.from_many([{'name': 'Champ Kind', 'age': -1}], validate=False)[0].age == -1
+
+    # lazily hydrated models are imported eagerly when they are validated
+    class L(M):
+        class Meta:
+            lazy_hydration = True
+
+    with pytest.raises(Exception):
+        L.from_many([{'name': 'Champ Kind', 'age': -1}])
+    models = L.from_many(data_list)
+    assert not models[0]._raw
+    assert [m.export_data() for m in models] == [M(data).export_data() for data in data_list]
+    models = L.from_many(data_list, validate=False)
+    assert models[0]._raw
+    assert [m.export_data() for m in models] == [M(data).export_data() for data in data_list]
+
+
+def test_model_from_many_trusts_nested_models():
+    calls = []
+
+    def count(value):
+        calls.append(value)
 
+    class Address(Model):
+        city = StringField(validators=[count])
+        zip_code = StringField(default='00000')
 
+    class Person(Model):
+        name = StringField()
+        address = ModelField(Address)
+        previous = ListField(ModelField(Address))
+
+    data_list = [{
+        'name': 'Ron Burgundy',
+        'address': {'city': 'San Diego'},
+        'previous': [{'city': 'Iowa City'}, {'city': 'Boston'}]
+    }] * 3
+    expected = Person(data_list[0]).export_data()
+    assert len(calls) == 3
+
+    # trusted imports do not validate nested models
+    del calls[:]
+    people = Person.from_many(data_list, validate=False)
+    assert [person.export_data() for person in people] == [expected] * 3
+    assert people[0].address.zip_code == '00000'
+    assert Person.from_db(data_list[0]).export_data() == expected
+    assert ModelBatch.from_many(Person, data_list, validate=False)[0].export_data() == expected
+    assert calls == []
+
+    # validated imports validate them
+    Person.from_many(data_list)
+    assert len(calls) == 9
+
+
+@pytest.mark.asyncio
+async def test_model_incremental_import():
+    calls = []
 
+    class CountingField(IntegerField):
+        def _import(self, value):
+            calls.append(self.name)
+            return super(CountingField, self)._import(value)
+
+    class M(Model):
+        name = StringField()
+        age = CountingField(min=0)
+        rank = CountingField(default=1)
 
+    m = M({'name': 'Ron Burgundy', 'age': 45})
+    assert sorted(calls) == ['age', 'rank']
+    assert m._dirty == {'name', 'age'}
 
+    # later imports only convert the incoming fields
+    calls.clear()
+    m.import_data({'rank': '3', 'unknown': True})
+    assert calls == ['rank']
+    assert m.rank == 3
+    assert m.age == 45
+    assert m._dirty == {'name', 'age', 'rank'}
+
+    # deserialize validates only the incoming fields of an imported instance
+    m._data['age'] = -1
+    await m.deserialize({'name': 'Brick Tamland'})
+    assert m.name == 'Brick Tamland'
+    with pytest.raises(Exception):
+        await m.deserialize({'age': -5})
+
+
+@pytest.mark.asyncio
+async def test_nested_models_are_not_validated_again():
+    calls = []
+
+    def count(value):
+        calls.append(value)
+
+    class Review(Model):
+        user = StringField(required=True, validators=[count])
+        rating = IntegerField(min=1, max=5)
+
+    class Book(Model):
+        title = StringField()
+        reviews = ListField(ModelField(Review))
+        featured = ModelField(Review)
+
+    book = Book({
+        'title': 'War and Peace',
+        'reviews': [{'user': 'Ron', 'rating': 4}, {'user': 'Brick', 'rating': 5}],
+        'featured': {'user': 'Brian', 'rating': 3}
+    })
+    # nested models are validated once, when imported
+    assert sorted(calls) == ['Brian', 'Brick', 'Ron']
+    calls.clear()
+
+    data = await book.serialize()
+    assert data['reviews'] == [{'user': 'Ron', 'rating': 4}, {'user': 'Brick', 'rating': 5}]
+    assert data['featured'] == {'user': 'Brian', 'rating': 3}
+    assert book.export_data(native=False)['reviews'][1] == {'user': 'Brick', 'rating': 5}
+    assert calls == []
+
+    # invalid nested data is still rejected on import
+    with pytest.raises(Exception):
+        Book({'reviews': [{'user': 'Ron', 'rating': 9}]})
+
+
+@pytest.mark.asyncio
+async def test_model_serialize_json():
+    class Review(Model):
+        user = StringField(required=True)
+        rating = IntegerField(min=1, max=5)
+
+    class Book(Model):
+        title = StringField()
+        price = FloatField()
+        published = DateField()
+        tags = ListField(StringField)
+        featured = ModelField(Review)
+        reviews = ListField(ModelField(Review))
+
+        @serialize
+        async def label(self):
+            return self.title.upper()
+
+    class Note(Model):
+        text = StringField()
+        created = DateTimeField()
+
+    book = Book({
+        'title': 'Anna Karenina — Tolstoy',
+        'price': 11.99,
+        'published': '1878-01-01',
+        'tags': ['novel', 'russian'],
+        'featured': {'user': 'Ron', 'rating': 4},
+        'reviews': [{'user': 'Brick', 'rating': 5}]
+    })
+    # the encoded form matches the encoded output of serialize
+    encoded = await book.serialize_json()
+    assert isinstance(encoded, RawJSON)
+    assert json.loads(encoded.decode('utf-8')) == json.loads(json.dumps(await book.serialize(), cls=ExtendedJSONEncoder))
+
+    encoded = await book.serialize_json(extra={'_links': {'self': '/books/1/'}})
+    assert json.loads(encoded.decode('utf-8'))['_links'] == {'self': '/books/1/'}
+
+    notes = Note.from_many([{'text': 'first', 'created': '2018-04-01T10:00:00Z'}, {'text': None}])
+    assert json.loads(notes[1].serialize_json_sync().decode('utf-8')) == notes[1].serialize_sync()
+    encoded = await Note.serialize_json_many(notes, extra=lambda note: {'n': note.text})
+    assert json.loads(encoded.decode('utf-8')) == [
+        {'text': 'first', 'created': '2018-04-01T10:00:00+00:00', 'n': 'first'},
+        {'text': None, 'created': None, 'n': None}
+    ]
+    # encoded fragments can be embedded in other data
+    assert json.loads(encode_json({'meta': {'total_count': 2}, 'objects': encoded}).decode('utf-8'))['meta'] == {
+        'total_count': 2}
+
+    with pytest.raises(TypeError):
+        book.serialize_json_sync()
+
+
+def test_model_batch():
+    class Reading(Model):
+        sensor = StringField()
+        value = FloatField()
+        count = IntegerField()
+        valid = BooleanField()
+        taken = DateTimeField()
+
+    data = [{
+        'sensor': 'sensor{}'.format(i % 3),
+        'value': None if i == 4 else i + 1.0,
+        'count': i,
+        'valid': i % 4 != 0,
+        'taken': datetime.datetime(2018, 1, 1 + i)
+    } for i in range(8)]
+    batch = ModelBatch.from_many(Reading, data)
+    assert len(batch) == 8
+    assert batch.count() == 8
+    assert batch.count('value') == 7
+    assert batch.sum('count') == 28
+    assert batch.mean('value') == pytest.approx(31 / 7)
+    assert batch.min('taken') == datetime.datetime(2018, 1, 1)
+    assert batch.max('count') == 7
+
+    valid = batch.where('valid', bool)
+    assert len(valid) == 6
+    assert valid.sum('count') == 24
+    assert len(batch[2:5]) == 3
+    assert len(batch.filter([i < 2 for i in range(8)])) == 2
+
+    # rows are model instances and export like them
+    row = batch[4]
+    assert isinstance(row, Reading)
+    assert row.value is None and row.count == 4 and not row.valid
+    assert batch.export_data() == [model.export_data() for model in Reading.from_many(data)]
+    assert batch.export_data(native=False, fields=['count']) == \
+        [model.export_data(native=False, fields=['count']) for model in Reading.from_many(data)]
+
+    with pytest.raises(Exception):
+        ModelBatch.from_many(Reading, [{'count': 'many'}])
+
+
+def test_model_batch_numpy_columns():
+    numpy = pytest.importorskip('numpy')
+
+    class Reading(Model):
+        sensor = StringField()
+        value = FloatField()
+        count = IntegerField()
+
+    batch = ModelBatch.from_many(Reading, [{'sensor': 'a', 'value': 1.5, 'count': 1},
+                                           {'sensor': 'b', 'count': 2},
+                                           {'sensor': 'c', 'value': 3.5, 'count': 3}])
+    assert batch['count'].dtype == numpy.int64
+    assert batch['value'].dtype == numpy.float64
+    assert batch['sensor'].dtype == object
+    assert len(batch.filter(batch['count'] > 1)) == 2
+    assert batch.mean('value') == 2.5
+    assert batch[1].value is None
+    assert isinstance(batch[0].count, int)
+
+
+def test_data_import_defers_heavy_modules():
+    ''' Test that importing tbone.data and tbone.resources does not import optional and heavy dependencies '''
+    import sys
+    import subprocess
+    code = (
+        'import sys, tbone.data, tbone.resources\n'
+        'print(",".join(m for m in ("dateutil.parser", "pymongo", "motor", "bson") if m in sys.modules))\n'
+    )
+    result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    assert result.stdout.strip() == ''
+    # columnar batches are opt-in, so persistency mixins and resources do not import numpy
+    code = (
+        'import sys, tbone.db.models, tbone.resources.mongo\n'
+        'print(",".join(m for m in ("tbone.data.batch", "numpy") if m in sys.modules))\n'
+    )
+    result = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    assert result.stdout.strip() == ''
+
+    # coroutine detection of partials and callable objects
+    from tbone.utils import iscoroutinefunction
+
+    async def coroutine():
+        pass
+
+    class Callable:
+        async def __call__(self, value):
+            pass
+
+        async def method(self):
+            pass
+
+    assert iscoroutinefunction(coroutine) is True
+    assert iscoroutinefunction(functools.partial(coroutine)) is True
+    assert iscoroutinefunction(Callable()) is True
+    assert iscoroutinefunction(Callable().method) is True
+    assert iscoroutinefunction(functools.partial(Callable())) is True
+    assert iscoroutinefunction(test_data_import_defers_heavy_modules) is False
+    assert iscoroutinefunction(functools.partial(test_data_import_defers_heavy_modules)) is False
+    assert iscoroutinefunction(Callable) is False
+
+
+@pytest.mark.asyncio
+async def test_model_offloaded_validation():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    threads = []
+
+    def checksum(value):
+        threads.append(threading.current_thread())
+        if value and sum(int(digit) for digit in value) % 10 != 0:
+            raise ValueError('Invalid checksum')
+
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    class Card(Model):
+        number = StringField(validators=[checksum], offload=True)
+        holder = StringField(required=True)
+
+        class Meta:
+            validation_executor = executor
+
+        @serialize(cached=True, depends_on=['number'])
+        async def last_digits(self):
+            return self.number[-2:]
+
+    assert Card._offload_fields == {'number'}
+    card = Card()
+    await card.deserialize({'number': '1234', 'holder': 'Ron'})
+    assert card.number == '1234' and card.holder == 'Ron'
+    assert threads and all(thread is not threading.current_thread() for thread in threads)
+    # offloaded fields invalidate cached serialize methods, and are dirty only if they were supplied
+    assert (await card.serialize())['last_digits'] == '34'
+    await card.deserialize({'number': '1900'})
+    assert card._dirty == {'number', 'holder'}
+    assert (await card.serialize())['last_digits'] == '00'
+    card = Card()
+    await card.deserialize({'holder': 'Ron'})
+    assert card._dirty == {'holder'}
+    with pytest.raises(Exception):
+        await Card().deserialize({'number': '1235', 'holder': 'Ron'})
+
+    # instances are validated in a single call to the executor
+    cards = [Card({'number': '19', 'holder': 'Ron'}), Card({'number': '55', 'holder': 'Brick'})]
+    del threads[:]
+    await Card.validate_many_async(cards)
+    assert len(threads) == 2
+    cards[1].number = '56'
+    with pytest.raises(Exception):
+        await Card.validate_many_async(cards)
+    await cards[0].validate_async()
+
+    # without an executor the field is validated inline
+    class InlineCard(Model):
+        number = StringField(validators=[checksum], offload=True)
+
+    del threads[:]
+    await InlineCard().deserialize({'number': '1234'})
+    assert threads == [threading.current_thread()]
+    executor.shutdown()
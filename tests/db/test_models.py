@@ -5,9 +5,10 @@ import asyncio
 import pytest
 import random
 from motor.motor_asyncio import AsyncIOMotorCollection
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import ConnectionFailure, DuplicateKeyError, BulkWriteError
 from tbone.testing import *
 from tbone.testing.fixtures import *
+from tbone.data.batch import ModelBatch
 from .models import *
 
 
@@ -92,6 +93,25 @@ async def test_model_by_pk(request, db):
     assert p1 == p2
 
 
+@pytest.mark.asyncio
+async def test_model_slots_with_private_field(request, db):
+    class SlottedPerson(Person):
+        class Meta:
+            slots = True
+
+    p1 = SlottedPerson({'first_name': 'Ron', 'last_name': 'Burgundy'})
+    assert not isinstance(p1._data, dict)
+    await p1.save(db=db)
+    assert p1.pk is not None
+    assert p1._data['_id'] == p1.pk
+
+    p2 = await SlottedPerson.find_one(db, {'_id': p1.pk})
+    assert p2._id == p1._id
+    assert p2.export_data() == p1.export_data()
+    data = await p2.serialize()
+    assert data['full_name'] == 'Ron Burgundy'
+
+
 @pytest.mark.asyncio
 async def test_connection_count_and_delete(request, db):
     p1 = Person({'first_name': 'Ron', 'last_name': 'Burgundy'})
@@ -182,4 +202,288 @@ async def test_model_custom_methods(request, db):
     assert new_book.number_of_views == 1
 
 
+@pytest.mark.asyncio
+async def test_model_lazy_hydration(request, db):
+    class LazyBook(Book):
+        class Meta(Book.Meta):
+            lazy_hydration = True
+
+    book = Book({
+        'isbn': '9781602523692',
+        'title': 'War and Peace',
+        'author': ['Leo Tolstoy'],
+        'publication_date': '1869-01-01T00:00:00.000+0000'
+    })
+    await book.save(db)
+
+    lazy_book = await LazyBook.find_one(db, {'isbn': book.isbn})
+    assert lazy_book._raw
+    assert lazy_book.title == 'War and Peace'
+    assert 'publication_date' in lazy_book._raw
+    eager_book = await Book.find_one(db, {'isbn': book.isbn})
+    assert lazy_book.export_data() == eager_book.export_data()
+
+
+@pytest.mark.asyncio
+async def test_model_validate_on_load(request, db):
+    class Rating(BaseModel):
+        name = StringField()
+        rating = IntegerField(min=1, max=5)
+
+    class CheckedRating(Rating):
+        class Meta:
+            name = 'rating'
+            validate_on_load = True
+
+    # a document written by another system, which does not pass the model's validation
+    await db[Rating.get_collection_name()].insert_one({'name': 'Anchorman', 'rating': 10})
+
+    # documents loaded from the database are trusted by default
+    rating = await Rating.find_one(db, {'name': 'Anchorman'})
+    assert rating.rating == 10
+    with pytest.raises(Exception):
+        rating.validate()
+
+    with pytest.raises(Exception):
+        await CheckedRating.find_one(db, {'name': 'Anchorman'})
 
+
+@pytest.mark.asyncio
+async def test_model_save_changes(request, db):
+    p1 = Person({'first_name': 'Ron', 'last_name': 'Burgundy'})
+    await p1.save(db)
+    assert p1._dirty == set()
+
+    p2 = await Person.find_one(db, {'_id': p1.pk})
+    assert p2._dirty == set()
+    # nothing was modified
+    assert await p2.save_changes(db) is p2
+
+    # change the document in the database, to verify only the modified field is sent
+    await db[Person.get_collection_name()].update_one({'_id': p1.pk}, {'$set': {'last_name': 'Tamland'}})
+    p2.first_name = 'Brick'
+    assert p2._dirty == {'first_name'}
+    p3 = await p2.save_changes(db)
+    assert p3.first_name == 'Brick'
+    assert p3.last_name == 'Tamland'
+    assert p2._dirty == set()
+
+    # fields merged with update are sent as well
+    p4 = await p3.update(db, {'last_name': 'Fantana'}, partial=True)
+    assert p4.first_name == 'Brick'
+    assert p4.last_name == 'Fantana'
+
+    # deleted fields are unset
+    class Nickname(BaseModel):
+        name = StringField()
+        nickname = StringField(export_if_none=False)
+
+    n1 = Nickname({'name': 'Ron Burgundy', 'nickname': 'Ron'})
+    await n1.save(db)
+    del n1.nickname
+    n2 = await n1.save_changes(db)
+    document = await db[Nickname.get_collection_name()].find_one({'_id': n1.pk})
+    assert 'nickname' not in document
+    assert n2.nickname is None
+
+
+@pytest.mark.asyncio
+async def test_model_find_batch(request, db):
+    class Sale(BaseModel):
+        item = StringField()
+        quantity = IntegerField()
+        price = FloatField()
+        paid = BooleanField(default=False)
+
+    for i in range(1, 11):
+        await Sale({'item': 'item{}'.format(i), 'quantity': i, 'price': i * 1.5, 'paid': i % 2 == 0}).save(db)
+    await Sale({'item': 'unpriced', 'quantity': 1}).save(db)
+
+    cursor = Sale.get_cursor(db, sort=[('quantity', 1)])
+    batch = await Sale.find(cursor, batch=True)
+    assert isinstance(batch, ModelBatch)
+    assert len(batch) == 11
+    assert batch.sum('quantity') == 56
+    assert batch.count('price') == 10
+    assert batch.mean('price') == 8.25
+    assert batch.max('price') == 15.0
+
+    paid = batch.where('paid', bool)
+    assert len(paid) == 5
+    assert paid.sum('price') == 45.0
+
+    # rows behave like model instances
+    models = await Sale.find(Sale.get_cursor(db, sort=[('quantity', 1)]))
+    assert [row.export_data() for row in batch] == [model.export_data() for model in models]
+    assert batch[-1].item == 'item10'
+    assert (await batch[-1].serialize())['price'] == 15.0
+
+
+@pytest.mark.asyncio
+async def test_model_async_validators(request, db):
+    class UniqueEmailField(EmailField):
+        @validator
+        async def unique(self, value):
+            collection = db[self._container_model_class.get_collection_name()]
+            if value and await collection.find_one({self.name: value}):
+                raise ValueError('Email {} is already registered'.format(value))
+
+    class Member(BaseModel):
+        email = UniqueEmailField()
+        nickname = StringField()
+
+    assert Member._has_async_validators
+    await Member({'email': 'ron@channel4.com', 'nickname': 'Ron'}).insert(db)
+    with pytest.raises(Exception):
+        await Member({'email': 'ron@channel4.com', 'nickname': 'Ronnie'}).insert(db)
+    with pytest.raises(Exception):
+        await Member({'email': 'ron@channel4.com'}).save(db)
+    await Member({'email': 'brick@channel4.com'}).save(db)
+    assert await Member.count(db) == 2
+
+
+@pytest.mark.asyncio
+async def test_model_bulk_write(request, db):
+    from tbone.db.models import post_bulk_save, BulkInsert, BulkReplace, BulkUpdate, BulkDelete
+
+    class Item(BaseModel):
+        sku = StringField(required=True)
+        quantity = IntegerField(min=0, default=1)
+
+        class Meta:
+            bulk_batch_size = 10
+
+    await Item.create_index(db, 'sku', unique=True)
+    signals = []
+
+    async def on_bulk_save(sender, db, inserted, replaced, updated, deleted):
+        signals.append((len(inserted), len(replaced), len(updated), len(deleted)))
+
+    post_bulk_save.connect(on_bulk_save, sender=Item)
+
+    # inserts are sent in batches, with a single signal per batch
+    items = [Item({'sku': 'sku{}'.format(i), 'quantity': i + 1}) for i in range(25)]
+    result = await Item.insert_many(db, items)
+    assert result['nInserted'] == 25
+    assert all(item._id is not None for item in items)
+    assert await Item.count(db) == 25
+    await asyncio.sleep(0.01)
+    assert signals == [(10, 0, 0, 0), (10, 0, 0, 0), (5, 0, 0, 0)]
+
+    # mixed operations
+    del signals[:]
+    items[0].quantity = 100
+    result = await Item.bulk_write(db, [
+        BulkInsert(Item({'sku': 'new', 'quantity': 1})),
+        BulkReplace(items[0]),
+        BulkUpdate(items[1]._id, {'quantity': 50}),
+        BulkDelete(items[2]._id),
+    ], batch_size=2)
+    assert result['nInserted'] == 1 and result['nModified'] == 2 and result['nRemoved'] == 1
+    assert (await Item.find_one(db, {'sku': 'sku0'})).quantity == 100
+    assert (await Item.find_one(db, {'sku': 'sku1'})).quantity == 50
+    assert await Item.find_one(db, {'sku': 'sku2'}) is None
+    await asyncio.sleep(0.01)
+    assert signals == [(1, 1, 0, 0), (0, 0, 1, 1)]
+
+    # every batch is validated before it is written
+    with pytest.raises(Exception):
+        await Item.bulk_write(db, [BulkUpdate(items[3]._id, {'quantity': -1})])
+    with pytest.raises(Exception):
+        await Item.insert_many(db, [Item({'sku': 'valid'}), Item({'quantity': 1})])
+    assert await Item.count(db, {'sku': 'valid'}) == 0
+
+    # ordered writes stop at the first error, unordered writes attempt all operations
+    duplicates = [{'sku': 'a'}, {'sku': 'sku5'}, {'sku': 'b'}]
+    with pytest.raises(BulkWriteError) as ex:
+        await Item.insert_many(db, [Item(data) for data in duplicates], batch_size=1)
+    assert [error['index'] for error in ex.value.details['writeErrors']] == [1]
+    assert await Item.count(db, {'sku': 'b'}) == 0
+    duplicates = [{'sku': 'c'}, {'sku': 'sku5'}, {'sku': 'd'}, {'sku': 'sku6'}]
+    with pytest.raises(BulkWriteError) as ex:
+        await Item.insert_many(db, [Item(data) for data in duplicates], ordered=False, batch_size=3)
+    assert [error['index'] for error in ex.value.details['writeErrors']] == [1, 3]
+    assert ex.value.details['nInserted'] == 2
+    assert await Item.count(db, {'sku': 'd'}) == 1
+
+
+@pytest.mark.asyncio
+async def test_model_iterate(request, db, monkeypatch):
+    from tbone.db.models import ModelIterator
+
+    class Item(BaseModel):
+        sku = StringField(required=True)
+        quantity = IntegerField(default=1)
+
+        class Meta:
+            iterate_batch_size = 10
+
+    await Item.insert_many(db, [Item({'sku': 'sku{:02}'.format(i), 'quantity': i}) for i in range(25)])
+
+    # models are created one batch at a time
+    iterator = Item.iterate(db, sort=[('sku', 1)])
+    assert isinstance(iterator, ModelIterator)
+    items = []
+    async for item in iterator:
+        assert isinstance(item, Item)
+        assert len(iterator._models) < 10
+        items.append(item)
+    assert [item.sku for item in items] == ['sku{:02}'.format(i) for i in range(25)]
+    assert iterator._fetched == 25
+
+    # queries, sorting and batch sizes
+    quantities = [item.quantity async for item in Item.iterate(db, {'quantity': {'$gte': 20}}, sort=[('quantity', -1)], batch_size=2)]
+    assert quantities == [24, 23, 22, 21, 20]
+    assert [item async for item in Item.iterate(db, {'quantity': 100})] == []
+
+    # iterations resume after a connection failure, in an order which does not change between queries
+    get_cursor = Item.get_cursor
+    sorts = []
+    failures = [13]
+
+    class FailingCursor(object):
+        def __init__(self, cursor):
+            self._cursor = cursor
+            self._documents = cursor.__aiter__()
+
+        def skip(self, count):
+            self._cursor.skip(count)
+
+        def batch_size(self, size):
+            self._cursor.batch_size(size)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            if failures:
+                failures[0] -= 1
+                if failures[0] == 0:
+                    failures.pop()
+                    raise ConnectionFailure()
+            return await self._documents.__anext__()
+
+    def failing_get_cursor(db, query={}, projection=None, sort=[]):
+        sorts.append(sort)
+        return FailingCursor(get_cursor(db, query, projection, sort))
+
+    async def no_wait(reconnect_number, method_name):
+        return False
+
+    monkeypatch.setattr(Item, 'get_cursor', failing_get_cursor)
+    monkeypatch.setattr(Item, 'check_reconnect_tries_and_wait', no_wait)
+    items = [item async for item in Item.iterate(db)]
+    assert len(sorts) == 2
+    assert sorts[0] == [('_id', 1)]
+    assert sorted(item.sku for item in items) == ['sku{:02}'.format(i) for i in range(25)]
+    assert [item._id for item in items] == sorted(item._id for item in items)
+    assert Item.iterate(db, sort=[('quantity', -1)]).sort == [('quantity', -1), ('_id', 1)]
+    assert Item.iterate(db, sort=[('_id', -1)]).sort == [('_id', -1)]
+    monkeypatch.undo()
+
+    # iterations can be stopped early
+    iterator = Item.iterate(db, batch_size=5)
+    async for item in iterator:
+        break
+    await iterator.close()
+    assert [item async for item in iterator] == []
@@ -1,9 +1,14 @@
 #!/usr/bin/env python
 # encoding: utf-8
 
+import json
+import asyncio
 import pytest
+from concurrent.futures import ProcessPoolExecutor
+from tbone.data.fields import StringField
 from tbone.db.models import create_collection
 from tbone.resources import verbs, Resource
+from tbone.resources.mongo import _count_cache
 from tbone.testing.clients import *
 from tbone.testing.fixtures import *
 from .resources import *
@@ -432,3 +437,313 @@ async def test_nested_resources(load_book_collection):
 
 
 
+
+
+@pytest.mark.asyncio
+async def test_mongo_collection_offloaded_serialization(load_account_collection):
+    class OffloadingAccountResource(AccountResource):
+        class Meta(AccountResource.Meta):
+            serialize_executor = ProcessPoolExecutor(max_workers=2)
+            serialize_offload_threshold = 10
+            serialize_chunk_size = 7
+
+    class OffloadingPlainAccountResource(OffloadingAccountResource):
+        class Meta(OffloadingAccountResource.Meta):
+            hypermedia = False
+
+    class OffloadingEncodingAccountResource(OffloadingAccountResource):
+        class Meta(OffloadingAccountResource.Meta):
+            encode_json = True
+
+    class OffloadingEncodingPlainAccountResource(OffloadingEncodingAccountResource):
+        class Meta(OffloadingEncodingAccountResource.Meta):
+            hypermedia = False
+
+    app = load_account_collection
+    client = ResourceTestClient(app, AccountResource)
+    expected = client.parse_response_data(await client.get('/api/{}/'.format(AccountResource.__name__),
+                                                           args={'limit': 30}))
+    try:
+        for resource_class in (OffloadingAccountResource, OffloadingPlainAccountResource,
+                               OffloadingEncodingAccountResource, OffloadingEncodingPlainAccountResource):
+            url = '/api/{}/'.format(resource_class.__name__)
+            client = ResourceTestClient(app, resource_class)
+            # lists above the threshold are serialized in the executor, in chunks
+            response = await client.get(url, args={'limit': 30})
+            # only resources which opt in encode their lists straight to JSON bytes
+            assert isinstance(response.payload, bytes) is resource_class._meta.encode_json
+            data = client.parse_response_data(response)
+            assert data['meta'] == expected['meta']
+            assert len(data['objects']) == 30
+            for obj, expected_obj in zip(data['objects'], expected['objects']):
+                links = obj.pop('_links', None)
+                if resource_class._meta.hypermedia:
+                    assert links['self']['href'] == '{}{}/'.format(url, obj['_id'])
+                else:
+                    assert links is None
+                assert obj == {key: value for key, value in expected_obj.items() if key != '_links'}
+            # smaller lists are serialized on the event loop
+            response = await client.get(url, args={'limit': 5})
+            assert isinstance(response.payload, bytes) is resource_class._meta.encode_json
+            data = client.parse_response_data(response)
+            assert [obj['_id'] for obj in data['objects']] == [obj['_id'] for obj in expected['objects'][:5]]
+    finally:
+        OffloadingAccountResource._meta.serialize_executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_mongo_collection_offloaded_post_list(load_account_collection, monkeypatch):
+    class OffloadingAccountResource(AccountResource):
+        class Meta(AccountResource.Meta):
+            serialize_executor = ProcessPoolExecutor(max_workers=2)
+            serialize_offload_threshold = 10
+
+    class OffloadingEncodingAccountResource(OffloadingAccountResource):
+        class Meta(OffloadingAccountResource.Meta):
+            encode_json = True
+
+    emitted = []
+
+    async def emit(cls, db, key, data):
+        emitted.append((cls, key, data))
+
+    created = []
+    create_models = Account.create_models
+
+    def counting_create_models(documents):
+        created.append(len(documents))
+        return create_models(documents)
+
+    app = load_account_collection
+    client = ResourceTestClient(app, AccountResource)
+    expected = client.parse_response_data(await client.get('/api/{}/'.format(AccountResource.__name__),
+                                                           args={'limit': 30}))['objects']
+    for obj in expected:
+        del obj['_links']
+    # let the signal of the request above be handled before emit is patched
+    for i in range(3):
+        await asyncio.sleep(0)
+    monkeypatch.setattr(MongoResource, 'emit', classmethod(emit))
+    monkeypatch.setattr(Account, 'create_models', staticmethod(counting_create_models))
+    try:
+        for resource_class in (OffloadingAccountResource, OffloadingEncodingAccountResource):
+            emitted.clear()
+            url = '/api/{}/'.format(resource_class.__name__)
+            client = ResourceTestClient(app, resource_class)
+            data = client.parse_response_data(await client.get(url, args={'limit': 30}))
+            assert all('_links' in obj for obj in data['objects'])
+            for i in range(3):
+                await asyncio.sleep(0)
+            # receivers emit the objects serialized by the executor, without creating the models on the event loop
+            assert emitted
+            for cls, key, objects in emitted:
+                assert key == 'resource_get_list'
+                assert json.loads(json.dumps(objects)) == expected
+            assert created == []
+    finally:
+        OffloadingAccountResource._meta.serialize_executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_mongo_collection_count_strategies(load_account_collection, monkeypatch):
+    app = load_account_collection
+    client = ResourceTestClient(app, AccountResource)
+    url = '/api/{}/'.format(AccountResource.__name__)
+    expected = client.parse_response_data(await client.get(url, args={'offset': 5, 'order_by': 'password'}))
+    expected_male = client.parse_response_data(await client.get(url, args={'gender': 'Male'}))
+    total = expected['meta']['total_count']
+    assert expected_male['meta']['total_count'] < total
+
+    counts = {
+        'concurrent': (total, expected_male['meta']['total_count']),
+        'estimated': (total, expected_male['meta']['total_count']),
+        'facet': (total, expected_male['meta']['total_count']),
+        'cached': (total, expected_male['meta']['total_count']),
+        'capped': ('{}+'.format(LIMIT), '{}+'.format(LIMIT)),
+        'none': (None, None),
+    }
+    for strategy, (total_count, male_count) in counts.items():
+        class CountingAccountResource(AccountResource):
+            class Meta(AccountResource.Meta):
+                count_strategy = strategy
+                count_cap = LIMIT
+
+        resource_url = '/api/{}/'.format(CountingAccountResource.__name__)
+        client = ResourceTestClient(app, CountingAccountResource)
+        data = client.parse_response_data(await client.get(resource_url, args={'offset': 5, 'order_by': 'password'}))
+        assert data['meta']['total_count'] == total_count
+        assert [obj['_id'] for obj in data['objects']] == [obj['_id'] for obj in expected['objects']]
+        data = client.parse_response_data(await client.get(resource_url, args={'gender': 'Male'}))
+        assert data['meta']['total_count'] == male_count
+        assert [obj['_id'] for obj in data['objects']] == [obj['_id'] for obj in expected_male['objects']]
+
+    # cached counts are served until they expire
+    await app.db[AccountResource._meta.object_class.get_collection_name()].delete_many({'gender': 'Male'})
+
+    class CachedAccountResource(AccountResource):
+        class Meta(AccountResource.Meta):
+            count_strategy = 'cached'
+
+    client = ResourceTestClient(app, CachedAccountResource)
+    resource_url = '/api/{}/'.format(CachedAccountResource.__name__)
+    data = client.parse_response_data(await client.get(resource_url, args={'gender': 'Male'}))
+    assert data['objects'] == []
+    assert data['meta']['total_count'] == expected_male['meta']['total_count']
+    _count_cache.clear()
+    data = client.parse_response_data(await client.get(resource_url, args={'gender': 'Male'}))
+    assert data['meta']['total_count'] == 0
+
+    # counts are cached per database and filter, and the least recently used ones are dropped
+    monkeypatch.setattr('tbone.resources.mongo.COUNT_CACHE_SIZE', 2)
+    for gender in ('Female', 'Male', 'Female', 'Other'):
+        await client.get(resource_url, args={'gender': gender})
+    assert len(_count_cache) == 2
+    assert all(key[0] == app.db.name for key in _count_cache)
+    assert [json.loads(key[2])['gender'] for key in _count_cache] == ['Female', 'Other']
+
+
+@pytest.mark.asyncio
+async def test_mongo_collection_keyset_pagination(load_account_collection):
+    class KeysetAccountResource(AccountResource):
+        class Meta(AccountResource.Meta):
+            pagination = 'keyset'
+
+    app = load_account_collection
+    client = ResourceTestClient(app, AccountResource)
+    expected = client.parse_response_data(await client.get('/api/{}/'.format(AccountResource.__name__),
+                                                           args={'limit': 0, 'order_by': 'gender'}))
+    total = expected['meta']['total_count']
+    # documents without a gender come first, and documents with the same gender are ordered by their _id
+    expected_ids = [obj['_id'] for obj in sorted(expected['objects'],
+                                                 key=lambda obj: (obj['gender'] is not None, obj['gender'] or '', obj['_id']))]
+
+    url = '/api/{}/'.format(KeysetAccountResource.__name__)
+    client = ResourceTestClient(app, KeysetAccountResource)
+    # walk forward through all pages
+    pages = []
+    args = {'limit': 7, 'order_by': 'gender'}
+    while True:
+        data = client.parse_response_data(await client.get(url, args=args))
+        assert data['meta']['total_count'] == total
+        assert 'offset' not in data['meta']
+        assert (data['meta']['previous'] is None) == (len(pages) == 0)
+        pages.append(data)
+        if data['meta']['next'] is None:
+            break
+        args['cursor'] = data['meta']['next']
+    assert [obj['_id'] for page in pages for obj in page['objects']] == expected_ids
+    assert len(pages) == -(-total // 7)
+    # walk back to the first page
+    for page in reversed(pages[:-1]):
+        args['cursor'] = data['meta']['previous']
+        data = client.parse_response_data(await client.get(url, args=args))
+        assert data['objects'] == page['objects']
+        assert data['meta']['next'] == page['meta']['next']
+    assert data['meta']['previous'] is None
+
+    # descending order, where documents without a gender come last
+    ids, args = [], {'limit': 9, 'order_by': '-gender'}
+    while True:
+        data = client.parse_response_data(await client.get(url, args=args))
+        ids.extend(obj['_id'] for obj in data['objects'])
+        if data['meta']['next'] is None:
+            break
+        args['cursor'] = data['meta']['next']
+    assert ids == [obj['_id'] for gender in ('Male', 'Female', None)
+                   for obj in sorted(expected['objects'], key=lambda obj: obj['_id']) if obj['gender'] == gender]
+    # descending order on the default sort key
+    data = client.parse_response_data(await client.get(url, args={'limit': 5, 'order_by': '-_id'}))
+    data = client.parse_response_data(await client.get(url, args={'limit': 5, 'order_by': '-_id',
+                                                                  'cursor': data['meta']['next']}))
+    assert [obj['_id'] for obj in data['objects']] == sorted(expected_ids, reverse=True)[5:10]
+
+    # cursors are opaque tokens validated by the resource
+    response = await client.get(url, args={'cursor': 'not-a-cursor'})
+    assert response.status == verbs.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_mongo_resource_bulk_list_validates_once(db):
+    calls = []
+
+    def validate_title(value):
+        calls.append(('sync', value))
+
+    async def validate_title_async(value):
+        calls.append(('async', value))
+
+    class CountedBook(BookResource._meta.object_class):
+        title = StringField(required=True, validators=[validate_title, validate_title_async])
+
+        class Meta:
+            name = 'counted_books'
+
+    class CountedBookResource(BookResource):
+        class Meta(BookResource.Meta):
+            object_class = CountedBook
+
+    app = App(db=db)
+    await create_collection(db, CountedBook)
+    url = '/api/{}/'.format(CountedBookResource.__name__)
+    client = ResourceTestClient(app, CountedBookResource)
+    books = [{'isbn': '97801408150{}'.format(i), 'title': 'Title {}'.format(i)} for i in range(3)]
+    for method in (client.post, client.put):
+        del calls[:]
+        response = await method(url, body=json.dumps(books))
+        assert [result['status'] for result in client.parse_response_data(response)['objects']] == \
+            [verbs.CREATED if method == client.post else verbs.ACCEPTED] * 3
+        # every object is validated once, before it is written
+        assert sorted(calls) == sorted([('sync', book['title']) for book in books] + [('async', book['title']) for book in books])
+
+
+@pytest.mark.asyncio
+async def test_mongo_resource_bulk_list_operations(db):
+    app = App(db=db)
+    await create_collection(db, BookResource._meta.object_class)
+    url = '/api/{}/'.format(BookResource.__name__)
+    client = ResourceTestClient(app, BookResource)
+
+    # create a list of books, reporting the status of every book
+    books = [
+        {'isbn': '9780140815054', 'title': 'A Tale of Two Cities', 'author': ['Charles Dickens']},
+        {'isbn': '9780140447934', 'author': ['Leo Tolstoy']},
+        {'isbn': '9780141439518', 'title': 'Pride and Prejudice', 'author': ['Jane Austen']},
+        {'isbn': '9780140815054', 'title': 'A Tale of Two Cities, again'},
+    ]
+    response = await client.post(url, body=json.dumps(books))
+    assert response.status == verbs.MULTI_STATUS
+    results = client.parse_response_data(response)['objects']
+    assert [result['status'] for result in results] == [verbs.CREATED, verbs.BAD_REQUEST, verbs.CREATED, verbs.BAD_REQUEST]
+    assert results[0]['object']['title'] == 'A Tale of Two Cities'
+    assert results[0]['object']['_links']['self']['href'] == '{}9780140815054/'.format(url)
+    assert 'error' in results[1]
+    assert await BookResource._meta.object_class.count(db) == 2
+
+    # replace books
+    books = [
+        {'isbn': '9780140815054', 'title': 'A Tale of Two Cities', 'format': 'Hardcover'},
+        {'isbn': '9780000000000', 'title': 'Missing'},
+        {'title': 'No ISBN'},
+    ]
+    response = await client.put(url, body=json.dumps(books))
+    results = client.parse_response_data(response)['objects']
+    assert [result['status'] for result in results] == [verbs.ACCEPTED, verbs.NOT_FOUND, verbs.BAD_REQUEST]
+    assert results[0]['object']['format'] == 'Hardcover'
+    assert results[0]['object']['author'] is None
+
+    # modify books
+    books = [
+        {'isbn': '9780141439518', 'format': 'Digital'},
+        {'isbn': '9780140815054', 'format': 'Scroll'},
+    ]
+    response = await client.patch(url, body=json.dumps(books))
+    results = client.parse_response_data(response)['objects']
+    assert [result['status'] for result in results] == [verbs.ACCEPTED, verbs.BAD_REQUEST]
+    assert results[0]['object']['format'] == 'Digital'
+    assert results[0]['object']['author'] == ['Jane Austen']
+
+    # delete books by key or by object
+    response = await client.delete(url, body=json.dumps(['9780141439518', {'isbn': '9780000000000'}]))
+    results = client.parse_response_data(response)['objects']
+    assert [result['status'] for result in results] == [verbs.NO_CONTENT, verbs.NOT_FOUND]
+    assert await BookResource._meta.object_class.count(db) == 1
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # encoding: utf-8
 
+import json
 import pytest
 from tbone.testing.clients import *
 from tbone.testing.fixtures import json_fixture
@@ -58,6 +59,22 @@ async def test_resource_get_detail(event_loop, json_fixture):
     assert set(('id', 'first_name', 'last_name', '_links')) == set(obj.keys())
 
 
+@pytest.mark.asyncio
+async def test_resource_json_payload(event_loop, json_fixture):
+    app = App(db=json_fixture('persons.json'))
+    url = '/api/{}/{}/'.format(PersonResource.__name__, 13)
+    client = ResourceTestClient(app, PersonResource)
+
+    response = await client.get(url=url)
+    # the formatter returns a string, unless data is formatted with format_raw
+    assert isinstance(response.payload, str)
+    obj = client.parse_response_data(response)
+    assert obj['id'] == 13
+    raw = PersonResource._meta.formatter.format_raw(obj)
+    assert isinstance(raw, bytes)
+    assert json.loads(raw.decode('utf-8')) == obj
+
+
 @pytest.mark.asyncio
 async def test_resource_post(event_loop, json_fixture):
     # load datafixture for this test